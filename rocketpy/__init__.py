@@ -2,6 +2,7 @@ from .control import _Controller
 from .environment import Environment, EnvironmentAnalysis
 from .mathutils import (
     Function,
+    FunctionBundle,
     PiecewiseFunction,
     funcify_method,
     reset_funcified_methods,
@@ -37,7 +38,13 @@ from .rocket import (
     Tail,
     TrapezoidalFins,
 )
-from .simulation import Flight, MonteCarlo
+from .simulation import (
+    Flight,
+    FlightBatch,
+    FlightCheckpoint,
+    FlightEvent,
+    MonteCarlo,
+)
 from .stochastic import (
     StochasticEllipticalFins,
     StochasticEnvironment,
@@ -1,4 +1,7 @@
+import numpy as np
+
 from ..prints.controller_prints import _ControllerPrints
+from ..tools import GrowableArray
 
 
 class _Controller:
@@ -15,6 +18,7 @@ class _Controller:
         sampling_rate,
         initial_observed_variables=None,
         name="Controller",
+        history_length=None,
     ):
         """Initialize the class with the controller function and the objects to
         be observed.
@@ -72,21 +76,61 @@ class _Controller:
         name : str
             The name of the controller. This will be used for printing and
             plotting.
+        history_length : int, optional
+            Number of past states and observed variables given to the
+            controller function. If given, `state_history` and
+            `observed_variables` are passed as NumPy arrays holding only the
+            last `history_length` rows, which are views of the flight data,
+            so no copy is made. The observed variables must then be sequences
+            of numbers, always of the same length, and they are stored in a
+            preallocated array instead of a list. The default value is None,
+            which passes the whole state history and observed variables lists.
 
         Returns
         -------
         None
         """
+        if history_length is not None and (
+            int(history_length) != history_length or history_length < 1
+        ):
+            raise ValueError(
+                f"history_length must be a positive integer, got {history_length}."
+            )
         self.interactive_objects = interactive_objects
         self.controller_function = controller_function
         self.sampling_rate = sampling_rate
         self.name = name
+        self.history_length = history_length
         self.prints = _ControllerPrints(self)
 
+        self.observed_variables = []
         if initial_observed_variables is not None:
-            self.observed_variables = [initial_observed_variables]
-        else:
-            self.observed_variables = []
+            self.__record(initial_observed_variables)
+
+    def __record(self, observed_variables):
+        """Append the return of the controller function to the observed
+        variables. With a history length, the first record defines the number
+        of columns of the preallocated array."""
+        if self.history_length is None:
+            self.observed_variables.append(observed_variables)
+            return
+        try:
+            row = np.asarray(observed_variables, dtype=np.float64).ravel()
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"The controller '{self.name}' has a history_length, so its "
+                "observed variables must be sequences of numbers, got "
+                f"{observed_variables!r}."
+            ) from e
+        if not isinstance(self.observed_variables, GrowableArray):
+            self.observed_variables = GrowableArray(columns=len(row))
+        elif len(row) != self.observed_variables.columns:
+            raise ValueError(
+                f"The controller '{self.name}' returned {len(row)} observed "
+                f"variables, but {self.observed_variables.columns} were "
+                "returned before."
+            )
+        self.observed_variables.append(row)
 
     def __call__(self, time, state_vector, state_history):
         """Call the controller function. This is used by the simulation class.
@@ -104,21 +148,27 @@ class _Controller:
             history is a list of every state vector of every step of the
             simulation. The state history is a list of lists, where each
             sublist is a state vector and is ordered from oldest to newest.
+            If the controller has a history length, only its last rows are
+            given to the controller function.
 
         Returns
         -------
         None
         """
+        observed_history = self.observed_variables
+        if self.history_length is not None:
+            state_history = state_history[-self.history_length :]
+            observed_history = observed_history[-self.history_length :]
         observed_variables = self.controller_function(
             time,
             self.sampling_rate,
             state_vector,
             state_history,
-            self.observed_variables,
+            observed_history,
             self.interactive_objects,
         )
         if observed_variables is not None:
-            self.observed_variables.append(observed_variables)
+            self.__record(observed_variables)
 
     def __str__(self):
         return f"Controller '{self.name}' with sampling rate {self.sampling_rate} Hz."
@@ -563,7 +563,15 @@ class Environment:
 
     def __reset_barometric_height_function(self):
         # NOTE: this assumes self.pressure and max_expected_height are already set.
-        self.barometric_height = self.pressure.inverse_function()
+        try:
+            # tabulate the inverse of callable pressure profiles once, with 1 cm
+            # accuracy, instead of finding a root at every evaluation
+            self.barometric_height = self.pressure.inverse_function(
+                tol=1e-2, lower=0, upper=self.max_expected_height
+            )
+        except ValueError:
+            # pressure is not monotonic, keep the root finding inverse
+            self.barometric_height = self.pressure.inverse_function()
         if callable(self.barometric_height.source):
             # discretize to speed up flight simulation
             self.barometric_height.set_discrete(
@@ -809,11 +817,11 @@ class Environment:
         """
         if gravity is None:
             return self.somigliana_gravity.set_discrete(
-                0, self.max_expected_height, 100
+                0, self.max_expected_height, 10, tol=1e-10
             )
         else:
             return Function(gravity, "height (m)", "gravity (m/s²)").set_discrete(
-                0, self.max_expected_height, 100
+                0, self.max_expected_height, 10, tol=1e-10
             )
 
     @property
@@ -2441,10 +2449,8 @@ class Environment:
             return P
 
         # Discretize this Function to speed up the trajectory simulation
-        altitudes = np.linspace(0, 80000, 100)  # TODO: should be -2k instead of 0
-        pressures = [pressure_function(h) for h in altitudes]
-
-        return np.column_stack([altitudes, pressures])
+        # TODO: should be -2k instead of 0
+        return Function(pressure_function).set_discrete(0, 80000, 10, tol=1e-6)
 
     @funcify_method("Pressure (Pa)", "Height Above Sea Level (m)")
     def barometric_height_ISA(self):
@@ -2489,7 +2495,7 @@ class Environment:
         >>> env = Environment()
         >>> env.calculate_density_profile()
         >>> float(env.density(1000))
-        1.1115112430077818
+        1.1116193922348183
         """
         # Retrieve pressure P, gas constant R and temperature T
         P = self.pressure
@@ -666,26 +666,24 @@ class EnvironmentAnalysis:  # pylint: disable=too-many-public-methods
                 value_array = self.__extract_pressure_level_data_value(
                     pressure_level_data, value, indices, lon_array, lat_array
                 )
-                variable_points_array = np.array(
-                    [height_above_ground_level_array, value_array]
-                ).T
-                variable_function = Function(
-                    variable_points_array,
+                variable_function = Function.from_arrays(
+                    height_above_ground_level_array,
+                    value_array,
                     inputs="Height Above Ground Level (m)",
                     outputs=key,
                     extrapolation="constant",
+                    assume_sorted=False,
                 )
                 dictionary[date_string][hour_string][key] = variable_function
 
             # Create function for pressure levels
-            pressure_points_array = np.array(
-                [height_above_ground_level_array, pressure_level_array]
-            ).T
-            pressure_function = Function(
-                pressure_points_array,
+            pressure_function = Function.from_arrays(
+                height_above_ground_level_array,
+                pressure_level_array,
                 inputs="Height Above Ground Level (m)",
                 outputs="Pressure (Pa)",
                 extrapolation="constant",
+                assume_sorted=False,
             )
             dictionary[date_string][hour_string]["pressure"] = pressure_function
 
@@ -708,14 +706,13 @@ class EnvironmentAnalysis:  # pylint: disable=too-many-public-methods
                 np.square(wind_velocity_x_array) + np.square(wind_velocity_y_array)
             )
 
-            wind_speed_points_array = np.array(
-                [height_above_ground_level_array, wind_speed_array]
-            ).T
-            wind_speed_function = Function(
-                wind_speed_points_array,
+            wind_speed_function = Function.from_arrays(
+                height_above_ground_level_array,
+                wind_speed_array,
                 inputs="Height Above Ground Level (m)",
                 outputs="Wind Speed (m/s)",
                 extrapolation="constant",
+                assume_sorted=False,
             )
             dictionary[date_string][hour_string]["wind_speed"] = wind_speed_function
 
@@ -726,27 +723,25 @@ class EnvironmentAnalysis:  # pylint: disable=too-many-public-methods
                 % 360
             )
 
-            wind_heading_points_array = np.array(
-                [height_above_ground_level_array, wind_heading_array]
-            ).T
-            wind_heading_function = Function(
-                wind_heading_points_array,
+            wind_heading_function = Function.from_arrays(
+                height_above_ground_level_array,
+                wind_heading_array,
                 inputs="Height Above Ground Level (m)",
                 outputs="Wind Heading (Deg True)",
                 extrapolation="constant",
+                assume_sorted=False,
             )
             dictionary[date_string][hour_string]["wind_heading"] = wind_heading_function
 
             # Create function for wind direction levels
             wind_direction_array = (wind_heading_array - 180) % 360
-            wind_direction_points_array = np.array(
-                [height_above_ground_level_array, wind_direction_array]
-            ).T
-            wind_direction_function = Function(
-                wind_direction_points_array,
+            wind_direction_function = Function.from_arrays(
+                height_above_ground_level_array,
+                wind_direction_array,
                 inputs="Height Above Ground Level (m)",
                 outputs="Wind Direction (Deg True)",
                 extrapolation="constant",
+                assume_sorted=False,
             )
             dictionary[date_string][hour_string][
                 "wind_direction"
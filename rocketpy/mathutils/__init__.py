@@ -1,5 +1,6 @@
 from .function import (
     Function,
+    FunctionBundle,
     PiecewiseFunction,
     funcify_method,
     reset_funcified_methods,
@@ -1,21 +1,27 @@
 # pylint: disable=too-many-lines
-""" The mathutils/function.py is a rocketpy module totally dedicated to function
+"""The mathutils/function.py is a rocketpy module totally dedicated to function
 operations, including interpolation, extrapolation, integration, differentiation
 and more. This is a core class of our package, and should be maintained
 carefully as it may impact all the rest of the project.
 """
 
+import math
+import operator
+import pickle
 import warnings
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
 from copy import deepcopy
-from functools import cached_property
-from inspect import signature
+from functools import cached_property, lru_cache, partial, wraps
+from inspect import Parameter, Signature, signature
+from multiprocessing import shared_memory
 from pathlib import Path
+from types import MethodType
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import integrate, linalg, optimize
+from scipy import integrate, linalg, optimize, signal
+from scipy.spatial import cKDTree
 
 # Numpy 1.x compatibility,
 # TODO: remove these lines when all dependencies support numpy>=2.0.0
@@ -31,8 +37,70 @@ INTERPOLATION_TYPES = {
     "akima": 2,
     "spline": 3,
     "shepard": 4,
+    "regular_grid": 5,
 }
 EXTRAPOLATION_TYPES = {"zero": 0, "natural": 1, "constant": 2}
+# Attributes computed on first access by Functions created with lazy_coeffs
+LAZY_COEFFICIENTS = (
+    "_coeffs",
+    "_x_list",
+    "__polynomial_coefficients__",
+    "__akima_coefficients__",
+    "__spline_coefficients__",
+)
+# Attributes rebuilt from the source when a Function is unpickled
+DERIVED_ATTRIBUTES = frozenset(
+    (
+        "x_array",
+        "x_initial",
+        "x_final",
+        "y_array",
+        "y_initial",
+        "y_final",
+        "z_array",
+        "z_initial",
+        "z_final",
+        "get_value_opt",
+        "_interpolation_func",
+        "_extrapolation_func",
+        "_pending_coefficients",
+        "_derivative_source",
+        "_shared_memory",
+        "min",
+        "max",
+        "__shepard_tree__",
+        "__grid_axes__",
+        "__grid_axes_lists__",
+        "__grid_strides__",
+        "__grid_offsets__",
+        "__grid_values__",
+        "__grid_values_list__",
+    )
+    + LAZY_COEFFICIENTS
+)
+
+
+def _keep_grid_merging(operator_method):
+    """Decorate an arithmetic operator or a calculus method of Function so
+    that its result keeps the grid merging setting of its operands, see
+    Function.set_grid_merging.
+    """
+
+    @wraps(operator_method)
+    def operate(self, *args, **kwargs):
+        result = operator_method(self, *args, **kwargs)
+        merging = self.__grid_merging__ or getattr(
+            args[0] if args else None, "__grid_merging__", None
+        )
+        if (
+            merging is not None
+            and isinstance(result, Function)
+            and result.__grid_merging__ is None
+        ):
+            result.__grid_merging__ = merging
+        return result
+
+    return operate
 
 
 class Function:  # pylint: disable=too-many-public-methods
@@ -43,6 +111,15 @@ class Function:  # pylint: disable=too-many-public-methods
 
     # Arithmetic priority
     __array_ufunc__ = None
+    # Interval search mode, see Function.set_monotone_queries
+    __monotone_queries__ = False
+    # Number of data points used by shepard, see Function.set_shepard_neighbors
+    __shepard_neighbors__ = None
+    # Union grid settings of arithmetic, see Function.set_grid_merging
+    __grid_merging__ = None
+    # Discretization of callable sources when pickled, see
+    # Function.set_serialization_domain
+    __serialization_domain__ = None
 
     def __init__(
         self,
@@ -91,14 +168,18 @@ class Function:  # pylint: disable=too-many-public-methods
         interpolation : string, optional
             Interpolation method to be used if source type is ndarray.
             For 1-D functions, linear, polynomial, akima and spline are
-            supported. For N-D functions, only shepard is supported.
-            Default for 1-D functions is spline.
+            supported. For N-D functions, shepard and regular_grid are
+            supported. The regular_grid method is a multilinear
+            interpolation, only available if the data points lie on a
+            rectilinear grid. Default for 1-D functions is spline and for
+            N-D functions is shepard.
         extrapolation : string, optional
             Extrapolation method to be used if source type is ndarray.
             Options are 'natural', which keeps interpolation, 'constant',
             which returns the value of the function at the edge of the interval,
             and 'zero', which returns zero for all points outside of source
-            range. Default for 1-D functions is constant.
+            range. Default for 1-D functions is constant. N-D functions only
+            support natural, except with regular_grid interpolation.
         title : string, optional
             Title to be displayed in the plots' figures. If none, the title will
             be constructed using the inputs and outputs arguments in the form
@@ -138,6 +219,99 @@ class Function:  # pylint: disable=too-many-public-methods
         self.set_outputs(self.__outputs__)
         self.set_title(self.title)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        x,
+        y,
+        inputs=None,
+        outputs=None,
+        interpolation="spline",
+        extrapolation="constant",
+        title=None,
+        assume_sorted=True,
+        lazy_coeffs=True,
+    ):  # pylint: disable=too-many-arguments
+        """Create a 1-D Function from arrays of x and y values without the
+        source validation of ``Function.__init__``. Meant for trusted data,
+        such as results of computations, where the construction overhead of
+        many small Functions exceeds the work done with their data.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            One dimensional array of the input values. Must be sorted in
+            ascending order, unless ``assume_sorted`` is False.
+        y : np.ndarray
+            One dimensional array of the output values, with the same length
+            as ``x``.
+        inputs : string, sequence of strings, optional
+            The name of the input of the function. 'Scalar' is default.
+        outputs : string, sequence of strings, optional
+            The name of the output of the function. 'Scalar' is default.
+        interpolation : string, optional
+            Interpolation method: linear, polynomial, akima or spline.
+            Default is spline.
+        extrapolation : string, optional
+            Extrapolation method: natural, constant or zero. Default is
+            constant.
+        title : string, optional
+            Title to be displayed in the plots' figures. If none, the title
+            is constructed from the inputs and outputs.
+        assume_sorted : bool, optional
+            If True, the default, ``x`` is trusted to be sorted and is not
+            checked. Otherwise, the data points are sorted by ``x``.
+        lazy_coeffs : bool, optional
+            If True, the default, the interpolation coefficients are only
+            computed the first time they are needed, usually at the first
+            evaluation of the Function.
+
+        Returns
+        -------
+        Function
+            The 1-D Function with source ``np.column_stack((x, y))``.
+
+        Notes
+        -----
+        The source is the only copy made: ``x_array`` and ``y_array`` are
+        views of it. The result is the same as
+        ``Function(np.column_stack((x, y)), ...)`` for valid data, but
+        invalid data, such as arrays of different lengths or unsorted x with
+        ``assume_sorted=True``, is not detected.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function.from_arrays([0, 1, 2, 3], [0, 1, 4, 9], interpolation="linear")
+        >>> f(2.5)
+        6.5
+        """
+        func = cls.__new__(cls)
+        source = np.column_stack((x, y)).astype(np.float64, copy=False)
+        if not assume_sorted:
+            source = source[source[:, 0].argsort()]
+        func.__dom_dim__ = 1
+        func.__img_dim__ = 1
+        func.__interpolation__ = func.__validate_interpolation(interpolation)
+        func.__extrapolation__ = func.__validate_extrapolation(extrapolation)
+        func.__set_sorted_source_1d(source, lazy_coeffs)
+        func.set_inputs(inputs)
+        func.set_outputs(outputs)
+        func.set_title(title)
+        return func
+
+    def __getattr__(self, name):
+        # Only called for missing attributes: computes the interpolation
+        # coefficients left pending by Function.from_arrays
+        if name in LAZY_COEFFICIENTS and self.__dict__.pop(
+            "_pending_coefficients", False
+        ):
+            self.__update_interpolation_coefficients(self.__interpolation__)
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
     # Define all set methods
     def set_inputs(self, inputs):
         """Set the name and number of the incoming arguments of the Function.
@@ -237,25 +411,41 @@ class Function:  # pylint: disable=too-many-public-methods
             # set x and y. If Function is 2D, also set z
             if self.__dom_dim__ == 1:
                 source = source[source[:, 0].argsort()]
-                self.x_array = source[:, 0]
-                self.x_initial, self.x_final = self.x_array[0], self.x_array[-1]
-                self.y_array = source[:, 1]
-                self.y_initial, self.y_final = self.y_array[0], self.y_array[-1]
-                self.get_value_opt = self.__get_value_opt_1d
-            elif self.__dom_dim__ > 1:
-                self.x_array = source[:, 0]
-                self.x_initial, self.x_final = self.x_array[0], self.x_array[-1]
-                self.y_array = source[:, 1]
-                self.y_initial, self.y_final = self.y_array[0], self.y_array[-1]
-                self.z_array = source[:, 2]
-                self.z_initial, self.z_final = self.z_array[0], self.z_array[-1]
-                self.get_value_opt = self.__get_value_opt_nd
+            self.source = source
+            self.__set_array_views()
 
         self.source = source
         self.set_interpolation(self.__interpolation__)
         self.set_extrapolation(self.__extrapolation__)
         return self
 
+    def __set_array_views(self):
+        """Set the x, y and, if the Function is N-D, z arrays as views of the
+        columns of the array source, and the matching get_value_opt."""
+        source = self.source
+        self.x_array = source[:, 0]
+        self.x_initial, self.x_final = self.x_array[0], self.x_array[-1]
+        self.y_array = source[:, 1]
+        self.y_initial, self.y_final = self.y_array[0], self.y_array[-1]
+        if self.__dom_dim__ == 1:
+            self.get_value_opt = self.__get_value_opt_1d
+        else:
+            self.z_array = source[:, 2]
+            self.z_initial, self.z_final = self.z_array[0], self.z_array[-1]
+            self.get_value_opt = self.__get_value_opt_nd
+
+    def __set_sorted_source_1d(self, source, lazy_coeffs=True):
+        """Set a 1-D array source, sorted by x, without validating it. The
+        interpolation and extrapolation methods must be already set."""
+        self.source = source
+        self.__set_array_views()
+        if lazy_coeffs:
+            self._pending_coefficients = True
+        else:
+            self.__update_interpolation_coefficients(self.__interpolation__)
+        self.__set_interpolation_func()
+        self.__set_extrapolation_func()
+
     @cached_property
     def min(self):
         """Get the minimum value of the Function y_array.
@@ -286,8 +476,8 @@ class Function:  # pylint: disable=too-many-public-methods
         method : string, optional
             Interpolation method to be used if source type is ndarray.
             For 1-D functions, linear, polynomial, akima and spline is
-            supported. For N-D functions, only shepard is supported.
-            Default is 'spline'.
+            supported. For N-D functions, shepard and regular_grid are
+            supported. Default is 'spline'.
 
         Returns
         -------
@@ -301,20 +491,500 @@ class Function:  # pylint: disable=too-many-public-methods
 
     def __update_interpolation_coefficients(self, method):
         """Update interpolation coefficients for the given method."""
+        self.__dict__.pop("_pending_coefficients", None)
+        self.__dict__.pop("_derivative_source", None)
         # Spline, akima and polynomial need data processing
-        # Shepard, and linear do not
-        if method == "polynomial":
+        # Shepard does not. The 1-D interpolations evaluate rows of Python
+        # floats, in decreasing powers, which are faster for single points
+        if method in ("linear", "polynomial", "akima", "spline", None):
+            self._x_list = self.x_array.tolist()
+        if method == "linear":
+            # One row per interval: slope and value at its start
+            with np.errstate(divide="ignore", invalid="ignore"):
+                slopes = np.diff(self.y_array) / np.diff(self.x_array)
+            self._coeffs = np.column_stack((slopes, self.y_array[:-1])).tolist()
+        elif method == "polynomial":
+            # A single row, of powers of x
             self.__interpolate_polynomial__()
-            self._coeffs = self.__polynomial_coefficients__
+            self._coeffs = self.__polynomial_coefficients__[::-1].tolist()
         elif method == "akima":
+            # One row per interval, of powers of x
             self.__interpolate_akima__()
-            self._coeffs = self.__akima_coefficients__
+            coeffs = np.reshape(self.__akima_coefficients__, (-1, 4))
+            self._coeffs = coeffs[:, ::-1].tolist()
         elif method == "spline" or method is None:
+            # One row per interval, of powers of x - x_i
             self.__interpolate_spline__()
-            self._coeffs = self.__spline_coefficients__
+            self._coeffs = self.__spline_coefficients__[::-1].T.tolist()
+        elif method == "regular_grid":
+            self.__build_regular_grid()
+            self._coeffs = []
         else:
+            if method == "shepard" and self.__shepard_neighbors__ is not None:
+                self.__shepard_tree__ = cKDTree(self.source[:, :-1])
             self._coeffs = []
 
+    def set_shepard_neighbors(self, neighbors=None):
+        """Set the number of data points used by the shepard interpolation of
+        N-D Functions. By default, every data point is weighted in every
+        evaluation. If a number of neighbors is given, only the data points
+        nearest to the evaluated point are weighted. They are found with a
+        KD-tree, so evaluating large scattered data sets is much faster. The
+        results differ slightly, because the discarded points have small but
+        nonzero weights.
+
+        Parameters
+        ----------
+        neighbors : int, optional
+            Number of nearest data points used in each evaluation. Default is
+            None, which uses all data points.
+
+        Returns
+        -------
+        self : Function
+        """
+        if neighbors is not None and (int(neighbors) != neighbors or neighbors < 1):
+            raise ValueError(
+                f"neighbors must be a positive integer or None, got {neighbors}."
+            )
+        self.__shepard_neighbors__ = neighbors
+        if not callable(self.source) and self.__dom_dim__ > 1:
+            self.__update_interpolation_coefficients(self.__interpolation__)
+        return self
+
+    def set_monotone_queries(self, monotone=True):
+        """Set whether the Function is optimized for sequences of evaluations
+        at close points, such as the times or altitudes of consecutive steps
+        of a simulation. When it is, the Function remembers the interval of
+        its data in which the last evaluated point was. Each evaluation first
+        checks that interval and its neighbors, and only searches the whole
+        data if the point is elsewhere. If the data points are uniformly
+        spaced, the interval is computed directly from the point instead.
+        Results are the same in both modes. Only 1-D Functions with an array
+        source are affected.
+
+        Parameters
+        ----------
+        monotone : bool, optional
+            Whether to remember the last interval. Default is True.
+
+        Returns
+        -------
+        self : Function
+        """
+        self.__monotone_queries__ = bool(monotone)
+        if not callable(self.source) and self.__dom_dim__ == 1:
+            self.__set_interpolation_func()
+        return self
+
+    def monotone_evaluator(self):
+        """Create a callable that evaluates the Function at a single point,
+        as ``Function.get_value_opt``, optimized for sequences of evaluations
+        at close points, such as the times or altitudes of consecutive steps
+        of a simulation. The callable remembers the interval of the data in
+        which the last evaluated point was, as described in
+        ``Function.set_monotone_queries``, but the Function itself is not
+        modified: each evaluator keeps its own interval, so that different
+        callers do not share it. Only 1-D Functions with an array source and
+        linear, akima or spline interpolation are optimized; the
+        ``get_value_opt`` method of other Functions is returned.
+
+        The evaluator uses the data points and settings of the Function at
+        the time it is created.
+
+        Returns
+        -------
+        callable
+            Function of a single point that returns the value of the
+            Function at that point.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 1), (2, 4)], interpolation="linear")
+        >>> evaluate = f.monotone_evaluator()
+        >>> float(evaluate(0.5)), float(evaluate(1.5))
+        (0.5, 2.5)
+        """
+        if (
+            callable(self.source)
+            or self.__dom_dim__ != 1
+            or INTERPOLATION_TYPES[self.__interpolation__] not in (0, 2, 3)
+        ):
+            return self.get_value_opt
+        interpolation_func = self.__interpolation_function(self.__interval_locator())
+        extrapolation_func = self._extrapolation_func
+        x_data, y_data = self._x_list, self.y_array
+        x_min, x_max = self.x_initial, self.x_final
+        coeffs = self._coeffs
+
+        def evaluate(x):
+            if x_min <= x <= x_max:
+                return interpolation_func(x, x_min, x_max, x_data, y_data, coeffs)
+            return extrapolation_func(x, x_min, x_max, x_data, y_data, coeffs)
+
+        return evaluate
+
+    def set_grid_merging(self, merge=True, max_points=None, tolerance=0):
+        """Set whether arithmetic operations with this Function keep the
+        result defined by a list of points when the operands are not defined
+        on the same points. When they do, a 1-D list based Function operated
+        with a 1-D Function defined on other points, or by a callable, gives
+        a list based Function defined on the union of the points of both
+        operands. Both operands are evaluated at all these points at once,
+        and the result has the interpolation and extrapolation methods of the
+        list based operand (of self, if both are list based). Otherwise, the
+        result is a Function defined by a callable that evaluates both
+        operands, which is exact between the points but slower to evaluate.
+
+        The setting is passed on to the results of arithmetic operations and
+        of Function.derivative_function and Function.integral_function, so
+        that chains of operations stay list based. It applies if it is set on
+        either operand.
+
+        Parameters
+        ----------
+        merge : bool, optional
+            Whether to operate on the union of the points. Default is True.
+        max_points : int, optional
+            Maximum number of points of the union. Larger unions are
+            subsampled uniformly in index, always keeping the first and last
+            points. Default is None, for no limit.
+        tolerance : float, optional
+            Points of the union closer than this to the previous kept point
+            are merged into it. The first and last points are always kept.
+            Default is 0, which only merges repeated points.
+
+        Returns
+        -------
+        self : Function
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (2, 2), (4, 4)], interpolation="linear")
+        >>> g = Function([(1, 1), (3, 3)], interpolation="linear")
+        >>> h = f.set_grid_merging() * g
+        >>> h.source
+        array([[ 0.,  0.],
+               [ 1.,  1.],
+               [ 2.,  4.],
+               [ 3.,  9.],
+               [ 4., 12.]])
+        """
+        if max_points is not None and (
+            not isinstance(max_points, (int, np.integer)) or max_points < 2
+        ):
+            raise ValueError("max_points must be an integer greater than 1.")
+        if tolerance < 0:
+            raise ValueError("tolerance must not be negative.")
+        self.__grid_merging__ = (max_points, tolerance) if merge else None
+        return self
+
+    def cache(self, maxsize=128, quantize=None):
+        """Return a Function that memoizes the evaluations of this Function,
+        keeping the results of the last maxsize distinct evaluations. Meant
+        for Functions given by costly callables that are evaluated many times
+        at the same points, such as aerodynamic coefficients evaluated by
+        several forces at the same Mach number.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of memoized evaluations. The least recently used
+            are discarded first. If None, the cache grows without bound.
+            Default is 128.
+        quantize : float, sequence of float, optional
+            If given, the inputs are rounded to multiples of this step, and
+            the Function is evaluated at the rounded inputs, so that close
+            inputs share a cache entry. A sequence gives the step of each
+            input, where None keeps the input exact. Default is None, for
+            exact inputs and results.
+
+        Returns
+        -------
+        Function
+            The memoizing Function. Its source is a callable with the
+            ``cache_info()`` and ``cache_clear()`` methods of
+            ``functools.lru_cache``, which count the cache hits and misses.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function(lambda mach: 2 * mach).cache(maxsize=8, quantize=1e-3)
+        >>> f(0.30001), f(0.3)
+        (0.6, 0.6)
+        >>> f.source.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=8, currsize=1)
+        """
+        if maxsize is not None and (int(maxsize) != maxsize or maxsize < 0):
+            raise ValueError(
+                f"maxsize must be a non negative integer or None, got {maxsize}."
+            )
+        steps = quantize
+        if quantize is not None:
+            if isinstance(quantize, NUMERICAL_TYPES):
+                steps = (quantize,) * self.__dom_dim__
+            steps = tuple(steps)
+            if len(steps) != self.__dom_dim__ or any(
+                step is not None and not step > 0 for step in steps
+            ):
+                raise ValueError(
+                    "quantize must be a positive number or a sequence with a "
+                    "positive number or None for each input."
+                )
+        return Function(
+            _MemoizedSource(self, maxsize, steps),
+            inputs=self.__inputs__[:],
+            outputs=self.__outputs__[:],
+            title=self.title,
+        )
+
+    def set_serialization_domain(
+        self,
+        lower,
+        upper,
+        samples=200,
+        interpolation="spline",
+        extrapolation="constant",
+        tol=None,
+    ):  # pylint: disable=too-many-arguments
+        """Declare the domain on which a Function given by a callable is
+        discretized when it is pickled, so that Functions given by lambdas
+        or local functions, which can not be pickled, can be sent to other
+        processes. The Function itself is not changed: only the unpickled
+        copies are given by the discretized source.
+
+        Parameters
+        ----------
+        lower, upper, samples, interpolation, extrapolation, tol
+            Arguments of ``Function.set_discrete`` used to discretize the
+            source when the Function is pickled.
+
+        Returns
+        -------
+        self : Function
+
+        See Also
+        --------
+        Function.set_discrete
+
+        Examples
+        --------
+        >>> import pickle
+        >>> from rocketpy import Function
+        >>> f = Function(lambda x: x**2).set_serialization_domain(0, 4, 5)
+        >>> g = pickle.loads(pickle.dumps(f))
+        >>> g.x_array
+        array([0., 1., 2., 3., 4.])
+        >>> g(2.0)
+        4.0
+        """
+        if self.__dom_dim__ > 2:
+            raise ValueError(
+                "Only 1-D and 2-D Functions can be discretized when pickled."
+            )
+        self.__serialization_domain__ = {
+            "lower": lower,
+            "upper": upper,
+            "samples": samples,
+            "interpolation": interpolation,
+            "extrapolation": extrapolation,
+            "tol": tol,
+        }
+        return self
+
+    def share_memory(self):
+        """Move the array source of the Function to a block of shared memory,
+        see ``multiprocessing.shared_memory``. The Function is then pickled
+        with the name of the block instead of its data points, and unpickled
+        Functions, in this or in other processes, read the data points from
+        the block without copying them. Meant for large datasets sent to
+        many worker processes.
+
+        Returns
+        -------
+        multiprocessing.shared_memory.SharedMemory
+            The block of shared memory holding the source. The caller owns
+            it: it must outlive the unpickled Functions and be released with
+            its ``close()`` and ``unlink()`` methods when no longer needed.
+
+        Examples
+        --------
+        >>> import pickle
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 1), (2, 4)], interpolation="linear")
+        >>> block = f.share_memory()
+        >>> g = pickle.loads(pickle.dumps(f))
+        >>> g(1.5)
+        2.5
+        >>> del f, g
+        >>> block.close()
+        >>> block.unlink()
+        """
+        if callable(self.source):
+            raise ValueError("Only Functions given by arrays can share memory.")
+        block = shared_memory.SharedMemory(create=True, size=self.source.nbytes)
+        source = np.ndarray(self.source.shape, self.source.dtype, buffer=block.buf)
+        source[:] = self.source
+        self.source = source
+        self.__set_array_views()
+        self._shared_memory = block
+        return block
+
+    def __getstate__(self):
+        # Keep the source and the settings, the remaining attributes are
+        # derived from them and rebuilt by __setstate__
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in DERIVED_ATTRIBUTES
+        }
+        source = self.source
+        if callable(source):
+            domain = self.__serialization_domain__
+            if domain is not None:
+                table = self.set_discrete(**domain, mutate_self=False)
+                state["source"] = table.source
+                state["__interpolation__"] = table.__interpolation__
+                state["__extrapolation__"] = table.__extrapolation__
+            elif "<" in getattr(source, "__qualname__", ""):
+                raise pickle.PicklingError(
+                    f"The source of {self!r} is a lambda or a local function, "
+                    "which can not be pickled. Declare the domain on which it "
+                    "is discretized when pickled with "
+                    "Function.set_serialization_domain."
+                )
+        elif "_shared_memory" in self.__dict__:
+            state["source"] = _SharedArray(
+                self._shared_memory.name, source.shape, source.dtype.str
+            )
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        source = self.source
+        if isinstance(source, _SharedArray):
+            self._shared_memory, self.source = source.attach()
+        if callable(self.source):
+            self.get_value_opt = self.source
+        elif self.__dom_dim__ == 1:
+            self.__set_sorted_source_1d(self.source)
+        else:
+            self.__set_array_views()
+            self.set_interpolation(self.__interpolation__)
+            self.set_extrapolation(self.__extrapolation__)
+
+    def __copy__(self):
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        if copied.__monotone_queries__:
+            # Copies do not share the interval remembered by the original
+            if getattr(self.get_value_opt, "__self__", None) is self:
+                copied.get_value_opt = MethodType(self.get_value_opt.__func__, copied)
+            copied.set_monotone_queries()
+        return copied
+
+    def __deepcopy__(self, memo):
+        # Deep copies own their data points, so they leave the shared memory
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for key, value in self.__dict__.items():
+            if key != "_shared_memory":
+                copied.__dict__[key] = deepcopy(value, memo)
+        if copied.__monotone_queries__:
+            copied.set_monotone_queries()
+        return copied
+
+    @staticmethod
+    def __merge_grids(grids, max_points=None, tolerance=0):
+        """Union of the given sorted grids, with the points closer than the
+        tolerance merged and at most max_points points."""
+        xs = np.unique(np.concatenate(grids))
+        if tolerance > 0 and len(xs) > 2:
+            kept = [xs[0]]
+            for x in xs[1:-1]:
+                if x - kept[-1] > tolerance:
+                    kept.append(x)
+            if len(kept) > 1 and xs[-1] - kept[-1] <= tolerance:
+                kept.pop()
+            kept.append(xs[-1])
+            xs = np.array(kept)
+        if max_points is not None and len(xs) > max_points:
+            xs = xs[np.round(np.linspace(0, len(xs) - 1, max_points)).astype(int)]
+        return xs
+
+    def __merged_grid_operands(self, other):
+        """Evaluate self and other on the union of their points, if the grid
+        merging of Function.set_grid_merging applies to them.
+
+        Returns
+        -------
+        tuple or None
+            The grid, the values of self and the values of other on it and
+            the list based operand from which the result takes its
+            interpolation, or None if the grid merging does not apply.
+        """
+        merging = self.__grid_merging__ or getattr(other, "__grid_merging__", None)
+        if (
+            merging is None
+            or not isinstance(other, Function)
+            or self.__dom_dim__ != 1
+            or other.__dom_dim__ != 1
+        ):
+            return None
+        tables = [f for f in (self, other) if isinstance(f.source, np.ndarray)]
+        if not tables:
+            return None
+        xs = self.__merge_grids([table.x_array for table in tables], *merging)
+        ys = np.asarray(self.get_value(xs), dtype=np.float64)
+        other_ys = np.asarray(other.get_value(xs), dtype=np.float64)
+        return xs, ys, other_ys, tables[0]
+
+    def __merged_grid_function(self, operands, ys, outputs):
+        """Create the list based result of an operation on a merged grid."""
+        xs, _, _, table = operands
+        return Function.from_arrays(
+            xs,
+            ys,
+            self.__inputs__[:],
+            outputs,
+            table.__interpolation__,
+            table.__extrapolation__,
+        )
+
+    def __interval_locator(self):
+        """Create a function that returns the same interval index as
+        ``bisect_left(x_data, x)`` for points inside the domain, starting the
+        search from the interval of the previous call. Used when the Function
+        is set with ``Function.set_monotone_queries``."""
+        x_list = self.x_array.tolist()
+        n = len(x_list)
+        steps = np.diff(self.x_array)
+        uniform = n > 2 and np.allclose(steps, steps[0], rtol=1e-9, atol=0)
+        x_0, step = x_list[0], float(steps[0]) if n > 1 else 0
+        last = 1
+
+        def locate(x_data, x):
+            nonlocal last
+            if n < 2 or isinstance(x, complex):
+                return bisect_left(x_data, x)
+            i = last
+            if x_list[i - 1] < x <= x_list[i]:
+                return i
+            if uniform:
+                i = min(max(math.ceil((x - x_0) / step), 1), n - 1)
+            elif i + 1 < n and x_list[i] < x <= x_list[i + 1]:
+                i += 1
+            elif i > 1:
+                i -= 1
+            if not x_list[i - 1] < x <= x_list[i]:
+                i = bisect_left(x_list, x)
+            last = min(max(i, 1), n - 1)
+            return i
+
+        return locate
+
     def set_extrapolation(self, method="constant"):
         """Set extrapolation behavior of data set.
 
@@ -337,72 +1007,89 @@ class Function:  # pylint: disable=too-many-public-methods
             self.__set_extrapolation_func()
         return self
 
-    def __set_interpolation_func(self):  # pylint: disable=too-many-statements
+    def __set_interpolation_func(self):
         """Defines interpolation function used by the Function. Each
         interpolation method has its own function with exception of shepard,
         which has its interpolation/extrapolation function defined in
         ``Function.__interpolate_shepard__``. The function is stored in
         the attribute _interpolation_func."""
+        locate = bisect_left
+        if self.__monotone_queries__ and self.__dom_dim__ == 1:
+            locate = self.__interval_locator()
+        self._interpolation_func = self.__interpolation_function(locate)
+
+    def __interpolation_function(self, locate):  # pylint: disable=too-many-statements
+        """Create the interpolation function of the Function, which finds
+        the interval of each point with ``locate(x_data, x)``."""
         interpolation = INTERPOLATION_TYPES[self.__interpolation__]
+
         if interpolation == 0:  # linear
 
             def linear_interpolation(
                 x, x_min, x_max, x_data, y_data, coeffs
             ):  # pylint: disable=unused-argument
-                x_interval = bisect_left(x_data, x)
-                x_left = x_data[x_interval - 1]
-                y_left = y_data[x_interval - 1]
-                dx = float(x_data[x_interval] - x_left)
-                dy = float(y_data[x_interval] - y_left)
-                return (x - x_left) * (dy / dx) + y_left
+                try:
+                    i = max(locate(x_data, x), 1) - 1
+                except TypeError:  # complex step differentiation
+                    i = max(locate(x_data, x.real), 1) - 1
+                slope, y_left = coeffs[i]
+                return (x - x_data[i]) * slope + y_left
 
-            self._interpolation_func = linear_interpolation
+            return linear_interpolation
 
-        elif interpolation == 1:  # polynomial
+        if interpolation == 1:  # polynomial
 
             def polynomial_interpolation(
                 x, x_min, x_max, x_data, y_data, coeffs
             ):  # pylint: disable=unused-argument
-                return np.sum(coeffs * x ** np.arange(len(coeffs)))
+                y = 0.0
+                for coefficient in coeffs:
+                    y = y * x + coefficient
+                return y
 
-            self._interpolation_func = polynomial_interpolation
+            return polynomial_interpolation
 
-        elif interpolation == 2:  # akima
+        if interpolation == 2:  # akima
 
             def akima_interpolation(
                 x, x_min, x_max, x_data, y_data, coeffs
             ):  # pylint: disable=unused-argument
-                x_interval = bisect_left(x_data, x)
-                x_interval = x_interval if x_interval != 0 else 1
-                a = coeffs[4 * x_interval - 4 : 4 * x_interval]
-                return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                try:
+                    i = max(locate(x_data, x), 1) - 1
+                except TypeError:  # complex step differentiation
+                    i = max(locate(x_data, x.real), 1) - 1
+                a_3, a_2, a_1, a_0 = coeffs[i]
+                return ((a_3 * x + a_2) * x + a_1) * x + a_0
 
-            self._interpolation_func = akima_interpolation
+            return akima_interpolation
 
-        elif interpolation == 3:  # spline
+        if interpolation == 3:  # spline
 
             def spline_interpolation(
                 x, x_min, x_max, x_data, y_data, coeffs
             ):  # pylint: disable=unused-argument
-                x_interval = bisect_left(x_data, x)
-                x_interval = max(x_interval, 1)
-                a = coeffs[:, x_interval - 1]
-                x = x - x_data[x_interval - 1]
-                return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                try:
+                    i = max(locate(x_data, x), 1) - 1
+                except TypeError:  # complex step differentiation
+                    i = max(locate(x_data, x.real), 1) - 1
+                a_3, a_2, a_1, a_0 = coeffs[i]
+                t = x - x_data[i]
+                return ((a_3 * t + a_2) * t + a_1) * t + a_0
 
-            self._interpolation_func = spline_interpolation
+            return spline_interpolation
 
-        elif interpolation == 4:  # shepard does not use interpolation function
-            self._interpolation_func = None
+        # shepard and regular_grid do not use it
+        return None
 
     def __set_extrapolation_func(self):  # pylint: disable=too-many-statements
         """Defines extrapolation function used by the Function. Each
         extrapolation method has its own function. The function is stored in
         the attribute _extrapolation_func."""
+        self.__dict__.pop("_derivative_source", None)
         interpolation = INTERPOLATION_TYPES[self.__interpolation__]
         extrapolation = EXTRAPOLATION_TYPES[self.__extrapolation__]
 
-        if interpolation == 4:  # shepard does not use extrapolation function
+        if interpolation in (4, 5):  # shepard and regular_grid do not use it
             self._extrapolation_func = None
 
         elif extrapolation == 0:  # zero
@@ -419,27 +1106,31 @@ class Function:  # pylint: disable=too-many-public-methods
                 def natural_extrapolation(
                     x, x_min, x_max, x_data, y_data, coeffs
                 ):  # pylint: disable=unused-argument
-                    x_interval = 1 if x < x_min else -1
-                    x_left = x_data[x_interval - 1]
-                    y_left = y_data[x_interval - 1]
-                    dx = float(x_data[x_interval] - x_left)
-                    dy = float(y_data[x_interval] - y_left)
-                    return (x - x_left) * (dy / dx) + y_left
+                    if x < x_min:
+                        slope, y_left = coeffs[0]
+                        x_left = x_data[0]
+                    else:
+                        slope, y_left = coeffs[-1]
+                        x_left = x_data[-2]
+                    return (x - x_left) * slope + y_left
 
             elif interpolation == 1:  # polynomial
 
                 def natural_extrapolation(
                     x, x_min, x_max, x_data, y_data, coeffs
                 ):  # pylint: disable=unused-argument
-                    return np.sum(coeffs * x ** np.arange(len(coeffs)))
+                    y = 0.0
+                    for coefficient in coeffs:
+                        y = y * x + coefficient
+                    return y
 
             elif interpolation == 2:  # akima
 
                 def natural_extrapolation(
                     x, x_min, x_max, x_data, y_data, coeffs
                 ):  # pylint: disable=unused-argument
-                    a = coeffs[:4] if x < x_min else coeffs[-4:]
-                    return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                    a_3, a_2, a_1, a_0 = coeffs[0] if x < x_min else coeffs[-1]
+                    return ((a_3 * x + a_2) * x + a_1) * x + a_0
 
             elif interpolation == 3:  # spline
 
@@ -447,12 +1138,12 @@ class Function:  # pylint: disable=too-many-public-methods
                     x, x_min, x_max, x_data, y_data, coeffs
                 ):  # pylint: disable=unused-argument
                     if x < x_min:
-                        a = coeffs[:, 0]
-                        x = x - x_data[0]
+                        a_3, a_2, a_1, a_0 = coeffs[0]
+                        t = x - x_data[0]
                     else:
-                        a = coeffs[:, -1]
-                        x = x - x_data[-2]
-                    return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                        a_3, a_2, a_1, a_0 = coeffs[-1]
+                        t = x - x_data[-2]
+                    return ((a_3 * t + a_2) * t + a_1) * t + a_0
 
             self._extrapolation_func = natural_extrapolation
         elif extrapolation == 2:  # constant
@@ -494,7 +1185,7 @@ class Function:  # pylint: disable=too-many-public-methods
             Value of the Function at the specified point.
         """
         # Retrieve general info
-        x_data = self.x_array
+        x_data = self._x_list
         y_data = self.y_array
         x_min, x_max = self.x_initial, self.x_final
         coeffs = self._coeffs
@@ -504,10 +1195,71 @@ class Function:  # pylint: disable=too-many-public-methods
             y = self._extrapolation_func(x, x_min, x_max, x_data, y_data, coeffs)
         return y
 
+    def __get_value_1d_array(self, x):
+        """Evaluate the Function at every point of an array at once. This
+        method is used when the Function is 1-D and its source is an array.
+        The results are the same as evaluating each point with
+        ``Function.get_value_opt``, but the interval of every point is found
+        with a single ``np.searchsorted`` and the piecewise polynomials are
+        evaluated with array operations.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            One dimensional float array of the points to be evaluated.
+
+        Returns
+        -------
+        y : np.ndarray
+            Values of the Function at the given points.
+        """
+        x_data = self.x_array
+        y_data = self.y_array
+        x_min, x_max = self.x_initial, self.x_final
+        interpolation = INTERPOLATION_TYPES[self.__interpolation__]
+        extrapolation = EXTRAPOLATION_TYPES[self.__extrapolation__]
+
+        inside = (x_min <= x) & (x <= x_max)
+        below = x < x_min
+        # The interval search is the same as bisect_left, for every point
+        interval = np.searchsorted(x_data, x, side="left")
+        interval = np.clip(interval, 1, len(x_data) - 1)
+        if extrapolation == 1:  # natural extrapolation uses the edge intervals
+            interval[below] = 1
+            interval[~inside & ~below] = len(x_data) - 1
+        interval -= 1
+
+        # Same Horner forms as the interpolations of single points
+        if interpolation == 0:  # linear
+            x_left = x_data[interval]
+            y_left = y_data[interval]
+            dx = x_data[interval + 1] - x_left
+            dy = y_data[interval + 1] - y_left
+            y = (x - x_left) * (dy / dx) + y_left
+        elif interpolation == 1:  # polynomial
+            y = np.zeros_like(x)
+            for coefficient in self.__polynomial_coefficients__[::-1]:
+                y = y * x + coefficient
+        elif interpolation == 2:  # akima
+            a = np.reshape(self.__akima_coefficients__, (-1, 4))[interval].T
+            y = ((a[3] * x + a[2]) * x + a[1]) * x + a[0]
+        else:  # spline
+            a = self.__spline_coefficients__[:, interval]
+            t = x - x_data[interval]
+            y = ((a[3] * t + a[2]) * t + a[1]) * t + a[0]
+
+        if extrapolation == 0:  # zero
+            y[~inside] = 0
+        elif extrapolation == 2:  # constant
+            y[below] = y_data[0]
+            y[~inside & ~below] = y_data[-1]
+        return y
+
     def __get_value_opt_nd(self, *args):
         """Evaluate the Function at a single point (x, y, z). This method is
         used when the Function is N-D."""
-        # always use shepard for N-D functions
+        if self.__interpolation__ == "regular_grid":
+            return self.__interpolate_regular_grid__(args)
         return self.__interpolate_shepard__(args)
 
     def set_discrete(
@@ -519,6 +1271,8 @@ class Function:  # pylint: disable=too-many-public-methods
         extrapolation="constant",
         one_by_one=True,
         mutate_self=True,
+        tol=None,
+        max_samples=10000,
     ):
         """This method discretizes a 1-D or 2-D Function by evaluating it at
         certain points (sampling range) and storing the results in a list,
@@ -529,6 +1283,13 @@ class Function:  # pylint: disable=too-many-public-methods
         This method is specially useful to change a dataset sampling or to
         convert a Function defined by a callable into a list based Function.
 
+        By default, the samples are evenly spaced. If a tolerance is given,
+        1-D Functions are sampled adaptively instead: starting from evenly
+        spaced samples, every interval whose midpoint misses the chosen
+        interpolation by more than the tolerance is split in halves, until
+        all intervals meet it. Smooth regions then get few samples, while
+        sharp features get many.
+
         Parameters
         ----------
         lower : scalar, optional
@@ -536,7 +1297,9 @@ class Function:  # pylint: disable=too-many-public-methods
         upper : scalar, optional
             Value where sampling range will end. Default is 10.
         samples : int, optional
-            Number of samples to be taken from inside range. Default is 200.
+            Number of samples to be taken from inside range. If ``tol`` is
+            given, this is the number of initial samples, which are refined
+            adaptively. Default is 200.
         interpolation : string
             Interpolation method to be used if source type is ndarray.
             For 1-D functions, linear, polynomial, akima and spline is
@@ -556,6 +1319,15 @@ class Function:  # pylint: disable=too-many-public-methods
             the new one. If False, the original Function object source will
             remain unchanged, and the new one is simply returned.
             Default is True.
+        tol : float, optional
+            Tolerance of the interpolation error at the midpoints between
+            samples, relative to the largest absolute sampled value. If given,
+            the samples are placed adaptively. Only supported for 1-D
+            Functions. Default is None, which samples evenly.
+        max_samples : int, optional
+            Maximum number of samples of the adaptive sampling. Once it is
+            reached, the refinement stops even if the tolerance is not met.
+            Only used if ``tol`` is given. Default is 10000.
 
         Returns
         -------
@@ -567,12 +1339,30 @@ class Function:  # pylint: disable=too-many-public-methods
         Function object source. This can be changed by the attribute `mutate_self`.
 
         2. Currently, this method only supports 1-D and 2-D Functions.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function(lambda x: np.tanh(50 * x))
+        >>> f = f.set_discrete(-1, 1, 11, tol=1e-4)
+        >>> len(f.x_array) < 100
+        True
+        >>> bool(abs(f(0.013) - np.tanh(0.65)) < 1e-4)
+        True
         """
         func = deepcopy(self) if not mutate_self else self
 
+        if tol is not None and func.__dom_dim__ != 1:
+            raise ValueError("Adaptive sampling is only supported for 1-D Functions.")
+
         if func.__dom_dim__ == 1:
-            xs = np.linspace(lower, upper, samples)
-            ys = func.get_value(xs.tolist()) if one_by_one else func.get_value(xs)
+            if tol is None:
+                xs = np.linspace(lower, upper, samples)
+                ys = func.get_value(xs.tolist()) if one_by_one else func.get_value(xs)
+            else:
+                xs, ys = func.__sample_adaptively(
+                    lower, upper, samples, interpolation, tol, max_samples, one_by_one
+                )
             func.set_source(np.concatenate(([xs], [ys])).transpose())
             func.set_interpolation(interpolation)
             func.set_extrapolation(extrapolation)
@@ -595,6 +1385,46 @@ class Function:  # pylint: disable=too-many-public-methods
             )
         return func
 
+    def __sample_adaptively(  # pylint: disable=too-many-arguments
+        self, lower, upper, samples, interpolation, tol, max_samples, one_by_one
+    ):
+        """Sample a 1-D Function by recursive bisection of the intervals whose
+        midpoint misses the interpolation of the samples by more than tol.
+        Each pass splits the intervals with the largest errors first, within
+        the remaining budget of samples.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The sampled inputs and outputs, in ascending order of inputs.
+        """
+
+        def evaluate(x):
+            y = self.get_value(x.tolist()) if one_by_one else self.get_value(x)
+            return np.asarray(y, dtype=np.float64)
+
+        x = np.linspace(lower, upper, samples)
+        y = evaluate(x)
+        while x.size < max_samples:
+            x_mid = (x[:-1] + x[1:]) / 2
+            y_mid = evaluate(x_mid)
+            interpolant = Function.from_arrays(
+                x, y, interpolation=interpolation, extrapolation="natural"
+            )
+            error = np.abs(interpolant.get_value(x_mid) - y_mid)
+            scale = max(np.max(np.abs(y)), np.max(np.abs(y_mid))) or 1
+            # Intervals that can no longer be split are left as they are
+            splittable = (x[:-1] < x_mid) & (x_mid < x[1:])
+            refine = np.flatnonzero((error > tol * scale) & splittable)
+            if refine.size == 0:
+                break
+            budget = max_samples - x.size
+            if refine.size > budget:
+                refine = np.sort(refine[np.argsort(error[refine])[::-1][:budget]])
+            x = np.insert(x, refine + 1, x_mid[refine])
+            y = np.insert(y, refine + 1, y_mid[refine])
+        return x, y
+
     def set_discrete_based_on_model(
         self, model_function, one_by_one=True, keep_self=True, mutate_self=True
     ):
@@ -654,7 +1484,7 @@ class Function:  # pylint: disable=too-many-public-methods
         >>> g = Function([(0, 0), (2, 2), (4, 4)])
         >>> h = f * g
         >>> type(h.source)
-        <class 'function'>
+        <class 'rocketpy.mathutils.function._FunctionExpression'>
 
         Therefore, it is good practice to make sure both Function instances are
         defined by the same domain, i.e. by the same list of mesh points. This
@@ -718,6 +1548,81 @@ class Function:  # pylint: disable=too-many-public-methods
 
         return func
 
+    def set_discrete_based_on_operands(
+        self, max_points=None, tolerance=0, mutate_self=True
+    ):
+        """Discretizes a 1-D Function obtained by arithmetic operations
+        between list based Functions onto the union of the data points of
+        its operands. The interpolation and extrapolation methods are taken
+        from the first operand.
+
+        Parameters
+        ----------
+        max_points : int, optional
+            Maximum number of points of the union. See
+            Function.set_grid_merging. Default is None, for no limit.
+        tolerance : float, optional
+            Points of the union closer than this to the previous kept point
+            are merged into it. See Function.set_grid_merging. Default is 0.
+        mutate_self : boolean, optional
+            If True, the original Function object source will be replaced by
+            the new one. If False, the original Function object source will
+            remain unchanged, and the new one is simply returned.
+            Default is True.
+
+        Returns
+        -------
+        self : Function
+
+        Raises
+        ------
+        ValueError
+            If the Function is not the result of arithmetic operations or if
+            any of its operands is not a 1-D list based Function or a scalar.
+
+        See also
+        --------
+        Function.set_discrete_based_on_model, Function.set_grid_merging
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 1), (2, 4)], interpolation="linear")
+        >>> g = Function([(0, 1), (1.5, 2)], interpolation="linear")
+        >>> h = (2 * f + g).set_discrete_based_on_operands()
+        >>> h.source
+        array([[ 0.        ,  1.        ],
+               [ 1.        ,  3.66666667],
+               [ 1.5       ,  7.        ],
+               [ 2.        , 10.        ]])
+        """
+        if not isinstance(self.source, _FunctionExpression):
+            raise ValueError(
+                "Only Functions obtained by arithmetic operations can be "
+                "discretized based on their operands."
+            )
+        leaves = list(self.source.leaves())
+        if not all(
+            isinstance(leaf, Function)
+            and isinstance(leaf.source, np.ndarray)
+            and leaf.__dom_dim__ == 1
+            for leaf in leaves
+        ):
+            raise ValueError(
+                "All the operands must be 1-D list based Functions or scalars."
+            )
+
+        xs = self.__merge_grids(
+            [leaf.x_array for leaf in leaves], max_points, tolerance
+        )
+        ys = self.source.evaluate_array(xs)
+
+        func = deepcopy(self) if not mutate_self else self
+        func.set_source(np.column_stack((xs, ys)))
+        func.set_interpolation(leaves[0].__interpolation__)
+        func.set_extrapolation(leaves[0].__extrapolation__)
+        return func
+
     def reset(
         self,
         inputs=None,
@@ -857,9 +1762,9 @@ class Function:  # pylint: disable=too-many-public-methods
         ...    [(0, 0), (1, 1), (1.5, 2.25), (2, 4), (2.5, 6.25), (3, 9), (4, 16)]
         ... )
         >>> f3.get_value(2)
-        np.float64(4.0)
+        4.0
         >>> f3.get_value(2.5)
-        np.float64(6.25)
+        6.25
         >>> f3.get_value([1, 2, 3])
         [np.float64(1.0), np.float64(4.0), np.float64(9.0)]
         >>> f3.get_value([1, 2.5, 4.0])
@@ -883,6 +1788,24 @@ class Function:  # pylint: disable=too-many-public-methods
                 f"This Function takes {self.__dom_dim__} arguments, {len(args)} given."
             )
 
+        # Expressions and exact derivatives are evaluated at all the points
+        # in one pass
+        vectorized_sources = (_FunctionExpression, _PiecewisePolynomial)
+        if isinstance(self.source, vectorized_sources) and all(
+            isinstance(arg, Iterable) for arg in args
+        ):
+            points = [np.asarray(arg) for arg in args]
+            if all(
+                point.dtype.kind in "iuf"
+                and 0 < point.size
+                and point.shape == points[0].shape
+                for point in points
+            ):
+                y = self.source.evaluate_array(
+                    *(point.astype(np.float64).ravel() for point in points)
+                ).reshape(points[0].shape)
+                return y if isinstance(args[0], np.ndarray) else list(y)
+
         # Return value for Function of function type
         if callable(self.source):
             # if the function is 1-D:
@@ -910,6 +1833,15 @@ class Function:  # pylint: disable=too-many-public-methods
         else:  # interpolation is "polynomial", "spline", "akima" or "linear"
             if isinstance(args[0], NUMERICAL_TYPES):
                 args = [list(args)]
+            else:
+                x = np.asarray(args[0])
+                if x.dtype.kind in "iuf" and x.size > 0:
+                    y = self.__get_value_1d_array(x.astype(np.float64).ravel()).reshape(
+                        x.shape
+                    )
+                    if isinstance(args[0], np.ndarray):
+                        return y
+                    return list(y) if len(y) > 1 else y[0]
 
         x = list(args[0])
         x = list(map(self.get_value_opt, x))
@@ -1012,12 +1944,18 @@ class Function:  # pylint: disable=too-many-public-methods
             extrapolation="zero",
         )
 
-    def low_pass_filter(self, alpha, file_path=None):
+    def low_pass_filter(
+        self, alpha, file_path=None, zero_phase=False, initial_value=None
+    ):
         """Implements a low pass filter with a moving average filter. This does
         not mutate the original Function object, but returns a new one with the
         filtered source. The filtered source is also saved to a CSV file if a
         file path is given.
 
+        The output values are filtered by the exponential smoothing
+        ``y[i] = alpha * source[i] + (1 - alpha) * y[i - 1]``, while the input
+        values are kept. The Function should have an array-like source.
+
         Parameters
         ----------
         alpha : float
@@ -1029,32 +1967,85 @@ class Function:  # pylint: disable=too-many-public-methods
         file_path : string, optional
             File path or file name of the CSV to save. Don't save any CSV if
             if no argument is passed. Initiated to None.
+        zero_phase : bool, optional
+            If True, the data is filtered forwards and then backwards, which
+            cancels the phase shift and squares the attenuation of the
+            filter. Default is False.
+        initial_value : float, optional
+            Filtered output value preceding the first data point. Used to
+            filter a long dataset in consecutive chunks, by passing the last
+            filtered value of each chunk, ``y_final``, to the next one. Not
+            supported by the zero phase filter, which needs the whole
+            dataset. Default is None, for which the filtered output starts at
+            the first output value.
 
         Returns
         -------
         Function
             The function with the incoming source filtered
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 4), (2, 4), (3, 0)], interpolation="linear")
+        >>> f.low_pass_filter(0.5).y_array
+        array([0. , 2. , 3. , 1.5])
+
+        Filtering the dataset in two chunks gives the same result:
+
+        >>> first = Function([(0, 0), (1, 4)]).low_pass_filter(0.5)
+        >>> second = Function([(2, 4), (3, 0)]).low_pass_filter(
+        ...     0.5, initial_value=first.y_final
+        ... )
+        >>> second.y_array
+        array([3. , 1.5])
         """
-        filtered_signal = np.zeros_like(self.source)
-        filtered_signal[0] = self.source[0]
+        if callable(self.source):
+            raise TypeError(
+                "Cannot filter the Function if the source is a callable object."
+                + " The Function.source should be array-like."
+            )
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha}.")
+        if zero_phase and initial_value is not None:
+            raise ValueError("The zero phase filter does not take initial_value.")
+
+        # The recurrence is the IIR filter with coefficients b and a
+        numerator, denominator = [alpha], [1, alpha - 1]
+        values = self.source[:, -1]
+        if zero_phase:
+            filtered = signal.filtfilt(numerator, denominator, values, padlen=0)
+        else:
+            if initial_value is None:
+                initial_value = values[0]
+            filtered, _ = signal.lfilter(
+                numerator, denominator, values, zi=[(1 - alpha) * initial_value]
+            )
 
-        for i in range(1, len(self.source)):
-            # for each point of our dataset, we apply a exponential smoothing
-            filtered_signal[i] = (
-                alpha * self.source[i] + (1 - alpha) * filtered_signal[i - 1]
+        if self.__dom_dim__ == 1:
+            filtered_function = Function.from_arrays(
+                self.x_array,
+                filtered,
+                inputs=self.__inputs__,
+                outputs=self.__outputs__,
+                interpolation=self.__interpolation__,
+                extrapolation=self.__extrapolation__,
+                title=self.title,
+            )
+        else:
+            filtered_function = Function(
+                source=np.column_stack((self.source[:, :-1], filtered)),
+                inputs=self.__inputs__,
+                outputs=self.__outputs__,
+                interpolation=self.__interpolation__,
+                extrapolation=self.__extrapolation__,
+                title=self.title,
             )
 
         if isinstance(file_path, str):
-            self.savetxt(file_path)
+            filtered_function.savetxt(file_path)
 
-        return Function(
-            source=filtered_signal,
-            inputs=self.__inputs__,
-            outputs=self.__outputs__,
-            interpolation=self.__interpolation__,
-            extrapolation=self.__extrapolation__,
-            title=self.title,
-        )
+        return filtered_function
 
     def remove_outliers_iqr(self, threshold=1.5):
         """Remove outliers from the Function source using the interquartile
@@ -1083,17 +2074,16 @@ class Function:  # pylint: disable=too-many-public-methods
 
         x = self.x_array
         y = self.y_array
-        y_q1 = np.percentile(y, 25)
-        y_q3 = np.percentile(y, 75)
+        y_q1, y_q3 = np.percentile(y, [25, 75])
         y_iqr = y_q3 - y_q1
         y_lower = y_q1 - threshold * y_iqr
         y_upper = y_q3 + threshold * y_iqr
+        inliers = (y >= y_lower) & (y <= y_upper)
 
-        y_filtered = y[(y >= y_lower) & (y <= y_upper)]
-        x_filtered = x[(y >= y_lower) & (y <= y_upper)]
-
-        return Function(
-            source=np.column_stack((x_filtered, y_filtered)),
+        # Removing points keeps the source sorted
+        return Function.from_arrays(
+            x[inliers],
+            y[inliers],
             inputs=self.__inputs__,
             outputs=self.__outputs__,
             interpolation=self.__interpolation__,
@@ -1656,11 +2646,19 @@ class Function:  # pylint: disable=too-many-public-methods
         arg_qty, arg_dim = arg_stack.shape
         result = np.zeros(arg_qty)
 
-        # Reshape to vectorize calculations
-        x = arg_stack.reshape(arg_qty, 1, arg_dim)
+        neighbors = self.__shepard_neighbors__
+        if neighbors is not None and neighbors < len(y_data):
+            # Only weight the nearest data points of each argument
+            distances, indexes = self.__shepard_tree__.query(arg_stack, k=neighbors)
+            distances_squared = distances.reshape(arg_qty, neighbors) ** 2
+            y_data = y_data[indexes.reshape(arg_qty, neighbors)]
+        else:
+            # Reshape to vectorize calculations
+            x = arg_stack.reshape(arg_qty, 1, arg_dim)
 
-        sub_matrix = x_data - x
-        distances_squared = np.sum(sub_matrix**2, axis=2)
+            sub_matrix = x_data - x
+            distances_squared = np.sum(sub_matrix**2, axis=2)
+            y_data = np.broadcast_to(y_data, distances_squared.shape)
 
         # Remove zero distances from further calculations
         zero_distances = np.where(distances_squared == 0)
@@ -1668,13 +2666,136 @@ class Function:  # pylint: disable=too-many-public-methods
         valid_indexes[zero_distances[0]] = False
 
         weights = distances_squared[valid_indexes] ** (-1.5)
-        numerator_sum = np.sum(y_data * weights, axis=1)
+        numerator_sum = np.sum(y_data[valid_indexes] * weights, axis=1)
         denominator_sum = np.sum(weights, axis=1)
         result[valid_indexes] = numerator_sum / denominator_sum
-        result[~valid_indexes] = y_data[zero_distances[1]]
+        result[zero_distances[0]] = y_data[zero_distances]
+
+        return result if len(result) > 1 else result[0]
+
+    def __regular_grid(self):
+        """Arrange the data points of an N-D Function in a rectilinear grid.
+
+        Returns
+        -------
+        grid : tuple[list[np.ndarray], np.ndarray] or None
+            The sorted coordinates of the grid along each axis and the output
+            values in an array with one dimension per axis, or None if the
+            data points are not a complete grid with at least two points
+            along each axis.
+        """
+        points = self.source[:, :-1]
+        axes = [np.unique(points[:, i]) for i in range(points.shape[1])]
+        shape = tuple(len(axis) for axis in axes)
+        if min(shape) < 2 or math.prod(shape) != len(points):
+            return None
+        indexes = tuple(
+            np.searchsorted(axis, points[:, i]) for i, axis in enumerate(axes)
+        )
+        if len(np.unique(np.ravel_multi_index(indexes, shape))) != len(points):
+            return None
+        values = np.empty(shape)
+        values[indexes] = self.source[:, -1]
+        return axes, values
+
+    def is_regular_grid(self):
+        """Check whether the Function is N-D and its data points lie on a
+        rectilinear grid, so that it can use the regular_grid interpolation.
+
+        Returns
+        -------
+        bool
+            True if the data points are a complete rectilinear grid.
+        """
+        return (
+            not callable(self.source)
+            and self.__dom_dim__ > 1
+            and self.__regular_grid() is not None
+        )
+
+    def __build_regular_grid(self):
+        """Store the grid used by the regular_grid interpolation. Values are
+        kept in a flat list, with the offset of each corner of a grid cell,
+        so that single points are evaluated without creating arrays. The
+        corners are ordered so that consecutive pairs only differ along the
+        last axis."""
+        axes, values = self.__regular_grid()
+        dimension = len(axes)
+        strides = [math.prod(values.shape[i + 1 :]) for i in range(dimension)]
+        self.__grid_axes__ = axes
+        self.__grid_axes_lists__ = [axis.tolist() for axis in axes]
+        self.__grid_strides__ = strides
+        self.__grid_values__ = values.ravel()
+        self.__grid_values_list__ = self.__grid_values__.tolist()
+        self.__grid_offsets__ = [
+            sum(
+                stride * ((corner >> (dimension - 1 - i)) & 1)
+                for i, stride in enumerate(strides)
+            )
+            for corner in range(2**dimension)
+        ]
+
+    def __interpolate_regular_grid__(self, args):
+        """Calculates the multilinear interpolation of data on a rectilinear
+        grid. The grid cell of each argument is found by bisection along each
+        axis, and the values at the corners of the cell are weighted linearly
+        along each axis. Outside of the grid, the extrapolation method is
+        applied: natural extends the border cells linearly, constant uses
+        the closest point of the grid and zero returns zero.
+
+        Parameters
+        ----------
+        args : scalar, list
+            Values where the Function is to be evaluated.
 
+        Returns
+        -------
+        result : scalar, list
+            The result of the interpolation.
+        """
+        extrapolation = self.__extrapolation__
+        if all(isinstance(arg, NUMERICAL_TYPES) for arg in args):
+            values = self.__grid_values_list__
+            base = 0
+            fractions = []
+            for x, axis, stride in zip(
+                args, self.__grid_axes_lists__, self.__grid_strides__
+            ):
+                if not axis[0] <= x <= axis[-1]:
+                    if extrapolation == "zero":
+                        return 0.0
+                    if extrapolation == "constant":
+                        x = min(max(x, axis[0]), axis[-1])
+                i = min(max(bisect_right(axis, x) - 1, 0), len(axis) - 2)
+                fractions.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+                base += i * stride
+            # Interpolate the cell corners along one axis at a time
+            cell = [values[base + offset] for offset in self.__grid_offsets__]
+            for fraction in reversed(fractions):
+                cell = [a + (b - a) * fraction for a, b in zip(cell[::2], cell[1::2])]
+            return cell[0]
+
+        points = np.broadcast_arrays(*[np.asarray(arg, dtype=float) for arg in args])
+        points = [point.ravel() for point in points]
+        outside = np.zeros(len(points[0]), dtype=bool)
+        base = np.zeros(len(points[0]), dtype=int)
+        fractions = []
+        for x, axis, stride in zip(points, self.__grid_axes__, self.__grid_strides__):
+            outside |= (x < axis[0]) | (x > axis[-1])
+            if extrapolation == "constant":
+                x = np.clip(x, axis[0], axis[-1])
+            i = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, len(axis) - 2)
+            fractions.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+            base += i * stride
+        cell = [self.__grid_values__[base + offset] for offset in self.__grid_offsets__]
+        for fraction in reversed(fractions):
+            cell = [a + (b - a) * fraction for a, b in zip(cell[::2], cell[1::2])]
+        result = cell[0]
+        if extrapolation == "zero":
+            result[outside] = 0
         return result if len(result) > 1 else result[0]
 
+    @_keep_grid_merging
     def __neg__(self):
         """Negates the Function object. The result has the same effect as
         multiplying the Function by -1.
@@ -1695,7 +2816,7 @@ class Function:  # pylint: disable=too-many-public-methods
             )
         else:
             return Function(
-                lambda x: -self.source(x),
+                _FunctionExpression("neg", (self,)),
                 self.__inputs__,
                 self.__outputs__,
                 self.__interpolation__,
@@ -1854,6 +2975,7 @@ class Function:  # pylint: disable=too-many-public-methods
         return ~self.__ge__(other)
 
     # Define all possible algebraic operations
+    @_keep_grid_merging
     def __add__(self, other):  # pylint: disable=too-many-statements
         """Sums a Function object and 'other', returns a new Function
         object which gives the result of the sum. Only implemented for
@@ -1897,8 +3019,13 @@ class Function:  # pylint: disable=too-many-public-methods
                 extrapolation = self.__extrapolation__
                 # Create new Function object
                 return Function(source, inputs, outputs, interpolation, extrapolation)
-            else:
-                return Function(lambda x: (self.get_value_opt(x) + other(x)))
+            merged = self.__merged_grid_operands(other)
+            if merged is not None:
+                outputs = f"({self.__outputs__[0]} + {other.__outputs__[0]})"
+                return self.__merged_grid_function(
+                    merged, merged[1] + merged[2], outputs
+                )
+            return Function(_FunctionExpression("add", (self, other)))
         # If other is Float except...
         except AttributeError:
             if isinstance(other, NUMERICAL_TYPES) or self.__is_single_element_array(
@@ -1921,11 +3048,12 @@ class Function:  # pylint: disable=too-many-public-methods
                         source, inputs, outputs, interpolation, extrapolation
                     )
                 else:
-                    return Function(lambda x: (self.get_value_opt(x) + other))
+                    return Function(_FunctionExpression("add", (self, other)))
             # Or if it is just a callable
             elif callable(other):
-                return Function(lambda x: (self.get_value_opt(x) + other(x)))
+                return Function(_FunctionExpression("add", (self, other)))
 
+    @_keep_grid_merging
     def __radd__(self, other):
         """Sums 'other' and a Function object and returns a new Function
         object which gives the result of the sum. Only implemented for
@@ -1943,6 +3071,7 @@ class Function:  # pylint: disable=too-many-public-methods
         """
         return self + other
 
+    @_keep_grid_merging
     def __sub__(self, other):
         """Subtracts from a Function object and returns a new Function object
         which gives the result of the subtraction. Only implemented for 1D
@@ -1967,8 +3096,9 @@ class Function:  # pylint: disable=too-many-public-methods
         try:
             return self + (-other)
         except TypeError:
-            return Function(lambda x: (self.get_value_opt(x) - other(x)))
+            return Function(_FunctionExpression("sub", (self, other)))
 
+    @_keep_grid_merging
     def __rsub__(self, other):
         """Subtracts a Function object from 'other' and returns a new Function
         object which gives the result of the subtraction. Only implemented for
@@ -1986,6 +3116,7 @@ class Function:  # pylint: disable=too-many-public-methods
         """
         return other + (-self)
 
+    @_keep_grid_merging
     def __mul__(self, other):
         """Multiplies a Function object and returns a new Function object
         which gives the result of the multiplication. Only implemented for 1D
@@ -2029,7 +3160,7 @@ class Function:  # pylint: disable=too-many-public-methods
             other
         ):
             if not self_source_is_array:
-                return Function(lambda x: (self.get_value_opt(x) * other), inputs)
+                return Function(_FunctionExpression("mul", (self, other)), inputs)
             source = np.column_stack((self.x_array, np.multiply(self.y_array, other)))
             outputs = f"({self.__outputs__[0]}*{other})"
             return Function(
@@ -2040,10 +3171,17 @@ class Function:  # pylint: disable=too-many-public-methods
                 extrap,
             )
         elif callable(other):
-            return Function(lambda x: (self.get_value_opt(x) * other(x)), inputs)
+            merged = self.__merged_grid_operands(other)
+            if merged is not None:
+                outputs = f"({self.__outputs__[0]}*{other.__outputs__[0]})"
+                return self.__merged_grid_function(
+                    merged, merged[1] * merged[2], outputs
+                )
+            return Function(_FunctionExpression("mul", (self, other)), inputs)
         else:
             raise TypeError("Unsupported type for multiplication")
 
+    @_keep_grid_merging
     def __rmul__(self, other):
         """Multiplies 'other' by a Function object and returns a new Function
         object which gives the result of the multiplication. Only implemented for
@@ -2061,6 +3199,7 @@ class Function:  # pylint: disable=too-many-public-methods
         """
         return self * other
 
+    @_keep_grid_merging
     def __truediv__(self, other):  # pylint: disable=too-many-statements
         """Divides a Function object and returns a new Function object
         which gives the result of the division. Only implemented for 1D
@@ -2106,8 +3245,13 @@ class Function:  # pylint: disable=too-many-public-methods
                 extrapolation = self.__extrapolation__
                 # Create new Function object
                 return Function(source, inputs, outputs, interpolation, extrapolation)
-            else:
-                return Function(lambda x: (self.get_value_opt(x) / other(x)))
+            merged = self.__merged_grid_operands(other)
+            if merged is not None:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ys = np.nan_to_num(merged[1] / merged[2])
+                outputs = f"({self.__outputs__[0]}/{other.__outputs__[0]})"
+                return self.__merged_grid_function(merged, ys, outputs)
+            return Function(_FunctionExpression("truediv", (self, other)))
         # If other is Float except...
         except AttributeError:
             if isinstance(other, NUMERICAL_TYPES) or self.__is_single_element_array(
@@ -2130,11 +3274,12 @@ class Function:  # pylint: disable=too-many-public-methods
                         source, inputs, outputs, interpolation, extrapolation
                     )
                 else:
-                    return Function(lambda x: (self.get_value_opt(x) / other))
+                    return Function(_FunctionExpression("truediv", (self, other)))
             # Or if it is just a callable
             elif callable(other):
-                return Function(lambda x: (self.get_value_opt(x) / other(x)))
+                return Function(_FunctionExpression("truediv", (self, other)))
 
+    @_keep_grid_merging
     def __rtruediv__(self, other):
         """Divides 'other' by a Function object and returns a new Function
         object which gives the result of the division. Only implemented for
@@ -2166,11 +3311,12 @@ class Function:  # pylint: disable=too-many-public-methods
                 # Create new Function object
                 return Function(source, inputs, outputs, interpolation, extrapolation)
             else:
-                return Function(lambda x: (other / self.get_value_opt(x)))
+                return Function(_FunctionExpression("truediv", (other, self)))
         # Or if it is just a callable
         elif callable(other):
-            return Function(lambda x: (other(x) / self.get_value_opt(x)))
+            return Function(_FunctionExpression("truediv", (other, self)))
 
+    @_keep_grid_merging
     def __pow__(self, other):  # pylint: disable=too-many-statements
         """Raises a Function object to the power of 'other' and
         returns a new Function object which gives the result. Only
@@ -2200,7 +3346,6 @@ class Function:  # pylint: disable=too-many-public-methods
                 isinstance(other.source, np.ndarray)
                 and isinstance(self.source, np.ndarray)
                 and self.__dom_dim__ == other.__dom_dim__
-                and np.any(self.x_array - other.x_array) is False
                 and np.array_equal(self.x_array, other.x_array)
             ):
                 # Operate on grid values
@@ -2215,8 +3360,13 @@ class Function:  # pylint: disable=too-many-public-methods
                 extrapolation = self.__extrapolation__
                 # Create new Function object
                 return Function(source, inputs, outputs, interpolation, extrapolation)
-            else:
-                return Function(lambda x: (self.get_value_opt(x) ** other(x)))
+            merged = self.__merged_grid_operands(other)
+            if merged is not None:
+                outputs = f"({self.__outputs__[0]}**{other.__outputs__[0]})"
+                return self.__merged_grid_function(
+                    merged, merged[1] ** merged[2], outputs
+                )
+            return Function(_FunctionExpression("pow", (self, other)))
         # If other is Float except...
         except AttributeError:
             if isinstance(other, NUMERICAL_TYPES) or self.__is_single_element_array(
@@ -2239,11 +3389,12 @@ class Function:  # pylint: disable=too-many-public-methods
                         source, inputs, outputs, interpolation, extrapolation
                     )
                 else:
-                    return Function(lambda x: (self.get_value_opt(x) ** other))
+                    return Function(_FunctionExpression("pow", (self, other)))
             # Or if it is just a callable
             elif callable(other):
-                return Function(lambda x: (self.get_value_opt(x) ** other(x)))
+                return Function(_FunctionExpression("pow", (self, other)))
 
+    @_keep_grid_merging
     def __rpow__(self, other):
         """Raises 'other' to the power of a Function object and returns
         a new Function object which gives the result. Only implemented
@@ -2275,10 +3426,10 @@ class Function:  # pylint: disable=too-many-public-methods
                 # Create new Function object
                 return Function(source, inputs, outputs, interpolation, extrapolation)
             else:
-                return Function(lambda x: (other ** self.get_value_opt(x)))
+                return Function(_FunctionExpression("pow", (other, self)))
         # Or if it is just a callable
         elif callable(other):
-            return Function(lambda x: (other(x) ** self.get_value_opt(x)))
+            return Function(_FunctionExpression("pow", (other, self)))
 
     def __matmul__(self, other):
         """Operator @ as an alias for composition. Therefore, this
@@ -2300,10 +3451,11 @@ class Function:  # pylint: disable=too-many-public-methods
         """
         return self.compose(other)
 
+    @_keep_grid_merging
     def __mod__(self, other):
         """Operator % as an alias for modulo operation."""
         if callable(self.source):
-            return Function(lambda x: self.source(x) % other)
+            return Function(_FunctionExpression("mod", (self, other)))
         elif isinstance(self.source, np.ndarray) and isinstance(other, NUMERICAL_TYPES):
             return Function(
                 np.column_stack((self.x_array, self.y_array % other)),
@@ -2540,37 +3692,61 @@ class Function:  # pylint: disable=too-many-public-methods
                 outputs=f"identity of {self.__outputs__}",
             )
 
-    def derivative_function(self):
+    @_keep_grid_merging
+    def derivative_function(self, exact=False):
         """Returns a Function object which gives the derivative of the Function object.
 
+        Parameters
+        ----------
+        exact : bool, optional
+            Only used if the Function is 1-D and given by a dataset. If False,
+            the default, the derivative is given by the finite differences of
+            the data points, at the midpoints between them. If True, the
+            derivative is exact: the interpolating polynomials are
+            differentiated term by term and the result is cached on the
+            Function. The exact derivative is a callable Function, whose own
+            derivative is exact as well.
+
         Returns
         -------
         result : Function
             A Function object which gives the derivative of self.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 1), (2, 4), (3, 9)], interpolation="akima")
+        >>> float(f.derivative_function(exact=True)(1.5))
+        3.0
         """
-        # Check if Function object source is array
-        if isinstance(self.source, np.ndarray):
+        inputs = self.__inputs__[:]
+        outputs = f"d({self.__outputs__[0]})/d({inputs[0]})"
+        if isinstance(self.source, np.ndarray) and exact and self.__dom_dim__ == 1:
+            if "_derivative_source" not in self.__dict__:
+                self._derivative_source = _PiecewisePolynomial.from_function(
+                    self
+                ).derivative()
+            source = self._derivative_source
+        elif isinstance(self.source, np.ndarray):
             # Operate on grid values
             ys = np.diff(self.y_array) / np.diff(self.x_array)
             xs = self.source[:-1, 0] + np.diff(self.x_array) / 2
             source = np.column_stack((xs, ys))
-            # Retrieve inputs, outputs and interpolation
-            inputs = self.__inputs__[:]
-            outputs = f"d({self.__outputs__[0]})/d({inputs[0]})"
+        elif isinstance(self.source, _PiecewisePolynomial):
+            source = self.source.derivative()
         else:
 
             def source_function(x):
                 return self.differentiate(x)
 
             source = source_function
-            inputs = self.__inputs__[:]
-            outputs = f"d({self.__outputs__[0]})/d({inputs[0]})"
 
         # Create new Function object
         return Function(
             source, inputs, outputs, self.__interpolation__, self.__extrapolation__
         )
 
+    @_keep_grid_merging
     def integral_function(self, lower=None, upper=None, datapoints=100):
         """Returns a Function object representing the integral of the Function
         object.
@@ -2585,25 +3761,49 @@ class Function:  # pylint: disable=too-many-public-methods
             The upper limit of the interval in which the function is to be
             evaluated at. If the Function is given by a dataset, the default
             value is the end of the dataset.
-        datapoints : int, optional
-            The number of points in which the integral will be evaluated for
-            plotting it, which draws lines between each evaluated point.
-            The default value is 100.
+        datapoints : int, array_like, None, optional
+            The points in which the integral will be evaluated, if the
+            Function is given by a dataset. If an int, the number of equally
+            spaced points between lower and upper. If None, the data points
+            of the Function between lower and upper, plus lower and upper.
+            If an array, the points themselves, in which case upper is not
+            used. The default value is 100.
 
         Returns
         -------
         result : Function
             The integral of the Function object.
+
+        Notes
+        -----
+        For Functions given by a dataset, the integral is computed at once
+        from the interpolation coefficients, as the difference of values of
+        the antiderivative of the interpolating piecewise polynomial. It is
+        exact for every interpolation and extrapolation method.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function([(0, 0), (1, 2), (3, 2)], interpolation="linear")
+        >>> f.integral_function(datapoints=None).y_array
+        array([0., 1., 5.])
         """
         if isinstance(self.source, np.ndarray):
             lower = self.source[0, 0] if lower is None else lower
             upper = self.source[-1, 0] if upper is None else upper
-            x_data = np.linspace(lower, upper, datapoints)
-            y_data = np.zeros(datapoints)
-            for i in range(datapoints):
-                y_data[i] = self.integral(lower, x_data[i])
-            return Function(
-                np.column_stack((x_data, y_data)),
+            if datapoints is None:
+                x_data = self.x_array[(self.x_array > lower) & (self.x_array < upper)]
+                x_data = np.unique(np.concatenate(([lower], x_data, [upper])))
+            elif isinstance(datapoints, Iterable):
+                x_data = np.unique(np.asarray(datapoints, dtype=np.float64))
+            else:
+                x_data = np.linspace(lower, upper, datapoints)
+            antiderivative = self.__antiderivative_1d_array(
+                np.concatenate(([lower], x_data))
+            )
+            return Function.from_arrays(
+                x_data,
+                antiderivative[1:] - antiderivative[0],
                 inputs=self.__inputs__,
                 outputs=[o + " Integral" for o in self.__outputs__],
             )
@@ -2615,6 +3815,70 @@ class Function:  # pylint: disable=too-many-public-methods
                 outputs=[o + " Integral" for o in self.__outputs__],
             )
 
+    def __antiderivative_1d_array(self, x):
+        """Evaluate the antiderivative of a 1-D Function given by a dataset,
+        taken as zero at the first data point, at every point of an array.
+        The integrals of all the polynomial pieces of the interpolation are
+        accumulated once, so the cost is linear in the number of data points
+        and evaluated points.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            One dimensional float array of the points to be evaluated.
+
+        Returns
+        -------
+        np.ndarray
+            Antiderivative values at the points of x.
+        """
+        x_data, y_data = self.x_array, self.y_array
+        last = len(x_data) - 2
+        interpolation = self.__interpolation__
+
+        if interpolation == "linear":
+            slopes = np.diff(y_data) / np.diff(x_data)
+
+            def primitive(i, t):
+                t = t - x_data[i]
+                return t * (y_data[i] + t * slopes[i] / 2)
+
+        elif interpolation in ("akima", "polynomial"):
+            if interpolation == "akima":
+                coeffs = np.reshape(self.__akima_coefficients__, (-1, 4)).T
+            else:
+                coeffs = np.reshape(self.__polynomial_coefficients__, (-1, 1))
+            powers = np.arange(1, len(coeffs) + 1).reshape(-1, 1)
+
+            def primitive(i, t):
+                terms = coeffs[:, np.minimum(i, coeffs.shape[1] - 1)] / powers
+                return np.sum(terms * (t**powers - x_data[i] ** powers), axis=0)
+
+        else:  # spline
+            coeffs = self.__spline_coefficients__
+
+            def primitive(i, t):
+                t = t - x_data[i]
+                a = coeffs[:, i]
+                return t * (a[0] + t * (a[1] / 2 + t * (a[2] / 3 + t * a[3] / 4)))
+
+        # Antiderivative at the data points
+        knots = np.arange(last + 1)
+        steps = primitive(knots, x_data[1:])
+        at_knots = np.concatenate(([0], np.cumsum(steps)))
+
+        i = np.clip(np.searchsorted(x_data, x, side="right") - 1, 0, last)
+        result = at_knots[i] + primitive(i, x)
+
+        below, above = x < x_data[0], x > x_data[-1]
+        if self.__extrapolation__ == "constant":
+            result[below] = y_data[0] * (x[below] - x_data[0])
+            result[above] = at_knots[-1] + y_data[-1] * (x[above] - x_data[-1])
+        elif self.__extrapolation__ == "zero":
+            result[below] = 0
+            result[above] = at_knots[-1]
+        return result
+
     def isbijective(self):
         """Checks whether the Function is bijective. Only applicable to
         Functions whose source is a list of points, raises an error otherwise.
@@ -2688,7 +3952,9 @@ class Function:  # pylint: disable=too-many-public-methods
                 "whose source is an array."
             )
 
-    def inverse_function(self, approx_func=None, tol=1e-4):
+    def inverse_function(
+        self, approx_func=None, tol=1e-4, lower=None, upper=None, samples=100
+    ):
         """
         Returns the inverse of the Function. The inverse function of F is a
         function that undoes the operation of F. The inverse of F exists if
@@ -2698,8 +3964,13 @@ class Function:  # pylint: disable=too-many-public-methods
         If the Function is given by a list of points, the method
         `is_strictly_bijective()` is called and an error is raised if the
         Function is not bijective.
-        If the Function is given by a function, its bijection is not
-        checked and may lead to inaccuracies outside of its bijective region.
+        If the Function is given by a function and lower and upper are given,
+        the inverse is tabulated: the Function is sampled in the interval
+        from lower to upper, an error is raised if the samples are not
+        strictly monotonic and the inverse is given by the samples with
+        linear interpolation. Otherwise, the inverse finds a root of the
+        Function at every evaluation, its bijection is not checked and may
+        lead to inaccuracies outside of its bijective region.
 
         Parameters
         ----------
@@ -2710,15 +3981,35 @@ class Function:  # pylint: disable=too-many-public-methods
             in complex but has a simple approximation or when the root
             finding algorithm performs poorly due to default start point.
             The default is None in which case the starting point is zero.
+            Not used by tabulated inverses.
 
         tol : float, optional
-            The tolerance for the inverse root finding algorithm. The default
-            is 1e-4.
+            The tolerance for the inverse root finding algorithm. For
+            tabulated inverses, the maximum error of the inverse, estimated
+            at the midpoints between samples. The default is 1e-4.
+        lower : float, optional
+            Lower limit of the domain of a Function given by a function,
+            used to tabulate its inverse. Default is None.
+        upper : float, optional
+            Upper limit of the domain of a Function given by a function,
+            used to tabulate its inverse. Default is None.
+        samples : int, optional
+            Number of equally spaced initial samples of a tabulated inverse.
+            Samples are added at the midpoints between them until the
+            tolerance is met. Default is 100.
 
         Returns
         -------
         result : Function
             A Function whose domain and range have been inverted.
+
+        Examples
+        --------
+        >>> from rocketpy import Function
+        >>> f = Function(lambda x: x**3 + x)
+        >>> inverse = f.inverse_function(lower=0, upper=2, samples=5)
+        >>> round(float(inverse(5)), 4)
+        1.516
         """
         if isinstance(self.source, np.ndarray):
             if self.is_strictly_bijective():
@@ -2728,6 +4019,14 @@ class Function:  # pylint: disable=too-many-public-methods
                 raise ValueError(
                     "Function is not bijective, so it does not have an inverse."
                 )
+        elif lower is not None and upper is not None:
+            return Function(
+                self.__tabulate_inverse(lower, upper, samples, tol),
+                inputs=self.__outputs__,
+                outputs=self.__inputs__,
+                interpolation="linear",
+                extrapolation="natural",
+            )
         else:
             if approx_func is not None:
 
@@ -2748,6 +4047,38 @@ class Function:  # pylint: disable=too-many-public-methods
             extrapolation=self.__extrapolation__,
         )
 
+    def __tabulate_inverse(self, lower, upper, samples, tol, max_refinements=50):
+        """Sample a 1-D Function so that the linear interpolation of its
+        inverse has an error below tol, estimated at the midpoints between
+        samples. Intervals that miss the tolerance are split in halves.
+
+        Returns
+        -------
+        np.ndarray
+            Source of the inverse, with columns of outputs and inputs.
+        """
+        x = np.linspace(lower, upper, samples)
+        y = np.asarray(self.get_value(x), dtype=np.float64)
+        for _ in range(max_refinements):
+            x_mid = (x[:-1] + x[1:]) / 2
+            y_mid = np.asarray(self.get_value(x_mid), dtype=np.float64)
+            # Samples and midpoints must be strictly monotonic together
+            steps = np.diff(np.column_stack((y[:-1], y_mid)).ravel())
+            steps = np.append(steps, y[-1] - y_mid[-1])
+            if not (np.all(steps > 0) or np.all(steps < 0)):
+                raise ValueError(
+                    "Function is not strictly monotonic between "
+                    f"{lower} and {upper}, so it does not have an inverse."
+                )
+            x_linear = x[:-1] + (y_mid - y[:-1]) * np.diff(x) / np.diff(y)
+            refine = np.abs(x_linear - x_mid) > tol
+            if not refine.any():
+                break
+            order = np.argsort(np.concatenate((x, x_mid[refine])))
+            x = np.concatenate((x, x_mid[refine]))[order]
+            y = np.concatenate((y, y_mid[refine]))[order]
+        return np.column_stack((y, x))
+
     def find_input(self, val, start, tol=1e-4):
         """
         Finds the optimal input for a given output.
@@ -2811,12 +4142,13 @@ class Function:  # pylint: disable=too-many-public-methods
                 lower = self.source[0, 0]
             upper = self.source[-1, 0]
             x_data = np.linspace(lower, upper, 100)
-            y_data = np.zeros(100)
-            y_data[0] = self.source[:, 1][0]
-            for i in range(1, 100):
-                y_data[i] = self.average(lower, x_data[i])
-            return Function(
-                np.concatenate(([x_data], [y_data])).transpose(),
+            antiderivative = self.__antiderivative_1d_array(x_data)
+            y_data = np.empty(100)
+            y_data[0] = self.get_value_opt(lower)
+            y_data[1:] = (antiderivative[1:] - antiderivative[0]) / (x_data[1:] - lower)
+            return Function.from_arrays(
+                x_data,
+                y_data,
                 inputs=self.__inputs__,
                 outputs=[o + " Average" for o in self.__outputs__],
             )
@@ -3014,12 +4346,7 @@ class Function:  # pylint: disable=too-many-public-methods
 
         if isinstance(source, NUMERICAL_TYPES):
             # Convert number source into vectorized lambda function
-            temp = 1 * source
-
-            def source_function(_):
-                return temp
-
-            return source_function
+            return _ConstantSource(1 * source)
 
         # If source is a callable function
         return source
@@ -3107,14 +4434,23 @@ class Function:  # pylint: disable=too-many-public-methods
                 interpolation = "spline"
         ## multiple dimensions
         elif self.__dom_dim__ > 1:
-            if interpolation not in [None, "shepard"]:
+            if interpolation == "regular_grid" and self.__regular_grid() is None:
+                warnings.warn(
+                    "Interpolation method set to 'shepard' because the data "
+                    "points are not a rectilinear grid, which is required by "
+                    "the 'regular_grid' method."
+                )
+                interpolation = "shepard"
+            elif interpolation not in [None, "shepard", "regular_grid"]:
                 warnings.warn(
                     (
                         "Interpolation method set to 'shepard'. Only 'shepard' "
-                        "interpolation is supported for multiple dimensions."
+                        "and 'regular_grid' interpolations are supported for "
+                        "multiple dimensions."
                     ),
                 )
-            interpolation = "shepard"
+                interpolation = "shepard"
+            interpolation = interpolation or "shepard"
         return interpolation
 
     def __validate_extrapolation(self, extrapolation):
@@ -3130,12 +4466,16 @@ class Function:  # pylint: disable=too-many-public-methods
 
         ## multiple dimensions
         elif self.__dom_dim__ > 1:
-            if extrapolation not in [None, "natural"]:
+            supported = ["natural"]
+            if self.__interpolation__ == "regular_grid":
+                supported += ["constant", "zero"]
+            if extrapolation not in [None, *supported]:
                 warnings.warn(
                     "Extrapolation method set to 'natural'. Other methods "
-                    "are not supported yet."
+                    "are only supported by the 'regular_grid' interpolation."
                 )
-            extrapolation = "natural"
+                extrapolation = "natural"
+            extrapolation = extrapolation or "natural"
         return extrapolation
 
 
@@ -3242,6 +4582,578 @@ class PiecewiseFunction(Function):
         )
 
 
+class _FunctionExpression:
+    """Arithmetic expression between Functions, callables and scalars. It is
+    the source of the Functions returned by the arithmetic operators when the
+    result cannot be computed on the data points of the operands.
+
+    Left nested sums and products, such as ``f + g + h``, are flattened into
+    a single node, whose operands are evaluated and combined in one loop
+    instead of through a stack of nested callables. Each node is composed
+    into a closure over the ``operator`` functions of its operation. The
+    operations are carried out in the same order as written, so that the
+    result is the same as evaluating the operands and operating on their
+    values. The expression holds no closures in its state, so it can be
+    pickled whenever its operands can.
+
+    Attributes
+    ----------
+    _FunctionExpression.operation : str
+        Name of the operation: "add", "sub", "mul", "truediv", "pow", "mod"
+        or "neg". Sums and products take any number of operands, "neg" takes
+        one and the others take two.
+    _FunctionExpression.operands : tuple
+        Pairs of operand kind and operand: a constant, a Function evaluated
+        through its ``get_value_opt`` or a callable, possibly another
+        expression.
+    _FunctionExpression.dimension : int
+        Number of inputs of the expression, taken from its first Function
+        operand.
+    """
+
+    CONSTANT, FUNCTION, CALLABLE = range(3)
+    OPERATORS = {
+        "add": operator.add,
+        "sub": operator.sub,
+        "mul": operator.mul,
+        "truediv": operator.truediv,
+        "pow": operator.pow,
+        "mod": operator.mod,
+        "neg": operator.neg,
+    }
+
+    def __init__(self, operation, operands):
+        """Create the expression.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the operation, see the attributes of the class.
+        operands : sequence
+            Functions, callables or scalars to be operated, in order.
+        """
+        self.operation = operation
+        self.operands = self.__flatten(operation, operands)
+        self.dimension = self.__dimension(self.operands)
+        names = (
+            ["x"]
+            if self.dimension == 1
+            else [f"x{i + 1}" for i in range(self.dimension)]
+        )
+        self.__signature__ = Signature(
+            [Parameter(name, Parameter.POSITIONAL_OR_KEYWORD) for name in names]
+        )
+        self.__compile()
+
+    @classmethod
+    def __flatten(cls, operation, operands):
+        """Classify the operands. Functions defined by an expression are
+        replaced by the expression itself, and the operands of a first
+        operand of the same sum or product are merged into this one."""
+        flat = []
+        for position, operand in enumerate(operands):
+            if isinstance(operand, Function) and isinstance(
+                operand.source, _FunctionExpression
+            ):
+                operand = operand.source
+            if isinstance(operand, _FunctionExpression):
+                if (
+                    position == 0
+                    and operation in ("add", "mul")
+                    and operand.operation == operation
+                ):
+                    flat.extend(operand.operands)
+                else:
+                    flat.append((cls.CALLABLE, operand))
+            elif isinstance(operand, Function):
+                flat.append((cls.FUNCTION, operand))
+            elif callable(operand):
+                flat.append((cls.CALLABLE, operand))
+            else:
+                flat.append((cls.CONSTANT, operand))
+        return tuple(flat)
+
+    @classmethod
+    def __dimension(cls, operands):
+        for kind, operand in operands:
+            if kind == cls.FUNCTION:
+                return operand.__dom_dim__
+            if isinstance(operand, _FunctionExpression):
+                return operand.dimension
+        return 1
+
+    @staticmethod
+    def __map(function, *args):
+        """Evaluate a callable at each point, for callables that do not
+        accept arrays."""
+        return np.array([function(*point) for point in zip(*args)])
+
+    def __term(self, kind, operand, vectorized):
+        """Create the callable that evaluates an operand, at a single point
+        or at arrays of points. Nested expressions are evaluated by their
+        own composed functions."""
+        if kind == self.CONSTANT:
+            return lambda *args: operand
+        if isinstance(operand, _FunctionExpression):
+            if "_FunctionExpression__evaluate" not in operand.__dict__:
+                operand.__compile()  # not unpickled yet
+            if vectorized:
+                return operand.evaluate_array
+            return operand.__evaluate
+        if kind == self.FUNCTION:
+            if vectorized:
+                return lambda *args: np.asarray(operand.get_value(*args))
+            # get_value_opt is looked up at each call, since set_source
+            # replaces it
+            # pylint: disable=unnecessary-lambda
+            return lambda *args: operand.get_value_opt(*args)
+        if vectorized:
+            return partial(self.__map, operand)
+        return operand
+
+    def __compose(self, vectorized):
+        """Compose the operands of the expression into one function, which
+        applies the operator of the expression to their values in order."""
+        function = self.OPERATORS[self.operation]
+        if self.operation == "neg":
+            term = self.__term(*self.operands[0], vectorized)
+            return lambda *args: function(term(*args))
+        if len(self.operands) == 2:
+            first_kind, first = self.operands[0]
+            second_kind, second = self.operands[1]
+            if first_kind == self.CONSTANT:
+                second = self.__term(second_kind, second, vectorized)
+                return lambda *args: function(first, second(*args))
+            first = self.__term(first_kind, first, vectorized)
+            if second_kind == self.CONSTANT:
+                return lambda *args: function(first(*args), second)
+            second = self.__term(second_kind, second, vectorized)
+            return lambda *args: function(first(*args), second(*args))
+
+        first, *others = [
+            self.__term(kind, operand, vectorized) for kind, operand in self.operands
+        ]
+
+        def evaluate(*args):
+            result = first(*args)
+            for term in others:
+                result = function(result, term(*args))
+            return result
+
+        return evaluate
+
+    def __compile(self):
+        """Compose the expression into one function for single points and
+        one function for arrays of points."""
+        self.__evaluate = self.__compose(vectorized=False)
+        self.__evaluate_array = self.__compose(vectorized=True)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_FunctionExpression__evaluate"]
+        del state["_FunctionExpression__evaluate_array"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__compile()
+
+    def __call__(self, *args):
+        """Evaluate the expression at a single point."""
+        return self.__evaluate(*args)
+
+    def evaluate_array(self, *args):
+        """Evaluate the expression at several points at once. Function
+        operands and nested expressions are evaluated at all points in one
+        call, and the operations are carried out on arrays.
+
+        Parameters
+        ----------
+        args : np.ndarray
+            One 1-D array per input, all with the same size.
+
+        Returns
+        -------
+        np.ndarray
+            Value of the expression at each point.
+        """
+        result = np.asarray(self.__evaluate_array(*args))
+        if result.shape != args[0].shape:
+            result = np.full(args[0].shape, result)
+        return result
+
+    def leaves(self):
+        """Yield the Functions and callables operated by the expression,
+        including the ones of nested expressions."""
+        for kind, operand in self.operands:
+            if isinstance(operand, _FunctionExpression):
+                yield from operand.leaves()
+            elif kind != self.CONSTANT:
+                yield operand
+
+
+class _ConstantSource:
+    """Callable source of the Functions given by a number. Unlike a local
+    function, it can be pickled."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, _):
+        return self.value
+
+
+class _SharedArray:
+    """Reference to an array in a block of shared memory, pickled instead of
+    the source of the Functions moved there by ``Function.share_memory``."""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def attach(self):
+        """Return the block of shared memory and the array it holds."""
+        block = shared_memory.SharedMemory(name=self.name)
+        return block, np.ndarray(self.shape, self.dtype, buffer=block.buf)
+
+
+class _MemoizedSource:
+    """Callable that memoizes the evaluations of a Function with a least
+    recently used cache. It is the source of the Functions returned by
+    ``Function.cache``.
+
+    Attributes
+    ----------
+    _MemoizedSource.function : Function
+        The memoized Function.
+    _MemoizedSource.maxsize : int, None
+        Maximum number of memoized evaluations.
+    _MemoizedSource.steps : tuple, None
+        Quantization step of each input, or None for exact inputs.
+    """
+
+    def __init__(self, function, maxsize, steps):
+        """Create the memoized source. See the attributes of the class."""
+        self.function = function
+        self.maxsize = maxsize
+        self.steps = steps
+        dimension = function.__dom_dim__
+        names = ["x"] if dimension == 1 else [f"x{i + 1}" for i in range(dimension)]
+        self.__signature__ = Signature(
+            [Parameter(name, Parameter.POSITIONAL_OR_KEYWORD) for name in names]
+        )
+        self.__build()
+
+    def __build(self):
+        function = self.function
+        steps = self.steps
+        if steps is None:
+
+            @lru_cache(self.maxsize)
+            def evaluate(*args):
+                return function.get_value_opt(*args)
+
+            self.__cached = self.__evaluate = evaluate
+            return
+
+        # Keys are integer multiples of the steps, so that rounding errors
+        # of the quantized inputs do not split cache entries
+        @lru_cache(self.maxsize)
+        def evaluate_key(*keys):
+            return function.get_value_opt(
+                *(key if step is None else key * step for key, step in zip(keys, steps))
+            )
+
+        def evaluate_quantized(*args):
+            return evaluate_key(
+                *(
+                    arg if step is None else round(arg / step)
+                    for arg, step in zip(args, steps)
+                )
+            )
+
+        self.__cached = evaluate_key
+        self.__evaluate = evaluate_quantized
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_MemoizedSource__cached"]
+        del state["_MemoizedSource__evaluate"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__build()
+
+    def __call__(self, *args):
+        return self.__evaluate(*args)
+
+    def cache_info(self):
+        """Return the hits, misses, maximum size and current size of the
+        cache, see ``functools.lru_cache``."""
+        return self.__cached.cache_info()
+
+    def cache_clear(self):
+        """Discard every memoized evaluation and reset the statistics."""
+        self.__cached.cache_clear()
+
+
+class _PiecewisePolynomial:
+    """Piecewise polynomial of x - x_i in each interval [x_i, x_i+1] of a
+    1-D dataset. It is the source of the exact derivatives of the Functions
+    given by a dataset, whose interpolating polynomials are differentiated
+    term by term, see ``Function.derivative_function``.
+
+    Attributes
+    ----------
+    _PiecewisePolynomial.x_data : np.ndarray
+        Ends of the intervals, in ascending order.
+    _PiecewisePolynomial.coeffs : np.ndarray
+        Coefficients of the polynomial of each interval, of shape
+        (degree + 1, len(x_data) - 1), in increasing powers of x - x_i.
+    _PiecewisePolynomial.natural : bool
+        If True, the polynomials of the first and last intervals are used
+        outside of the data range. Otherwise, the polynomial is zero there,
+        as the derivative of a constant or zero extrapolation.
+    """
+
+    def __init__(self, x_data, coeffs, natural):
+        """Create the piecewise polynomial. See the attributes of the class."""
+        self.x_data = x_data
+        self.coeffs = coeffs
+        self.natural = natural
+        # Python floats are faster than numpy scalars for single points
+        self.__x_list = x_data.tolist()
+        self.__columns = [column[::-1] for column in coeffs.T.tolist()]
+
+    @classmethod
+    def from_function(cls, func):
+        """Create the piecewise polynomial that interpolates a 1-D Function
+        given by a dataset, with the same pieces used by its interpolation.
+
+        Parameters
+        ----------
+        func : Function
+            Function given by a dataset.
+
+        Returns
+        -------
+        _PiecewisePolynomial
+            The interpolating piecewise polynomial.
+        """
+        x_data, y_data = func.x_array, func.y_array
+        interpolation = func.__interpolation__
+        if interpolation == "linear":
+            coeffs = np.vstack([y_data[:-1], np.diff(y_data) / np.diff(x_data)])
+        elif interpolation == "spline":
+            coeffs = func.__spline_coefficients__
+        else:
+            if interpolation == "akima":
+                # Polynomials of x in each interval
+                coeffs = np.reshape(func.__akima_coefficients__, (-1, 4)).T
+            else:
+                # A single polynomial of x over the whole data range
+                coeffs = np.reshape(func.__polynomial_coefficients__, (-1, 1))
+                x_data = x_data[[0, -1]]
+            coeffs = cls.__shift(coeffs, x_data[:-1])
+        return cls(x_data, coeffs, func.__extrapolation__ == "natural")
+
+    @staticmethod
+    def __shift(coeffs, centers):
+        """Rewrite polynomials of x as polynomials of x - centers."""
+        shifted = np.zeros_like(coeffs, dtype=np.float64)
+        for k in range(len(coeffs)):
+            for j in range(k, len(coeffs)):
+                shifted[k] += math.comb(j, k) * coeffs[j] * centers ** (j - k)
+        return shifted
+
+    def derivative(self):
+        """Differentiate each polynomial.
+
+        Returns
+        -------
+        _PiecewisePolynomial
+            The derivative.
+        """
+        degree = len(self.coeffs) - 1
+        if degree == 0:
+            coeffs = np.zeros_like(self.coeffs)
+        else:
+            coeffs = self.coeffs[1:] * np.arange(1, degree + 1).reshape(-1, 1)
+        return _PiecewisePolynomial(self.x_data, coeffs, self.natural)
+
+    def __call__(self, x):
+        x_data = self.__x_list
+        if not self.natural and not x_data[0] <= x <= x_data[-1]:
+            return 0.0
+        # Same intervals as the interpolation, x_i < x <= x_i+1
+        i = min(max(bisect_left(x_data, x), 1), len(x_data) - 1) - 1
+        t = x - x_data[i]
+        result = 0.0
+        for coefficient in self.__columns[i]:
+            result = result * t + coefficient
+        return result
+
+    def evaluate_array(self, x):
+        """Evaluate the piecewise polynomial at every point of an array.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            One dimensional float array of the points to be evaluated.
+
+        Returns
+        -------
+        np.ndarray
+            Values at the points of x.
+        """
+        x_data = self.x_data
+        i = np.clip(np.searchsorted(x_data, x, side="left"), 1, len(x_data) - 1) - 1
+        t = x - x_data[i]
+        result = np.zeros_like(t)
+        for coefficient in self.coeffs[::-1]:
+            result = result * t + coefficient[i]
+        if not self.natural:
+            result[(x < x_data[0]) | (x > x_data[-1])] = 0
+        return result
+
+
+class FunctionBundle:
+    """Several 1-D Functions given by datasets over the same inputs, which
+    are evaluated together. A single search of the interval that contains
+    the input is done for all of them, instead of one search per Function.
+
+    Attributes
+    ----------
+    FunctionBundle.functions : tuple[Function]
+        The bundled Functions.
+    FunctionBundle.x_array : np.ndarray
+        Inputs shared by the bundled Functions.
+    FunctionBundle.coeffs : np.ndarray
+        Coefficients of the interpolating polynomial of each Function in each
+        interval [x_i, x_i+1], of shape (len(x_array) - 1, degree + 1,
+        len(functions)), in decreasing powers of x - x_i.
+
+    Examples
+    --------
+    >>> from rocketpy import Function, FunctionBundle
+    >>> f = Function([(0, 0), (1, 1), (2, 4)], interpolation="linear")
+    >>> g = Function([(0, 1), (1, 3), (2, 2)], interpolation="linear")
+    >>> bundle = FunctionBundle([f, g])
+    >>> bundle.get_values(1.5).tolist()
+    [2.5, 2.5]
+    """
+
+    def __init__(self, functions):
+        """Create the bundle of Functions.
+
+        Parameters
+        ----------
+        functions : list[Function]
+            1-D Functions given by datasets with the same inputs. Functions
+            whose source is the exact derivative of such a Function, see
+            ``Function.derivative_function``, are accepted as well. Functions
+            with polynomial interpolation are not supported, since they are a
+            single polynomial over the whole domain.
+
+        Raises
+        ------
+        ValueError
+            If the Functions are not given by datasets over the same inputs.
+        """
+        self.functions = tuple(functions)
+        if not self.functions:
+            raise ValueError("A FunctionBundle needs at least one Function.")
+        pieces = [self.__piece(func) for func in self.functions]
+        self.x_array = pieces[0][0].x_data
+        if any(not np.array_equal(piece.x_data, self.x_array) for piece, *_ in pieces):
+            raise ValueError("The bundled Functions must share the same inputs.")
+
+        degree = max(len(piece.coeffs) for piece, *_ in pieces) - 1
+        coeffs = np.zeros((degree + 1, len(self.x_array) - 1, len(pieces)))
+        for k, (piece, *_) in enumerate(pieces):
+            # Missing higher powers are padded with zeros
+            coeffs[degree + 1 - len(piece.coeffs) :, :, k] = piece.coeffs[::-1]
+        self.coeffs = np.ascontiguousarray(coeffs.transpose(1, 0, 2))
+
+        # Outside of the inputs, values are replaced unless they are natural
+        self.__natural = np.array([natural for _, natural, *_ in pieces])
+        self.__first = np.array([first for *_, first, _ in pieces], dtype=float)
+        self.__last = np.array([last for *_, last in pieces], dtype=float)
+        self.__all_natural = bool(self.__natural.all())
+        self.__x_list = self.x_array.tolist()
+        self.__powers = list(range(degree, -1, -1))
+
+    @staticmethod
+    def __piece(func):
+        """Returns the interpolating piecewise polynomial of a Function, if it
+        is natural outside of the inputs and its first and last values
+        otherwise."""
+        if isinstance(func.source, _PiecewisePolynomial):
+            # Exact derivatives of constant or zero extrapolations are zero
+            return func.source, func.source.natural, 0.0, 0.0
+        if func.__dom_dim__ != 1 or not isinstance(func.source, np.ndarray):
+            raise ValueError(
+                "Only 1-D Functions given by datasets can be bundled together."
+            )
+        if func.__interpolation__ == "polynomial":
+            raise ValueError(
+                "Functions with polynomial interpolation can not be bundled."
+            )
+        piece = _PiecewisePolynomial.from_function(func)
+        if func.__extrapolation__ == "zero":
+            return piece, False, 0.0, 0.0
+        return piece, piece.natural, func.y_array[0], func.y_array[-1]
+
+    def __len__(self):
+        return len(self.functions)
+
+    def get_values(self, x):
+        """Evaluate all the bundled Functions at the same input.
+
+        Parameters
+        ----------
+        x : int, float, np.ndarray
+            Input, or one dimensional array of inputs.
+
+        Returns
+        -------
+        np.ndarray
+            Values of each Function, in the order of ``functions``. For an
+            array of inputs, the values of each Function are a row of an
+            array of shape (len(functions), len(x)).
+        """
+        if np.ndim(x) > 0:
+            return self.__get_values_array(np.asarray(x, dtype=np.float64))
+        x_list = self.__x_list
+        # Same intervals as the interpolation, x_i < x <= x_i+1
+        i = min(max(bisect_left(x_list, x), 1), len(x_list) - 1) - 1
+        t = x - x_list[i]
+        values = np.dot([t**power for power in self.__powers], self.coeffs[i])
+        if self.__all_natural or x_list[0] <= x <= x_list[-1]:
+            return values
+        outside = self.__first if x < x_list[0] else self.__last
+        return np.where(self.__natural, values, outside)
+
+    def __get_values_array(self, x):
+        x_array = self.x_array
+        i = np.clip(np.searchsorted(x_array, x, side="left"), 1, len(x_array) - 1) - 1
+        t = (x - x_array[i])[:, np.newaxis]
+        rows = self.coeffs[i]
+        values = rows[:, 0]
+        for power in range(1, rows.shape[1]):
+            values = values * t + rows[:, power]
+        natural = self.__natural
+        values = np.where(
+            (x < x_array[0])[:, np.newaxis] & ~natural, self.__first, values
+        )
+        values = np.where(
+            (x > x_array[-1])[:, np.newaxis] & ~natural, self.__last, values
+        )
+        return values.T
+
+
 def funcify_method(*args, **kwargs):  # pylint: disable=too-many-statements
     """Decorator factory to wrap methods as Function objects and save them as
     cached properties.
@@ -5,7 +5,7 @@ from functools import cached_property
 
 import numpy as np
 
-from ..mathutils.function import Function, funcify_method
+from ..mathutils.function import Function, FunctionBundle, funcify_method
 from ..plots.motor_plots import _MotorPlots
 from ..prints.motor_prints import _MotorPrints
 from ..tools import parallel_axis_theorem_from_com, tuple_handler
@@ -402,9 +402,10 @@ class Motor(ABC):
         Function
             Total propellant mass as a function of time.
         """
+        # List based, so that the mass properties derived from it are as well
         return (
             self.total_mass_flow_rate.integral_function() + self.propellant_initial_mass
-        )
+        ).set_grid_merging()
 
     @funcify_method("Time (s)", "Mass flow rate (kg/s)", extrapolation="zero")
     def total_mass_flow_rate(self):
@@ -816,6 +817,38 @@ class Motor(ABC):
         https://en.wikipedia.org/wiki/Moment_of_inertia
         """
 
+    def bundle(self, *properties):
+        """Bundle of time dependent properties of the motor, which evaluates
+        all of them at once with a single search of the time grid.
+
+        Parameters
+        ----------
+        *properties : str
+            Names of the properties to be bundled. Default are the mass
+            properties: "total_mass", "propellant_mass", "center_of_mass",
+            "I_11", "I_22" and "I_33".
+
+        Returns
+        -------
+        FunctionBundle
+            Bundle of the properties, in the given order.
+
+        Raises
+        ------
+        ValueError
+            If the properties are not given by datasets over the same time
+            grid, as for motors given by callables.
+        """
+        properties = properties or (
+            "total_mass",
+            "propellant_mass",
+            "center_of_mass",
+            "I_11",
+            "I_22",
+            "I_33",
+        )
+        return FunctionBundle([getattr(self, name) for name in properties])
+
     @staticmethod
     def reshape_thrust_curve(thrust, new_burn_time, total_impulse):
         """Transforms the thrust curve supplied by changing its total
@@ -561,6 +561,9 @@ class SolidMotor(Motor):
             self.interpolate,
             "constant",
         )
+        # Keep the mass properties derived from the geometry list based
+        self.grain_inner_radius.set_grid_merging()
+        self.grain_height.set_grid_merging()
 
         reset_funcified_methods(self)
 
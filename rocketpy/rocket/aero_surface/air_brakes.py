@@ -106,6 +106,9 @@ class AirBrakes(AeroSurface):
             inputs=["Deployment Level", "Mach"],
             outputs="Drag Coefficient",
         )
+        if self.drag_coefficient.is_regular_grid():
+            # Much faster than shepard, which is evaluated at every step
+            self.drag_coefficient.set_interpolation("regular_grid")
         self.clamp = clamp
         self.override_rocket_drag = override_rocket_drag
         self.initial_deployment_level = deployment_level
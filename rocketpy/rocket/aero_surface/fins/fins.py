@@ -265,16 +265,13 @@ class Fins(AeroSurface):
 
         # Lift coefficient derivative for a single fin
         def lift_source(mach):
+            planform = planform_correlation_parameter.get_value_opt(mach)
             return (
-                clalpha2D(mach)
-                * planform_correlation_parameter(mach)
+                clalpha2D.get_value_opt(mach)
+                * planform
                 * (self.Af / self.ref_area)
                 * np.cos(self.gamma_c)
-            ) / (
-                2
-                + planform_correlation_parameter(mach)
-                * np.sqrt(1 + (2 / planform_correlation_parameter(mach)) ** 2)
-            )
+            ) / (2 + planform * np.sqrt(1 + (2 / planform) ** 2))
 
         self.clalpha_single_fin = Function(
             lift_source,
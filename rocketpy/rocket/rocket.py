@@ -1350,6 +1350,7 @@ class Rocket:
         return_controller=False,
         name="AirBrakes",
         controller_name="AirBrakes Controller",
+        history_length=None,
     ):
         """Creates a new air brakes system, storing its parameters such as
         drag coefficient curve, controller function, sampling rate, and
@@ -1447,6 +1448,12 @@ class Rocket:
         controller_name : string, optional
             Controller name. Has no impact in simulation, as it is only used to
             display data in a more organized matter.
+        history_length : int, optional
+            If given, only the last `history_length` states and observed
+            variables are passed to the controller function, as NumPy arrays,
+            and the observed variables are stored in a preallocated array.
+            Default is None, which passes the whole history as lists. See
+            `rocketpy.control._Controller` for more information.
 
         Returns
         -------
@@ -1470,6 +1477,7 @@ class Rocket:
             sampling_rate=sampling_rate,
             initial_observed_variables=initial_observed_variables,
             name=controller_name,
+            history_length=history_length,
         )
         self.air_brakes.append(air_brakes)
         self._add_controllers(_controller)
@@ -1,3 +1,6 @@
+from .checkpoint import FlightCheckpoint
+from .events import FlightEvent
 from .flight import Flight
+from .flight_batch import FlightBatch
 from .flight_data_importer import FlightDataImporter
 from .monte_carlo import MonteCarlo
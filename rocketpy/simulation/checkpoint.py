@@ -0,0 +1,108 @@
+"""Checkpoints of a Flight simulation, from which new flights can be branched.
+
+A checkpoint freezes a simulated flight at a given instant: the state vector,
+the flight phases up to that instant, the parachutes that were not triggered
+yet and the state of the controllers. A branched flight continues from the
+checkpoint, possibly with a different recovery or controller configuration,
+instead of integrating the whole trajectory again.
+"""
+
+
+class FlightCheckpoint:
+    """State of a Flight at a given instant of its simulation. Checkpoints
+    are created with ``Flight.checkpoint`` and used by ``Flight.branch``.
+
+    Attributes
+    ----------
+    FlightCheckpoint.flight : Flight
+        Flight from which the checkpoint was taken.
+    FlightCheckpoint.t : float
+        Time of the checkpoint, in seconds.
+    FlightCheckpoint.index : int
+        Index of the checkpoint state in the solution of the flight.
+    FlightCheckpoint.state : np.ndarray
+        State vector at the checkpoint: [x, y, z, vx, vy, vz, e0, e1, e2,
+        e3, omega1, omega2, omega3].
+    FlightCheckpoint.parachutes : list[Parachute]
+        Parachutes that had not been triggered at the checkpoint.
+    FlightCheckpoint.controllers : list[_Controller]
+        Controllers of the flight.
+    FlightCheckpoint.phases : list[tuple]
+        Flight phases that started before the checkpoint, as tuples of
+        initial time, name of the derivative method and callbacks.
+    FlightCheckpoint.derivative : str
+        Name of the derivative method of the flight phase at the checkpoint.
+    FlightCheckpoint.callbacks : list[callable]
+        Callbacks of the flight phase at the checkpoint.
+    FlightCheckpoint.inflations : list[tuple]
+        Parachutes triggered before the checkpoint and inflated after it, as
+        tuples of inflation time and drag coefficient times reference area.
+    FlightCheckpoint.parachute_events : list
+        Parachute events up to the checkpoint.
+    FlightCheckpoint.triggered_events : list
+        Triggered events up to the checkpoint.
+    FlightCheckpoint.monitors : dict
+        Rail exit and apogee data, if they happened up to the checkpoint.
+    FlightCheckpoint.observed_variables : list[tuple]
+        Controllers and their observed variables at the checkpoint.
+    FlightCheckpoint.air_brakes_levels : list[tuple]
+        Air brakes and their deployment level at the checkpoint.
+    FlightCheckpoint.controller_states : list[tuple]
+        Controller states saved by the flight before the checkpoint.
+    FlightCheckpoint.post_processed_variables : np.ndarray
+        Post-processed variables up to the checkpoint, only for controlled
+        flights.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        flight,
+        index,
+        parachutes,
+        controllers,
+        phases,
+        derivative,
+        callbacks,
+        inflations,
+        parachute_events,
+        triggered_events,
+        monitors,
+        observed_variables,
+        air_brakes_levels,
+        controller_states,
+        post_processed_variables,
+    ):
+        """Create a checkpoint. Use ``Flight.checkpoint`` instead of calling
+        this constructor directly.
+
+        Parameters
+        ----------
+        See the attributes of the class.
+
+        Returns
+        -------
+        None
+        """
+        self.flight = flight
+        self.index = index
+        self.t = flight.solution[index][0]
+        self.state = flight.solution[index][1:].copy()
+        self.parachutes = parachutes
+        self.controllers = controllers
+        self.phases = phases
+        self.derivative = derivative
+        self.callbacks = callbacks
+        self.inflations = inflations
+        self.parachute_events = parachute_events
+        self.triggered_events = triggered_events
+        self.monitors = monitors
+        self.observed_variables = observed_variables
+        self.air_brakes_levels = air_brakes_levels
+        self.controller_states = controller_states
+        self.post_processed_variables = post_processed_variables
+
+    def __repr__(self):
+        return (
+            f"<FlightCheckpoint(flight= {self.flight.name}, t= {self.t}, "
+            f"parachutes= {[parachute.name for parachute in self.parachutes]})>"
+        )
@@ -0,0 +1,308 @@
+"""Events detected during the integration of the Flight equations of motion.
+
+An event is described by a function ``g(t, u)`` of the time and of the state
+vector. The event happens whenever ``g`` crosses zero. After each solver step,
+every active event function is evaluated once at the end of the step and
+compared with the sign it had at the end of the previous steps. Events whose
+functions are linear in the state vector, such as the built-in apogee and
+impact events, are evaluated together with a single matrix product. Only the
+events whose sign changed are then located precisely, by root finding on the
+dense output of the step.
+"""
+
+import numpy as np
+from scipy.optimize import brentq
+
+
+class FlightEvent:
+    """Event that may happen during a flight simulation, such as the rocket
+    reaching a given altitude or crossing Mach 1.
+
+    Attributes
+    ----------
+    FlightEvent.name : str
+        Name of the event.
+    FlightEvent.function : callable
+        Event function ``g(t, u)``. The event happens when it crosses zero.
+    FlightEvent.direction : int
+        Direction of the zero crossing that triggers the event.
+    FlightEvent.terminal : bool
+        Whether the simulation stops when the event happens.
+
+    Examples
+    --------
+    Stop the simulation when the rocket reaches 3000 m above sea level:
+
+    >>> from rocketpy.simulation import FlightEvent
+    >>> altitude = FlightEvent(
+    ...     "3000 m", lambda t, u: u[2] - 3000, direction=1, terminal=True
+    ... )
+
+    Register the instants in which the vertical speed crosses 100 m/s, in any
+    direction, without stopping the simulation:
+
+    >>> vz_100 = FlightEvent("vz = 100 m/s", lambda t, u: u[5] - 100)
+
+    The same events can be created as linear events, which are cheaper to
+    detect:
+
+    >>> altitude = FlightEvent.linear(
+    ...     "3000 m", {2: 1}, 3000, direction=1, terminal=True
+    ... )
+    >>> vz_100 = FlightEvent.linear("vz = 100 m/s", {5: 1}, 100)
+    """
+
+    def __init__(self, name, function, direction=0, terminal=False):
+        """Create an event.
+
+        Parameters
+        ----------
+        name : str
+            Name of the event, used to identify it in
+            ``Flight.triggered_events``.
+        function : callable
+            Event function ``g(t, u)``, where ``t`` is the time in seconds and
+            ``u`` is the state vector [x, y, z, vx, vy, vz, e0, e1, e2, e3,
+            omega1, omega2, omega3]. It must return a float. The event
+            happens when the function crosses zero.
+        direction : int, optional
+            Direction of the zero crossing that triggers the event. If 1,
+            only crossings from negative to positive values trigger the
+            event. If -1, only crossings from positive to negative values
+            trigger it. If 0, both do. Default is 0.
+        terminal : bool, optional
+            If True, the simulation stops at the event. Default is False.
+
+        Returns
+        -------
+        None
+        """
+        if direction not in (-1, 0, 1):
+            raise ValueError("Event direction must be -1, 0 or 1.")
+        self.name = name
+        self.function = function
+        self.direction = direction
+        self.terminal = terminal
+
+    @classmethod
+    def linear(cls, name, coefficients, value=0, direction=0, terminal=False):
+        """Create an event whose function is linear in the state vector,
+        ``g(t, u) = coefficients · u - value``. The functions of all linear
+        events of a flight are evaluated together, with a single matrix
+        product per step.
+
+        Parameters
+        ----------
+        name : str
+            Name of the event.
+        coefficients : dict or array_like
+            Coefficients of the state variables [x, y, z, vx, vy, vz, e0, e1,
+            e2, e3, omega1, omega2, omega3], either as a sequence of 13
+            values or as a dict mapping the index of a state variable to its
+            coefficient. Missing indexes have a null coefficient.
+        value : float, optional
+            Value of ``coefficients · u`` at which the event happens. Default
+            is 0.
+        direction : int, optional
+            Direction of the zero crossing that triggers the event. See
+            ``FlightEvent.__init__``. Default is 0.
+        terminal : bool, optional
+            If True, the simulation stops at the event. Default is False.
+
+        Returns
+        -------
+        FlightEvent
+            The linear event.
+        """
+        return cls(name, _LinearEventFunction(coefficients, value), direction, terminal)
+
+    def __repr__(self):
+        return (
+            f"<FlightEvent(name= {self.name}, direction= {self.direction}, "
+            f"terminal= {self.terminal})>"
+        )
+
+
+class _LinearEventFunction:
+    """Event function ``g(t, u) = coefficients · u - value``, linear in the
+    state vector."""
+
+    def __init__(self, coefficients, value):
+        if isinstance(coefficients, dict):
+            indexes, coefficients = list(coefficients), list(coefficients.values())
+            self.coefficients = np.zeros(13)
+            self.coefficients[indexes] = coefficients
+        else:
+            self.coefficients = np.array(coefficients, dtype=float)
+        if self.coefficients.shape != (13,):
+            raise ValueError(
+                "Linear events need one coefficient for each of the 13 state "
+                "variables."
+            )
+        self.value = float(value)
+
+    def __call__(self, t, u):
+        return float(self.coefficients @ np.asarray(u, dtype=float) - self.value)
+
+
+class _EventDetector:
+    """Detects and locates the zero crossings of a list of events along the
+    steps of an ODE solver. Events can be deactivated, after which their
+    functions are no longer evaluated.
+
+    The detector keeps the last nonzero sign of each event function. An event
+    whose function is exactly zero at the start of the detection is crossed
+    as soon as the function leaves zero towards the side of its direction,
+    while an event that was triggered exactly at a root only takes the sign
+    of its next nonzero value.
+    """
+
+    def __init__(self, events):
+        """Create the detector.
+
+        Parameters
+        ----------
+        events : list[FlightEvent]
+            Events to be detected.
+        """
+        self.events = list(events)
+        self.directions = np.array([event.direction for event in self.events])
+        self.active = np.ones(len(self.events), dtype=bool)
+        self.values = np.zeros(len(self.events))
+        self.signs = np.zeros(len(self.events))
+        linear = [
+            isinstance(event.function, _LinearEventFunction) for event in self.events
+        ]
+        self.__linear = np.flatnonzero(linear)
+        self.__general = np.flatnonzero(np.logical_not(linear))
+        self.__coefficients = np.array(
+            [self.events[i].function.coefficients for i in self.__linear]
+        ).reshape(-1, 13)
+        self.__offsets = np.array(
+            [self.events[i].function.value for i in self.__linear]
+        )
+
+    def evaluate(self, t, u):
+        """Evaluate the functions of all active events.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds.
+        u : array
+            State vector.
+
+        Returns
+        -------
+        np.ndarray
+            Value of every event function. Inactive events are zero.
+        """
+        values = np.zeros(len(self.events))
+        if len(self.__linear):
+            values[self.__linear] = (
+                self.__coefficients @ np.asarray(u, dtype=float) - self.__offsets
+            )
+        for i in self.__general[self.active[self.__general]]:
+            values[i] = self.events[i].function(t, u)
+        values[~self.active] = 0
+        return values
+
+    def reset(self, t, u, triggered=()):
+        """Restart the detection from the given time and state. Used when
+        the integration restarts, at the start of each flight phase.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds.
+        u : array
+            State vector.
+        triggered : iterable, optional
+            Events that were triggered exactly at ``t``. They are considered
+            to be at their root so that they are not triggered again.
+        """
+        self.values = self.evaluate(t, u)
+        self.signs = np.sign(self.values)
+        for event in triggered:
+            i = self.events.index(event)
+            self.values[i] = 0
+            self.signs[i] = np.nan
+
+    def deactivate(self, event):
+        """Stop detecting an event.
+
+        Parameters
+        ----------
+        event : FlightEvent
+            Event to be deactivated.
+        """
+        self.active[self.events.index(event)] = False
+
+    def check(self, t, u):
+        """Evaluate every active event function at the end of a step and
+        compare it with the value at the end of the previous step.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds at the end of the step.
+        u : array
+            State vector at the end of the step.
+
+        Returns
+        -------
+        list[tuple]
+            Tuples (index, value_before, value_after) of the events crossed
+            during the step.
+        """
+        before, after = self.values, self.evaluate(t, u)
+        sign = np.sign(after)
+        up = ((self.signs < 0) & (sign >= 0)) | ((self.signs == 0) & (sign > 0))
+        down = ((self.signs > 0) & (sign <= 0)) | ((self.signs == 0) & (sign < 0))
+        # Events crossed onto an exact root wait for their next nonzero value
+        self.signs = np.where(sign != 0, sign, np.where(up | down, np.nan, self.signs))
+        self.values = after
+        crossed = self.active & (
+            (up & (self.directions >= 0)) | (down & (self.directions <= 0))
+        )
+        return [(i, before[i], after[i]) for i in np.flatnonzero(crossed)]
+
+    def locate(self, crossed, interpolator, t_old, t):
+        """Locate the crossed events inside a step.
+
+        Parameters
+        ----------
+        crossed : list[tuple]
+            Crossed events, as returned by ``check``.
+        interpolator : callable
+            Dense output of the step, returning the state at a given time.
+        t_old : float
+            Time at the start of the step.
+        t : float
+            Time at the end of the step.
+
+        Returns
+        -------
+        list[tuple]
+            Tuples (event, t_event, u_event), sorted by the event time.
+        """
+        located = []
+        for i, before, after in crossed:
+            function = self.events[i].function
+
+            def g(time, function=function):
+                return function(time, interpolator(time))
+
+            if after == 0:
+                t_event = t
+            else:
+                g_old, g_new = g(t_old), g(t)
+                if g_old * g_new < 0:
+                    t_event = brentq(g, t_old, t)
+                else:
+                    # The interpolant does not bracket the root, which may
+                    # happen when the step was restarted. Assume g is linear.
+                    t_event = t_old + (t - t_old) * before / (before - after)
+            located.append((self.events[i], t_event, interpolator(t_event)))
+        located.sort(key=lambda item: item[1])
+        return located
@@ -1,26 +1,36 @@
 # pylint: disable=too-many-lines
+import json
 import math
 import warnings
-from copy import deepcopy
-from functools import cached_property
+from copy import copy, deepcopy
+from functools import cached_property, partial
 
 import numpy as np
 import simplekml
-from scipy import integrate
 
-from ..mathutils.function import Function, funcify_method
+from ..mathutils.function import Function, FunctionBundle, funcify_method
 from ..mathutils.vector_matrix import Matrix, Vector
 from ..plots.flight_plots import _FlightPlots
 from ..prints.flight_prints import _FlightPrints
 from ..tools import (
-    calculate_cubic_hermite_coefficients,
+    GrowableArray,
     find_closest,
-    find_root_linear_interpolation,
-    find_roots_cubic_function,
     quaternions_to_nutation,
     quaternions_to_precession,
     quaternions_to_spin,
 )
+from .checkpoint import FlightCheckpoint
+from .events import FlightEvent, _EventDetector
+from .flight_archive import (
+    ATMOSPHERE_COLUMNS,
+    _ArchivedEnvironment,
+    _ArchivedRocket,
+    archive_parachute,
+    restore_parachute,
+)
+from .flight_kernel import _evaluate_array, _FlightKernel, _FunctionKernel
+from .integrators import create_solver, get_integrator, get_integrator_name
+from .scheduler import _SamplingScheduler
 
 
 class Flight:  # pylint: disable=too-many-public-methods
@@ -82,8 +92,10 @@ class Flight:  # pylint: disable=too-many-public-methods
         time in some cases.
     Flight.terminate_on_apogee : bool
         Whether to terminate simulation when rocket reaches apogee.
-    Flight.solver : scipy.integrate.LSODA
-        Scipy LSODA integration scheme.
+    Flight.integrator : str, dict
+        Integrator used in each flight phase. See Flight.__init__.
+    Flight.solver : scipy.integrate.OdeSolver
+        Integration scheme of the last simulated flight phase.
     Flight.x : Function
         Rocket's X coordinate (positive east) as a function of time.
     Flight.y : Function
@@ -132,9 +144,10 @@ class Flight:  # pylint: disable=too-many-public-methods
         e2_init, e3_init, w1_init, w2_init, w3_init]
     Flight.t_initial : int, float
         Initial simulation time in seconds. Usually 0.
-    Flight.solution : list
-        Solution array which keeps results from each numerical
-        integration.
+    Flight.solution : GrowableArray
+        Solution buffer which keeps results from each numerical
+        integration. It behaves as a list of rows [t, x, y, z, vx, vy, vz,
+        e0, e1, e2, e3, w1, w2, w3], each row being a numpy array.
     Flight.t : float
         Current integration time.
     Flight.y : list
@@ -183,6 +196,11 @@ class Flight:  # pylint: disable=too-many-public-methods
         impacts the ground.
     Flight.parachute_events : array
         List that stores parachute events triggered during flight.
+    Flight.events : list
+        List of additional FlightEvent objects detected during the flight.
+    Flight.triggered_events : list
+        List of [t, event, state] for every event triggered during the
+        flight, including rail exit, apogee and impact.
     Flight.function_evaluations : array
         List that stores number of derivative function evaluations
         during numerical integration in cumulative manner.
@@ -504,6 +522,9 @@ class Flight:  # pylint: disable=too-many-public-methods
         verbose=False,
         name="Flight",
         equations_of_motion="standard",
+        kernel="standard",
+        integrator="LSODA",
+        events=None,
     ):
         """Run a trajectory simulation.
 
@@ -524,7 +545,7 @@ class Flight:  # pylint: disable=too-many-public-methods
         heading : int, float, optional
             Heading angle relative to north given in degrees.
             Default is 90, which points in the x direction.
-        initial_solution : array, Flight, optional
+        initial_solution : array, Flight, FlightCheckpoint, optional
             Initial solution array to be used. Format is:
 
             .. code-block:: python
@@ -538,7 +559,9 @@ class Flight:  # pylint: disable=too-many-public-methods
                 ]
 
             If a Flight object is used, the last state vector will be
-            used as initial solution. If None, the initial solution will start
+            used as initial solution. If a FlightCheckpoint is used, the
+            flight continues from the checkpoint and keeps the solution of
+            the checkpointed flight up to it, see Flight.branch. If None, the initial solution will start
             with all null values, except for the euler parameters which will be
             calculated based on given values of inclination and heading.
             Default is None.
@@ -579,6 +602,31 @@ class Flight:  # pylint: disable=too-many-public-methods
             more restricted set of equations of motion that only works for
             solid propulsion rockets. Such equations were used in RocketPy v0
             and are kept here for backwards compatibility.
+        kernel : str, optional
+            How the "standard" equations of motion are evaluated. Can be
+            "standard" or "compiled". The "compiled" kernel samples every
+            motor, atmosphere and aerodynamic Function into flat tables before
+            the integration starts and then evaluates the derivatives from
+            those tables, which is considerably faster at the cost of a small
+            interpolation error. Default is "standard".
+        integrator : str, dict, optional
+            ODE integrator used to solve the equations of motion. Can be
+            "LSODA", "RK45", "DOP853", "Radau" or "RK4", the latter being a
+            fixed step Runge-Kutta method that uses max_time_step as its step
+            (0.01 s if max_time_step is not set). A different integrator can
+            be chosen for each flight phase by passing a dictionary with any
+            of the keys "rail", "powered", "coast" and "parachute", for
+            example ``{"parachute": "RK45"}``. Phases not present in the
+            dictionary use "LSODA". If "powered" and "coast" use different
+            integrators, the flight phase is split at motor burn out.
+            Default is "LSODA".
+        events : list[FlightEvent], optional
+            Additional events to be detected during the simulation, such as
+            reaching a given altitude or crossing Mach 1. Each event is
+            located by root finding on the solver's dense output and stored
+            in ``Flight.triggered_events``. Terminal events stop the
+            simulation. Rail exit, apogee and impact are always detected.
+            Default is None.
 
         Returns
         -------
@@ -603,6 +651,9 @@ class Flight:  # pylint: disable=too-many-public-methods
         self.terminate_on_apogee = terminate_on_apogee
         self.name = name
         self.equations_of_motion = equations_of_motion
+        self.kernel = kernel
+        self.integrator = integrator
+        self.events = list(events or [])
 
         # Controller initialization
         self.__init_controllers()
@@ -610,14 +661,12 @@ class Flight:  # pylint: disable=too-many-public-methods
         # Flight initialization
         self.__init_solution_monitors()
         self.__init_equations_of_motion()
+        self.__init_integrators()
         self.__init_solver_monitors()
+        self.__init_events()
 
         # Create known flight phases
-        self.flight_phases = self.FlightPhases()
-        self.flight_phases.add_phase(
-            self.t_initial, self.initial_derivative, clear=False
-        )
-        self.flight_phases.add_phase(self.max_time)
+        self.__init_flight_phases()
 
         # Simulate flight
         self.__simulate(verbose)
@@ -639,17 +688,36 @@ class Flight:  # pylint: disable=too-many-public-methods
     # pylint: disable=too-many-nested-blocks, too-many-branches, too-many-locals,too-many-statements
     def __simulate(self, verbose):
         """Simulate the flight trajectory."""
-        for phase_index, phase in self.time_iterator(self.flight_phases):
+        for phase_index, phase in self.time_iterator(
+            self.flight_phases, self.__initial_phase_index
+        ):
             # Determine maximum time for this flight phase
             phase.time_bound = self.flight_phases[phase_index + 1].t
+            phase_kind = self.__get_phase_kind(phase)
+            if (
+                phase_kind == "powered"
+                and self.__split_at_burn_out
+                and phase.time_bound > self.rocket.motor.burn_out_time
+            ):
+                # Continue with the coast integrator after burn out
+                self.flight_phases.add_phase(
+                    self.rocket.motor.burn_out_time,
+                    phase.derivative,
+                    phase.callbacks,
+                    clear=False,
+                    index=phase_index + 1,
+                    name=phase.name,
+                )
+                phase.time_bound = self.flight_phases[phase_index + 1].t
 
             # Evaluate callbacks
             for callback in phase.callbacks:
                 callback(self)
 
-            # Create solver for this flight phase # TODO: allow different integrators
+            # Create solver for this flight phase
             self.function_evaluations.append(0)
-            phase.solver = integrate.LSODA(
+            phase.solver = create_solver(
+                self.__phase_integrators[phase_kind],
                 phase.derivative,
                 t0=phase.t,
                 y0=self.y_sol,
@@ -659,41 +727,36 @@ class Flight:  # pylint: disable=too-many-public-methods
                 rtol=self.rtol,
                 atol=self.atol,
             )
+            self.solver = phase.solver
+            # Restart event detection from the start of this flight phase
+            self.__event_detector.reset(
+                phase.t,
+                self.y_sol,
+                triggered=[
+                    event for t, event, _ in self.triggered_events if t == phase.t
+                ],
+            )
 
-            # Initialize phase time nodes
-            phase.time_nodes = self.TimeNodes()
-            # Add first time node to the time_nodes list
-            phase.time_nodes.add_node(phase.t, [], [])
-            # Add non-overshootable parachute time nodes
-            if self.time_overshoot is False:
-                # TODO: move parachutes to controllers
-                phase.time_nodes.add_parachutes(
-                    self.parachutes, phase.t, phase.time_bound
-                )
-                phase.time_nodes.add_controllers(
-                    self._controllers, phase.t, phase.time_bound
-                )
-            # Add last time node to the time_nodes list
-            phase.time_nodes.add_node(phase.time_bound, [], [])
-            # Organize time nodes with sort() and merge()
-            phase.time_nodes.sort()
-            phase.time_nodes.merge()
-            # Clear triggers from first time node if necessary
-            if phase.clear:
-                phase.time_nodes[0].parachutes = []
-                phase.time_nodes[0].callbacks = []
+            # Initialize phase time nodes, with non-overshootable parachute
+            # and controller sampling nodes generated as they are reached
+            # TODO: move parachutes to controllers
+            phase.time_nodes = _SamplingScheduler(
+                self.TimeNodes.TimeNode,
+                phase.t,
+                phase.time_bound,
+                [] if self.time_overshoot else self.parachutes,
+                [] if self.time_overshoot else self._controllers,
+            )
 
             # Iterate through time nodes
-            for node_index, node in self.time_iterator(phase.time_nodes):
-                # Determine time bound for this time node
-                node.time_bound = phase.time_nodes[node_index + 1].t
-                # NOTE: Setting the time bound and status for the phase solver,
-                # and updating its internal state for the next integration step.
+            for node_index, node in enumerate(phase.time_nodes):
+                # Clear triggers from first time node if necessary
+                if node_index == 0 and phase.clear:
+                    node.parachutes = []
+                    node.callbacks = []
+                # NOTE: Setting the time bound and status for the phase solver
+                # for the next integration step.
                 phase.solver.t_bound = node.time_bound
-                phase.solver._lsoda_solver._integrator.rwork[0] = phase.solver.t_bound
-                phase.solver._lsoda_solver._integrator.call_args[4] = (
-                    phase.solver._lsoda_solver._integrator.rwork
-                )
                 phase.solver.status = "running"
 
                 # Feed required parachute and discrete controller triggers
@@ -703,6 +766,8 @@ class Flight:  # pylint: disable=too-many-public-methods
 
                 for controller in node._controllers:
                     controller(self.t, self.y_sol, self.solution)
+                if node._controllers:
+                    self.__save_controller_state(node.t)
 
                 for parachute in node.parachutes:
                     # Calculate and save pressure signal
@@ -725,6 +790,7 @@ class Flight:  # pylint: disable=too-many-public-methods
                                 phase.derivative,
                                 clear=True,
                                 index=phase_index + i,
+                                name=phase.name,
                             )
                             i += 1
                         # Create flight phase for time after inflation
@@ -741,8 +807,7 @@ class Flight:  # pylint: disable=too-many-public-methods
                             index=phase_index + i,
                         )
                         # Prepare to leave loops and start new flight phase
-                        phase.time_nodes.flush_after(node_index)
-                        phase.time_nodes.add_node(self.t, [], [])
+                        phase.time_nodes.stop()
                         phase.solver.status = "finished"
                         # Save parachute event
                         self.parachute_events.append([self.t, parachute])
@@ -751,7 +816,7 @@ class Flight:  # pylint: disable=too-many-public-methods
                 while phase.solver.status == "running":
                     # Execute solver step, log solution and function evaluations
                     phase.solver.step()
-                    self.solution += [[phase.solver.t, *phase.solver.y]]
+                    self.solution.append([phase.solver.t, *phase.solver.y])
                     self.function_evaluations.append(phase.solver.nfev)
 
                     # Update time and state
@@ -760,257 +825,166 @@ class Flight:  # pylint: disable=too-many-public-methods
                     if verbose:
                         print(f"Current Simulation Time: {self.t:3.4f} s", end="\r")
 
-                    # Check for first out of rail event
-                    if len(self.out_of_rail_state) == 1 and (
-                        self.y_sol[0] ** 2
-                        + self.y_sol[1] ** 2
-                        + (self.y_sol[2] - self.env.elevation) ** 2
-                        >= self.effective_1rl**2
-                    ):
-                        # Check exactly when it went out using root finding
-                        # Disconsider elevation
-                        self.solution[-2][3] -= self.env.elevation
-                        self.solution[-1][3] -= self.env.elevation
-                        # Get points
-                        y0 = (
-                            sum(self.solution[-2][i] ** 2 for i in [1, 2, 3])
-                            - self.effective_1rl**2
-                        )
-                        yp0 = 2 * sum(
-                            self.solution[-2][i] * self.solution[-2][i + 3]
-                            for i in [1, 2, 3]
-                        )
-                        t1 = self.solution[-1][0] - self.solution[-2][0]
-                        y1 = (
-                            sum(self.solution[-1][i] ** 2 for i in [1, 2, 3])
-                            - self.effective_1rl**2
-                        )
-                        yp1 = 2 * sum(
-                            self.solution[-1][i] * self.solution[-1][i + 3]
-                            for i in [1, 2, 3]
-                        )
-                        # Put elevation back
-                        self.solution[-2][3] += self.env.elevation
-                        self.solution[-1][3] += self.env.elevation
-                        # Cubic Hermite interpolation (ax**3 + bx**2 + cx + d)
-                        a, b, c, d = calculate_cubic_hermite_coefficients(
-                            0,
-                            float(phase.solver.step_size),
-                            y0,
-                            yp0,
-                            y1,
-                            yp1,
-                        )
-                        a += 1e-5  # TODO: why??
-                        # Find roots
-                        t_roots = find_roots_cubic_function(a, b, c, d)
-                        # Find correct root
-                        valid_t_root = [
-                            t_root.real
-                            for t_root in t_roots
-                            if 0 < t_root.real < t1 and abs(t_root.imag) < 0.001
-                        ]
-                        if len(valid_t_root) > 1:
-                            raise ValueError(
-                                "Multiple roots found when solving for rail exit time."
-                            )
-                        if len(valid_t_root) == 0:
-                            raise ValueError(
-                                "No valid roots found when solving for rail exit time."
-                            )
-                        # Determine final state when upper button is going out of rail
-                        self.t = valid_t_root[0] + self.solution[-2][0]
+                    # Check for events, evaluating all event functions once
+                    interpolator = None
+                    crossed_events = self.__event_detector.check(self.t, self.y_sol)
+                    if crossed_events:
                         interpolator = phase.solver.dense_output()
-                        self.y_sol = interpolator(self.t)
-                        self.solution[-1] = [self.t, *self.y_sol]
-                        self.out_of_rail_time = self.t
-                        self.out_of_rail_time_index = len(self.solution) - 1
-                        self.out_of_rail_state = self.y_sol
-                        # Create new flight phase
-                        self.flight_phases.add_phase(
-                            self.t,
-                            self.u_dot_generalized,
-                            index=phase_index + 1,
+                        located_events = self.__event_detector.locate(
+                            crossed_events, interpolator, phase.solver.t_old, self.t
                         )
-                        # Prepare to leave loops and start new flight phase
-                        phase.time_nodes.flush_after(node_index)
-                        phase.time_nodes.add_node(self.t, [], [])
-                        phase.solver.status = "finished"
-
-                    # Check for apogee event
-                    # TODO: negative vz doesn't really mean apogee. Improve this.
-                    if len(self.apogee_state) == 1 and self.y_sol[5] < 0:
-                        # Assume linear vz(t) to detect when vz = 0
-                        t0, vz0 = self.solution[-2][0], self.solution[-2][6]
-                        t1, vz1 = self.solution[-1][0], self.solution[-1][6]
-                        t_root = find_root_linear_interpolation(t0, t1, vz0, vz1, 0)
-                        # Fetch state at t_root
-                        interpolator = phase.solver.dense_output()
-                        self.apogee_state = interpolator(t_root)
-                        # Store apogee data
-                        self.apogee_time = t_root
-                        self.apogee_x = self.apogee_state[0]
-                        self.apogee_y = self.apogee_state[1]
-                        self.apogee = self.apogee_state[2]
-
-                        if self.terminate_on_apogee:
-                            self.t = self.t_final = t_root
+                    else:
+                        located_events = []
+                    for event, t_event, state in located_events:
+                        self.triggered_events.append([t_event, event, state])
+                        if event is self.__rail_exit_event:
+                            # Determine state when upper button goes out of rail
+                            self.t = t_event
+                            self.y_sol = state
+                            self.solution[-1] = [self.t, *self.y_sol]
+                            self.out_of_rail_time = self.t
+                            self.out_of_rail_time_index = len(self.solution) - 1
+                            self.out_of_rail_state = self.y_sol
+                            self.__event_detector.deactivate(event)
+                            # Create new flight phase
+                            self.flight_phases.add_phase(
+                                self.t,
+                                self.u_dot_generalized,
+                                index=phase_index + 1,
+                                name="u_dot_generalized",
+                            )
+                        elif event is self.__apogee_event:
+                            # Store apogee data
+                            self.apogee_state = state
+                            self.apogee_time = t_event
+                            self.apogee_x = self.apogee_state[0]
+                            self.apogee_y = self.apogee_state[1]
+                            self.apogee = self.apogee_state[2]
+                            self.__event_detector.deactivate(event)
+                            if not event.terminal and len(self.solution) > 2:
+                                # adding the apogee state to solution increases
+                                # accuracy, we can only do this if the apogee is
+                                # not the first state
+                                self.solution.insert(-1, [t_event, *self.apogee_state])
+                        if event is self.__impact_event:
+                            # Save impact state
+                            self.impact_state = state
+                            self.x_impact = self.impact_state[0]
+                            self.y_impact = self.impact_state[1]
+                            self.z_impact = self.impact_state[2]
+                            self.impact_velocity = self.impact_state[5]
+                        if event.terminal:
                             # Roll back solution
-                            self.solution[-1] = [self.t, *self.apogee_state]
+                            self.t = self.t_final = t_event
+                            self.y_sol = state
+                            self.solution[-1] = [self.t, *self.y_sol]
                             # Set last flight phase
                             self.flight_phases.flush_after(phase_index)
                             self.flight_phases.add_phase(self.t)
+                        if event is self.__rail_exit_event or event.terminal:
                             # Prepare to leave loops and start new flight phase
-                            phase.time_nodes.flush_after(node_index)
-                            phase.time_nodes.add_node(self.t, [], [])
+                            phase.time_nodes.stop()
                             phase.solver.status = "finished"
-                        elif len(self.solution) > 2:
-                            # adding the apogee state to solution increases accuracy
-                            # we can only do this if the apogee is not the first state
-                            self.solution.insert(-1, [t_root, *self.apogee_state])
-                    # Check for impact event
-                    if self.y_sol[2] < self.env.elevation:
-                        # Check exactly when it happened using root finding
-                        # Cubic Hermite interpolation (ax**3 + bx**2 + cx + d)
-                        a, b, c, d = calculate_cubic_hermite_coefficients(
-                            x0=0,  # t0
-                            x1=float(phase.solver.step_size),  # t1 - t0
-                            y0=float(self.solution[-2][3] - self.env.elevation),  # z0
-                            yp0=float(self.solution[-2][6]),  # vz0
-                            y1=float(self.solution[-1][3] - self.env.elevation),  # z1
-                            yp1=float(self.solution[-1][6]),  # vz1
-                        )
-                        # Find roots
-                        t_roots = find_roots_cubic_function(a, b, c, d)
-                        # Find correct root
-                        t1 = self.solution[-1][0] - self.solution[-2][0]
-                        valid_t_root = [
-                            t_root.real
-                            for t_root in t_roots
-                            if abs(t_root.imag) < 0.001 and 0 < t_root.real < t1
-                        ]
-                        if len(valid_t_root) > 1:
-                            raise ValueError(
-                                "Multiple roots found when solving for impact time."
-                            )
-                        # Determine impact state at t_root
-                        self.t = self.t_final = valid_t_root[0] + self.solution[-2][0]
-                        interpolator = phase.solver.dense_output()
-                        self.y_sol = self.impact_state = interpolator(self.t)
-                        # Roll back solution
-                        self.solution[-1] = [self.t, *self.y_sol]
-                        # Save impact state
-                        self.x_impact = self.impact_state[0]
-                        self.y_impact = self.impact_state[1]
-                        self.z_impact = self.impact_state[2]
-                        self.impact_velocity = self.impact_state[5]
-                        # Set last flight phase
-                        self.flight_phases.flush_after(phase_index)
-                        self.flight_phases.add_phase(self.t)
-                        # Prepare to leave loops and start new flight phase
-                        phase.time_nodes.flush_after(node_index)
-                        phase.time_nodes.add_node(self.t, [], [])
-                        phase.solver.status = "finished"
+                            break
 
-                    # List and feed overshootable time nodes
+                    # Schedule and feed overshootable time nodes
                     if self.time_overshoot:
-                        # Initialize phase overshootable time nodes
-                        overshootable_nodes = self.TimeNodes()
-                        # Add overshootable parachute time nodes
-                        overshootable_nodes.add_parachutes(
-                            self.parachutes, self.solution[-2][0], self.t
+                        # Overshootable parachute time nodes, the last time
+                        # node at the current time is always skipped
+                        overshootable_nodes = _SamplingScheduler(
+                            self.TimeNodes.TimeNode,
+                            self.solution[-2][0],
+                            self.t,
+                            self.parachutes,
+                            start=False,
                         )
-                        # Add last time node (always skipped)
-                        overshootable_nodes.add_node(self.t, [], [])
-                        if len(overshootable_nodes) > 1:
-                            # Sort and merge equal overshootable time nodes
-                            overshootable_nodes.sort()
-                            overshootable_nodes.merge()
+                        for overshootable_index, overshootable_node in enumerate(
+                            overshootable_nodes
+                        ):
                             # Clear if necessary
-                            if overshootable_nodes[0].t == phase.t and phase.clear:
-                                overshootable_nodes[0].parachutes = []
-                                overshootable_nodes[0].callbacks = []
+                            if (
+                                overshootable_index == 0
+                                and overshootable_node.t == phase.t
+                                and phase.clear
+                            ):
+                                overshootable_node.parachutes = []
+                                overshootable_node.callbacks = []
                             # Feed overshootable time nodes trigger
-                            interpolator = phase.solver.dense_output()
-                            for (
-                                overshootable_index,
-                                overshootable_node,
-                            ) in self.time_iterator(overshootable_nodes):
-                                # Calculate state at node time
-                                overshootable_node.y_sol = interpolator(
-                                    overshootable_node.t
-                                )
-                                for parachute in overshootable_node.parachutes:
-                                    # Calculate and save pressure signal
-                                    noisy_pressure, height_above_ground_level = (
-                                        self.__calculate_and_save_pressure_signals(
-                                            parachute,
-                                            overshootable_node.t,
-                                            overshootable_node.y_sol[2],
-                                        )
+                            if interpolator is None:
+                                interpolator = phase.solver.dense_output()
+                            # Calculate state at node time
+                            overshootable_node.y_sol = interpolator(
+                                overshootable_node.t
+                            )
+                            for parachute in overshootable_node.parachutes:
+                                # Calculate and save pressure signal
+                                noisy_pressure, height_above_ground_level = (
+                                    self.__calculate_and_save_pressure_signals(
+                                        parachute,
+                                        overshootable_node.t,
+                                        overshootable_node.y_sol[2],
                                     )
+                                )
 
-                                    # Check for parachute trigger
-                                    if parachute.triggerfunc(
-                                        noisy_pressure,
-                                        height_above_ground_level,
-                                        overshootable_node.y_sol,
-                                    ):
-                                        # Remove parachute from flight parachutes
-                                        self.parachutes.remove(parachute)
-                                        # Create phase for time after detection and
-                                        # before inflation
-                                        # Must only be created if parachute has any lag
-                                        i = 1
-                                        if parachute.lag != 0:
-                                            self.flight_phases.add_phase(
-                                                overshootable_node.t,
-                                                phase.derivative,
-                                                clear=True,
-                                                index=phase_index + i,
-                                            )
-                                            i += 1
-                                        # Create flight phase for time after inflation
-                                        callbacks = [
-                                            lambda self, parachute_cd_s=parachute.cd_s: setattr(
-                                                self, "parachute_cd_s", parachute_cd_s
-                                            )
-                                        ]
+                                # Check for parachute trigger
+                                if parachute.triggerfunc(
+                                    noisy_pressure,
+                                    height_above_ground_level,
+                                    overshootable_node.y_sol,
+                                ):
+                                    # Remove parachute from flight parachutes
+                                    self.parachutes.remove(parachute)
+                                    # Create phase for time after detection and
+                                    # before inflation
+                                    # Must only be created if parachute has any lag
+                                    i = 1
+                                    if parachute.lag != 0:
                                         self.flight_phases.add_phase(
-                                            overshootable_node.t + parachute.lag,
-                                            self.u_dot_parachute,
-                                            callbacks,
-                                            clear=False,
-                                            index=phase_index + i,
-                                        )
-                                        # Rollback history
-                                        self.t = overshootable_node.t
-                                        self.y_sol = overshootable_node.y_sol
-                                        self.solution[-1] = [
                                             overshootable_node.t,
-                                            *overshootable_node.y_sol,
-                                        ]
-                                        # Prepare to leave loops and start new flight phase
-                                        overshootable_nodes.flush_after(
-                                            overshootable_index
+                                            phase.derivative,
+                                            clear=True,
+                                            index=phase_index + i,
+                                            name=phase.name,
                                         )
-                                        phase.time_nodes.flush_after(node_index)
-                                        phase.time_nodes.add_node(self.t, [], [])
-                                        phase.solver.status = "finished"
-                                        # Save parachute event
-                                        self.parachute_events.append(
-                                            [self.t, parachute]
+                                        i += 1
+                                    # Create flight phase for time after inflation
+                                    callbacks = [
+                                        lambda self, parachute_cd_s=parachute.cd_s: setattr(
+                                            self, "parachute_cd_s", parachute_cd_s
                                         )
+                                    ]
+                                    self.flight_phases.add_phase(
+                                        overshootable_node.t + parachute.lag,
+                                        self.u_dot_parachute,
+                                        callbacks,
+                                        clear=False,
+                                        index=phase_index + i,
+                                    )
+                                    # Rollback history
+                                    self.t = overshootable_node.t
+                                    self.y_sol = overshootable_node.y_sol
+                                    self.solution[-1] = [
+                                        overshootable_node.t,
+                                        *overshootable_node.y_sol,
+                                    ]
+                                    # Prepare to leave loops and start new flight phase
+                                    overshootable_nodes.stop()
+                                    phase.time_nodes.stop()
+                                    phase.solver.status = "finished"
+                                    # Save parachute event
+                                    self.parachute_events.append([self.t, parachute])
 
                     # If controlled flight, post process must be done on sim time
                     if self._controllers:
                         phase.derivative(self.t, self.y_sol, post_processing=True)
 
         self.t_final = self.t
+        self.solution.shrink_to_fit()
         self.__transform_pressure_signals_lists_to_functions()
         if self._controllers:
             # cache post process variables
-            self.__evaluate_post_process = np.array(self.__post_processed_variables)
+            self.__post_processed_variables.shrink_to_fit()
+            self.__evaluate_post_process = self.__post_processed_variables.array
         if verbose:
             print(f"\n>>> Simulation Completed at Time: {self.t:3.4f} s")
 
@@ -1033,7 +1007,7 @@ class Flight:  # pylint: disable=too-many-public-methods
             The noisy pressure and height above ground level.
         """
         # Calculate pressure and noise
-        pressure = self.env.pressure.get_value_opt(z)
+        pressure = self.__pressure(z)
         noise = parachute.noise_function()
         noisy_pressure = pressure + noise
 
@@ -1061,8 +1035,9 @@ class Flight:  # pylint: disable=too-many-public-methods
         self.impact_velocity = 0
         self.impact_state = np.array([0])
         self.parachute_events = []
+        self.triggered_events = []
         self.post_processed = False
-        self.__post_processed_variables = []
+        self.__post_processed_variables = GrowableArray(columns=13)
 
     def __init_flight_state(self):
         """Initialize flight state variables."""
@@ -1098,16 +1073,18 @@ class Flight:  # pylint: disable=too-many-public-methods
             ]
             # Set initial derivative for rail phase
             self.initial_derivative = self.udot_rail1
+            self.__initial_derivative_name = "udot_rail1"
         elif isinstance(self.initial_solution, Flight):
             # Initialize time and state variables based on last solution of
             # previous flight
-            self.initial_solution = self.initial_solution.solution[-1]
+            self.initial_solution = self.initial_solution.solution[-1].tolist()
             # Set unused monitors
             self.out_of_rail_state = self.initial_solution[1:]
             self.out_of_rail_time = self.initial_solution[0]
             self.out_of_rail_time_index = 0
             # Set initial derivative for 6-DOF flight phase
             self.initial_derivative = self.u_dot_generalized
+            self.__initial_derivative_name = "u_dot_generalized"
         else:
             # Initial solution given, ignore rail phase
             # TODO: Check if rocket is actually out of rail. Otherwise, start at rail
@@ -1115,6 +1092,7 @@ class Flight:  # pylint: disable=too-many-public-methods
             self.out_of_rail_time = self.initial_solution[0]
             self.out_of_rail_time_index = 0
             self.initial_derivative = self.u_dot_generalized
+            self.__initial_derivative_name = "u_dot_generalized"
         if self._controllers:
             # Handle post process during simulation, get initial accel/forces
             self.initial_derivative(
@@ -1125,23 +1103,321 @@ class Flight:  # pylint: disable=too-many-public-methods
         # Initialize solver monitors
         self.function_evaluations = []
         # Initialize solution state
-        self.solution = []
-        self.__init_flight_state()
+        self.__checkpoint = None
+        if isinstance(self.initial_solution, FlightCheckpoint):
+            self.__init_from_checkpoint(self.initial_solution)
+        else:
+            self.solution = GrowableArray(columns=14)
+            self.__init_flight_state()
+            self.solution.append(self.initial_solution)
 
-        self.t_initial = self.initial_solution[0]
-        self.solution.append(self.initial_solution)
+        self.t_initial = self.solution[0][0]
         self.t = self.solution[-1][0]
-        self.y_sol = self.solution[-1][1:]
+        self.y_sol = self.solution[-1][1:].copy()
+
+    def __init_from_checkpoint(self, checkpoint):
+        """Initialize the flight state from a checkpoint of another flight.
+        The solution of that flight up to the checkpoint is shared, not
+        copied, and so are its flight phases, events and monitors."""
+        self.__checkpoint = checkpoint
+        self.initial_solution = checkpoint.flight.initial_solution
+        self.solution = GrowableArray.shared(
+            checkpoint.flight.solution_array[: checkpoint.index + 1]
+        )
+        self.parachutes = checkpoint.parachutes[:]
+        self.parachute_events = [event[:] for event in checkpoint.parachute_events]
+        self.triggered_events = [event[:] for event in checkpoint.triggered_events]
+        for name, value in checkpoint.monitors.items():
+            setattr(self, name, value)
+        # Restore the controllers and the objects they act on
+        for controller, observed_variables in checkpoint.observed_variables:
+            if isinstance(observed_variables, np.ndarray):
+                # Controllers with a history length store a GrowableArray
+                controller.observed_variables = GrowableArray.shared(observed_variables)
+            else:
+                controller.observed_variables = observed_variables[:]
+        for air_brakes, deployment_level in checkpoint.air_brakes_levels:
+            air_brakes.deployment_level = deployment_level
+        self.__controller_states = checkpoint.controller_states[:]
+        self.__post_processed_variables = GrowableArray(columns=13)
+        self.__post_processed_variables += checkpoint.post_processed_variables
+        self.initial_derivative = getattr(self, checkpoint.derivative)
+        self.__initial_derivative_name = checkpoint.derivative
+
+    def __init_flight_phases(self):
+        """Create the known flight phases. A flight branched from a
+        checkpoint keeps the phases before the checkpoint, which are not
+        simulated again, and starts a new phase at the checkpoint."""
+        self.flight_phases = self.FlightPhases()
+        self.__initial_phase_index = 0
+        checkpoint = self.__checkpoint
+        if checkpoint is None:
+            self.flight_phases.add_phase(
+                self.t_initial,
+                self.initial_derivative,
+                clear=False,
+                name=self.__initial_derivative_name,
+            )
+        else:
+            for t, derivative, callbacks in checkpoint.phases:
+                self.flight_phases.add_phase(
+                    t,
+                    getattr(self, derivative),
+                    callbacks,
+                    clear=False,
+                    name=derivative,
+                )
+            self.__initial_phase_index = len(checkpoint.phases)
+            self.flight_phases.add_phase(
+                self.t,
+                self.initial_derivative,
+                checkpoint.callbacks,
+                clear=True,
+                name=self.__initial_derivative_name,
+            )
+            # Parachutes triggered before the checkpoint, inflated after it
+            for t, cd_s in checkpoint.inflations:
+                callbacks = [
+                    lambda self, parachute_cd_s=cd_s: setattr(
+                        self, "parachute_cd_s", parachute_cd_s
+                    )
+                ]
+                self.flight_phases.add_phase(
+                    t, self.u_dot_parachute, callbacks, clear=False
+                )
+        self.flight_phases.add_phase(self.max_time)
+
+    def __init_events(self):
+        """Initialize the events detected during the simulation: rail exit,
+        apogee, impact and the user defined events."""
+        elevation = self.env.elevation
+        # The rocket moves along the rail axis, so the distance travelled on
+        # the rail is the projection of its position on the rail direction
+        e0, e1, e2, e3 = self.y_sol[6:10]
+        rail_direction = [
+            2 * (e1 * e3 + e0 * e2),
+            2 * (e2 * e3 - e0 * e1),
+            e0**2 - e1**2 - e2**2 + e3**2,
+        ]
+        self.__rail_exit_event = FlightEvent.linear(
+            "rail exit",
+            {0: rail_direction[0], 1: rail_direction[1], 2: rail_direction[2]},
+            rail_direction[2] * elevation + self.effective_1rl,
+            direction=1,
+        )
+        # TODO: negative vz doesn't really mean apogee. Improve this.
+        self.__apogee_event = FlightEvent.linear(
+            "apogee", {5: 1}, direction=-1, terminal=self.terminate_on_apogee
+        )
+        self.__impact_event = FlightEvent.linear(
+            "impact", {2: 1}, elevation, direction=-1, terminal=True
+        )
+        self.__event_detector = _EventDetector(
+            [
+                self.__rail_exit_event,
+                self.__apogee_event,
+                self.__impact_event,
+                *self.events,
+            ]
+        )
+        if len(self.out_of_rail_state) > 1:
+            # Simulation starts off the rail
+            self.__event_detector.deactivate(self.__rail_exit_event)
+        if len(self.apogee_state) > 1:
+            # Simulation starts from a checkpoint after apogee
+            self.__event_detector.deactivate(self.__apogee_event)
+        elif self.y_sol[5] < 0:
+            # Simulation starts after apogee, which is set to the initial state
+            self.apogee_state = np.array(self.y_sol)
+            self.apogee_time = self.t_initial
+            self.apogee_x, self.apogee_y, self.apogee = self.apogee_state[:3]
+            self.__event_detector.deactivate(self.__apogee_event)
 
     def __init_equations_of_motion(self):
         """Initialize equations of motion."""
+        if self.kernel not in ("standard", "compiled"):
+            raise ValueError(
+                f"Invalid kernel '{self.kernel}'. Must be 'standard' or 'compiled'."
+            )
         if self.equations_of_motion == "solid_propulsion":
+            if self.kernel == "compiled":
+                raise ValueError(
+                    "The compiled kernel is only available for the 'standard' "
+                    "equations of motion."
+                )
             # NOTE: The u_dot is faster, but only works for solid propulsion
             self.u_dot_generalized = self.u_dot
+        elif self.kernel == "compiled":
+            parent = getattr(self.initial_solution, "flight", None)
+            if getattr(parent, "kernel", None) == "compiled":
+                # Branched flights share the tables of the checkpointed flight
+                self._kernel = parent._kernel
+            else:
+                self._kernel = _FlightKernel(self.rocket, self.env)
+            self.u_dot_generalized = self.u_dot_compiled
+        # Consecutive steps evaluate these Functions at close points. Each
+        # flight remembers the last interval of their data in its own
+        # evaluators, without modifying the Functions
+        env, rocket = self.env, self.rocket
+        self.__pressure = env.pressure.monotone_evaluator()
+        self.__density = env.density.monotone_evaluator()
+        self.__speed_of_sound = env.speed_of_sound.monotone_evaluator()
+        self.__wind_velocity_x = env.wind_velocity_x.monotone_evaluator()
+        self.__wind_velocity_y = env.wind_velocity_y.monotone_evaluator()
+        self.__gravity = env.gravity.monotone_evaluator()
+        self.__total_mass = rocket.total_mass.monotone_evaluator()
+        self.__total_mass_flow_rate = rocket.total_mass_flow_rate.monotone_evaluator()
+        self.__r_cm = rocket.com_to_cdm_function.monotone_evaluator()
+        self.__thrust = rocket.motor.thrust.monotone_evaluator()
+        self.__inertias = [
+            inertia.monotone_evaluator()
+            for inertia in (
+                rocket.I_11,
+                rocket.I_12,
+                rocket.I_13,
+                rocket.I_22,
+                rocket.I_23,
+                rocket.I_33,
+            )
+        ]
+
+        # Time derivatives of the mass and inertia properties: exact for the
+        # Functions given by a dataset and numerical otherwise
+        rocket = self.rocket
+        derivative = self.__time_derivative
+        motor_inertia_11, motor_inertia_33 = rocket.motor.I_11, rocket.motor.I_33
+        self.__motor_inertia_11_dot = derivative(
+            motor_inertia_11, partial(motor_inertia_11.differentiate, dx=1e-6)
+        )
+        self.__motor_inertia_33_dot = derivative(
+            motor_inertia_33, partial(motor_inertia_33.differentiate, dx=1e-6)
+        )
+        mass_flow_rate = rocket.total_mass_flow_rate
+        self.__total_mass_ddot = derivative(
+            mass_flow_rate, mass_flow_rate.differentiate_complex_step
+        )
+        r_cm = rocket.com_to_cdm_function
+        self.__r_cm_dot = derivative(r_cm, r_cm.differentiate_complex_step)
+        self.__r_cm_ddot = derivative(r_cm, partial(r_cm.differentiate, order=2), 2)
+        self.__inertia_dots = [
+            derivative(inertia, inertia.differentiate_complex_step)
+            for inertia in (
+                rocket.I_11,
+                rocket.I_12,
+                rocket.I_13,
+                rocket.I_22,
+                rocket.I_23,
+                rocket.I_33,
+            )
+        ]
+        self.__motor_properties = self.__init_motor_properties()
+
+    def __init_motor_properties(self):
+        """Returns a callable that evaluates the motor inertias, their time
+        derivatives, the propellant mass and the distance from the center of
+        mass to the center of dry mass of the rocket, in this order. If they
+        are given by datasets over the same time grid, they are evaluated
+        together by a FunctionBundle, with a single search of the grid."""
+        rocket = self.rocket
+        motor_inertia_33, motor_inertia_11 = rocket.motor.I_33, rocket.motor.I_11
+        propellant_mass = rocket.motor.propellant_mass
+        r_cm = rocket.com_to_cdm_function
+        if all(
+            isinstance(function.source, np.ndarray)
+            for function in (motor_inertia_33, motor_inertia_11, propellant_mass, r_cm)
+        ):
+            try:
+                bundle = FunctionBundle(
+                    [
+                        motor_inertia_33,
+                        motor_inertia_11,
+                        motor_inertia_33.derivative_function(exact=True),
+                        motor_inertia_11.derivative_function(exact=True),
+                        propellant_mass,
+                        r_cm,
+                    ]
+                )
+                return lambda t: bundle.get_values(t).tolist()
+            except ValueError:
+                pass
+
+        def motor_properties(t):
+            return (
+                motor_inertia_33.get_value_opt(t),
+                motor_inertia_11.get_value_opt(t),
+                self.__motor_inertia_33_dot(t),
+                self.__motor_inertia_11_dot(t),
+                propellant_mass.get_value_opt(t),
+                r_cm.get_value_opt(t),
+            )
+
+        return motor_properties
+
+    @staticmethod
+    def __time_derivative(function, numerical, order=1):
+        """Returns a callable that evaluates a time derivative of a Function.
+
+        Parameters
+        ----------
+        function : Function
+            Function of time to be differentiated.
+        numerical : callable
+            Numerical derivative of the Function, used if the Function is not
+            given by a dataset.
+        order : int, optional
+            Order of the derivative. Default is 1.
+
+        Returns
+        -------
+        callable
+            The exact derivative of the Function, see
+            ``Function.derivative_function``, or the numerical derivative.
+        """
+        if not isinstance(function.source, np.ndarray):
+            return numerical
+        for _ in range(order):
+            function = function.derivative_function(exact=True)
+        return function.get_value_opt
+
+    def __init_integrators(self):
+        """Initialize the integrator used in each kind of flight phase."""
+        phase_kinds = ("rail", "powered", "coast", "parachute")
+        if isinstance(self.integrator, dict):
+            invalid_kinds = set(self.integrator) - set(phase_kinds)
+            if invalid_kinds:
+                raise ValueError(
+                    f"Invalid flight phases {sorted(invalid_kinds)} in integrator. "
+                    f"Valid phases are {list(phase_kinds)}."
+                )
+            integrators = {
+                kind: self.integrator.get(kind, "LSODA") for kind in phase_kinds
+            }
+        else:
+            integrators = dict.fromkeys(phase_kinds, self.integrator)
+        for integrator in integrators.values():
+            get_integrator(integrator)  # raises if not valid
+        self.__phase_integrators = integrators
+        self.__split_at_burn_out = get_integrator(
+            integrators["powered"]
+        ) is not get_integrator(integrators["coast"])
+
+    def __get_phase_kind(self, phase):
+        """Classify a flight phase as "rail", "powered", "coast" or
+        "parachute", which determines the integrator used to solve it."""
+        if phase.name == "udot_rail1":
+            return "rail"
+        if phase.name == "u_dot_parachute":
+            return "parachute"
+        if phase.t < self.rocket.motor.burn_out_time:
+            return "powered"
+        return "coast"
 
     def __init_controllers(self):
         """Initialize controllers"""
-        self._controllers = self.rocket._controllers[:]
+        if isinstance(self.initial_solution, FlightCheckpoint):
+            self._controllers = self.initial_solution.controllers[:]
+        else:
+            self._controllers = self.rocket._controllers[:]
         if self._controllers:
             if self.time_overshoot:
                 self.time_overshoot = False
@@ -1152,6 +1428,20 @@ class Flight:  # pylint: disable=too-many-public-methods
             # reset controllable object to initial state (only airbrakes for now)
             for air_brakes in self.rocket.air_brakes:
                 air_brakes._reset()
+        self.__controller_states = []
+        self.__save_controller_state(-np.inf)
+
+    def __save_controller_state(self, t):
+        """Save the number of observed variables of each controller and the
+        deployment level of the air brakes after the controllers are called
+        at time t, so that checkpoints can restore them."""
+        self.__controller_states.append(
+            (
+                t,
+                [(c, len(c.observed_variables)) for c in self._controllers],
+                [(a, a.deployment_level) for a in self.rocket.air_brakes],
+            )
+        )
 
     @cached_property
     def effective_1rl(self):
@@ -1242,26 +1532,26 @@ class Flight:  # pylint: disable=too-many-public-methods
 
         # Retrieve important quantities
         # Mass
-        total_mass_at_t = self.rocket.total_mass.get_value_opt(t)
+        total_mass_at_t = self.__total_mass(t)
 
         # Get freestream speed
         free_stream_speed = (
-            (self.env.wind_velocity_x.get_value_opt(z) - vx) ** 2
-            + (self.env.wind_velocity_y.get_value_opt(z) - vy) ** 2
+            (self.__wind_velocity_x(z) - vx) ** 2
+            + (self.__wind_velocity_y(z) - vy) ** 2
             + (vz) ** 2
         ) ** 0.5
-        free_stream_mach = free_stream_speed / self.env.speed_of_sound.get_value_opt(z)
+        free_stream_mach = free_stream_speed / self.__speed_of_sound(z)
         drag_coeff = self.rocket.power_on_drag.get_value_opt(free_stream_mach)
 
         # Calculate Forces
-        thrust = self.rocket.motor.thrust.get_value_opt(t)
-        rho = self.env.density.get_value_opt(z)
+        thrust = self.__thrust(t)
+        rho = self.__density(z)
         R3 = -0.5 * rho * (free_stream_speed**2) * self.rocket.area * (drag_coeff)
 
         # Calculate Linear acceleration
         a3 = (R3 + thrust) / total_mass_at_t - (
             e0**2 - e1**2 - e2**2 + e3**2
-        ) * self.env.gravity.get_value_opt(z)
+        ) * self.__gravity(z)
         if a3 > 0:
             ax = 2 * (e1 * e3 + e0 * e2) * a3
             ay = 2 * (e2 * e3 - e0 * e1) * a3
@@ -1333,21 +1623,18 @@ class Flight:  # pylint: disable=too-many-public-methods
         # Determine current behavior
         if t < self.rocket.motor.burn_out_time:
             # Motor burning
-            # Retrieve important motor quantities
-            # Inertias
-            motor_I_33_at_t = self.rocket.motor.I_33.get_value_opt(t)
-            motor_I_11_at_t = self.rocket.motor.I_11.get_value_opt(t)
-            motor_I_33_derivative_at_t = self.rocket.motor.I_33.differentiate(
-                t, dx=1e-6
-            )
-            motor_I_11_derivative_at_t = self.rocket.motor.I_11.differentiate(
-                t, dx=1e-6
-            )
-            # Mass
+            # Retrieve important motor quantities: inertias, mass and geometry
+            (
+                motor_I_33_at_t,
+                motor_I_11_at_t,
+                motor_I_33_derivative_at_t,
+                motor_I_11_derivative_at_t,
+                propellant_mass_at_t,
+                a,
+            ) = self.__motor_properties(t)
             mass_flow_rate_at_t = self.rocket.motor.mass_flow_rate.get_value_opt(t)
-            propellant_mass_at_t = self.rocket.motor.propellant_mass.get_value_opt(t)
             # Thrust
-            thrust = self.rocket.motor.thrust.get_value_opt(t)
+            thrust = self.__thrust(t)
             # Off center moment
             M1 += self.rocket.thrust_eccentricity_x * thrust
             M2 -= self.rocket.thrust_eccentricity_y * thrust
@@ -1364,6 +1651,8 @@ class Flight:  # pylint: disable=too-many-public-methods
             mass_flow_rate_at_t, propellant_mass_at_t = 0, 0
             # thrust
             thrust = 0
+            # Geometry
+            a = self.__r_cm(t)
 
         # Retrieve important quantities
         # Inertias
@@ -1385,7 +1674,6 @@ class Flight:  # pylint: disable=too-many-public-methods
             * self.rocket._csys
         )
         c = self.rocket.nozzle_to_cdm
-        a = self.rocket.com_to_cdm_function.get_value_opt(t)
         nozzle_radius = self.rocket.motor.nozzle_radius
         # Prepare transformation matrix
         a11 = 1 - 2 * (e2**2 + e3**2)
@@ -1402,12 +1690,12 @@ class Flight:  # pylint: disable=too-many-public-methods
 
         # Calculate Forces and Moments
         # Get freestream speed
-        wind_velocity_x = self.env.wind_velocity_x.get_value_opt(z)
-        wind_velocity_y = self.env.wind_velocity_y.get_value_opt(z)
+        wind_velocity_x = self.__wind_velocity_x(z)
+        wind_velocity_y = self.__wind_velocity_y(z)
         free_stream_speed = (
             (wind_velocity_x - vx) ** 2 + (wind_velocity_y - vy) ** 2 + (vz) ** 2
         ) ** 0.5
-        free_stream_mach = free_stream_speed / self.env.speed_of_sound.get_value_opt(z)
+        free_stream_mach = free_stream_speed / self.__speed_of_sound(z)
 
         # Determine aerodynamics forces
         # Determine Drag Force
@@ -1415,7 +1703,7 @@ class Flight:  # pylint: disable=too-many-public-methods
             drag_coeff = self.rocket.power_on_drag.get_value_opt(free_stream_mach)
         else:
             drag_coeff = self.rocket.power_off_drag.get_value_opt(free_stream_mach)
-        rho = self.env.density.get_value_opt(z)
+        rho = self.__density(z)
         R3 = -0.5 * rho * (free_stream_speed**2) * self.rocket.area * drag_coeff
         for air_brakes in self.rocket.air_brakes:
             if air_brakes.deployment_level > 0:
@@ -1453,8 +1741,8 @@ class Flight:  # pylint: disable=too-many-public-methods
             comp_vz_b = vz_b
             # Wind velocity at component
             comp_z = z + comp_cp
-            comp_wind_vx = self.env.wind_velocity_x.get_value_opt(comp_z)
-            comp_wind_vy = self.env.wind_velocity_y.get_value_opt(comp_z)
+            comp_wind_vx = self.__wind_velocity_x(comp_z)
+            comp_wind_vy = self.__wind_velocity_y(comp_z)
             # Component freestream velocity in body frame
             comp_wind_vx_b = a11 * comp_wind_vx + a21 * comp_wind_vy
             comp_wind_vy_b = a12 * comp_wind_vx + a22 * comp_wind_vy
@@ -1598,7 +1886,7 @@ class Flight:  # pylint: disable=too-many-public-methods
             / total_mass_at_t,
         ]
         ax, ay, az = np.dot(K, L)
-        az -= self.env.gravity.get_value_opt(z)  # Include gravity
+        az -= self.__gravity(z)  # Include gravity
 
         # Create u_dot
         u_dot = [
@@ -1660,23 +1948,38 @@ class Flight:  # pylint: disable=too-many-public-methods
 
         # Retrieve necessary quantities
         ## Rocket mass
-        total_mass = self.rocket.total_mass.get_value_opt(t)
-        total_mass_dot = self.rocket.total_mass_flow_rate.get_value_opt(t)
-        total_mass_ddot = self.rocket.total_mass_flow_rate.differentiate_complex_step(t)
+        total_mass = self.__total_mass(t)
+        total_mass_dot = self.__total_mass_flow_rate(t)
+        total_mass_ddot = self.__total_mass_ddot(t)
         ## CM position vector and time derivatives relative to CDM in body frame
-        r_CM_z = self.rocket.com_to_cdm_function
-        r_CM_t = r_CM_z.get_value_opt(t)
+        r_CM_t = self.__r_cm(t)
         r_CM = Vector([0, 0, r_CM_t])
-        r_CM_dot = Vector([0, 0, r_CM_z.differentiate_complex_step(t)])
-        r_CM_ddot = Vector([0, 0, r_CM_z.differentiate(t, order=2)])
+        r_CM_dot = Vector([0, 0, self.__r_cm_dot(t)])
+        r_CM_ddot = Vector([0, 0, self.__r_cm_ddot(t)])
         ## Nozzle position vector
         r_NOZ = Vector([0, 0, self.rocket.nozzle_to_cdm])
         ## Nozzle gyration tensor
         S_nozzle = self.rocket.nozzle_gyration_tensor
         ## Inertia tensor
-        inertia_tensor = self.rocket.get_inertia_tensor_at_time(t)
+        I_11, I_12, I_13, I_22, I_23, I_33 = (inertia(t) for inertia in self.__inertias)
+        inertia_tensor = Matrix(
+            [
+                [I_11, I_12, I_13],
+                [I_12, I_22, I_23],
+                [I_13, I_23, I_33],
+            ]
+        )
         ## Inertia tensor time derivative in the body frame
-        I_dot = self.rocket.get_inertia_tensor_derivative_at_time(t)
+        I_11_dot, I_12_dot, I_13_dot, I_22_dot, I_23_dot, I_33_dot = (
+            inertia_dot(t) for inertia_dot in self.__inertia_dots
+        )
+        I_dot = Matrix(
+            [
+                [I_11_dot, I_12_dot, I_13_dot],
+                [I_12_dot, I_22_dot, I_23_dot],
+                [I_13_dot, I_23_dot, I_33_dot],
+            ]
+        )
 
         # Calculate the Inertia tensor relative to CM
         H = (r_CM.cross_matrix @ -r_CM.cross_matrix) * total_mass
@@ -1690,12 +1993,12 @@ class Flight:  # pylint: disable=too-many-public-methods
         R1, R2, R3, M1, M2, M3 = 0, 0, 0, 0, 0, 0
 
         ## Drag force
-        rho = self.env.density.get_value_opt(z)
-        wind_velocity_x = self.env.wind_velocity_x.get_value_opt(z)
-        wind_velocity_y = self.env.wind_velocity_y.get_value_opt(z)
+        rho = self.__density(z)
+        wind_velocity_x = self.__wind_velocity_x(z)
+        wind_velocity_y = self.__wind_velocity_y(z)
         wind_velocity = Vector([wind_velocity_x, wind_velocity_y, 0])
         free_stream_speed = abs((wind_velocity - Vector(v)))
-        speed_of_sound = self.env.speed_of_sound.get_value_opt(z)
+        speed_of_sound = self.__speed_of_sound(z)
         free_stream_mach = free_stream_speed / speed_of_sound
 
         if t < self.rocket.motor.burn_out_time:
@@ -1733,8 +2036,8 @@ class Flight:  # pylint: disable=too-many-public-methods
             comp_vb = velocity_in_body_frame + (w ^ comp_cp)
             # Wind velocity at component altitude
             comp_z = z + (K @ comp_cp).z
-            comp_wind_vx = self.env.wind_velocity_x.get_value_opt(comp_z)
-            comp_wind_vy = self.env.wind_velocity_y.get_value_opt(comp_z)
+            comp_wind_vx = self.__wind_velocity_x(comp_z)
+            comp_wind_vy = self.__wind_velocity_y(comp_z)
             # Component freestream velocity in body frame
             comp_wind_vb = Kt @ Vector([comp_wind_vx, comp_wind_vy, 0])
             comp_stream_velocity = comp_wind_vb - comp_vb
@@ -1789,7 +2092,7 @@ class Flight:  # pylint: disable=too-many-public-methods
                 pass
 
         # Off center moment
-        thrust = self.rocket.motor.thrust.get_value_opt(t)
+        thrust = self.__thrust(t)
         M1 += (
             self.rocket.cp_eccentricity_y * R3
             + self.rocket.thrust_eccentricity_x * thrust
@@ -1800,9 +2103,7 @@ class Flight:  # pylint: disable=too-many-public-methods
         )
         M3 += self.rocket.cp_eccentricity_x * R2 - self.rocket.cp_eccentricity_y * R1
 
-        weight_in_body_frame = Kt @ Vector(
-            [0, 0, -total_mass * self.env.gravity.get_value_opt(z)]
-        )
+        weight_in_body_frame = Kt @ Vector([0, 0, -total_mass * self.__gravity(z)])
 
         T00 = total_mass * r_CM
         T03 = 2 * total_mass_dot * (r_NOZ - r_CM) - 2 * total_mass * r_CM_dot
@@ -1856,6 +2157,39 @@ class Flight:  # pylint: disable=too-many-public-methods
 
         return u_dot
 
+    def u_dot_compiled(self, t, u, post_processing=False):
+        """Calculates derivative of u state vector with respect to time using
+        the compiled flight kernel. The equations of motion are the same as in
+        Flight.u_dot_generalized, but every Rocket and Environment quantity is
+        read from tables built before the simulation. Only used when the
+        Flight is created with ``kernel="compiled"``.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds
+        u : list
+            State vector defined by u = [x, y, z, vx, vy, vz, q0, q1,
+            q2, q3, omega1, omega2, omega3].
+        post_processing : bool, optional
+            If True, adds flight data information directly to self variables
+            such as self.angle_of_attack, by default False.
+
+        Returns
+        -------
+        u_dot : list
+            State vector defined by u_dot = [vx, vy, vz, ax, ay, az,
+            e0_dot, e1_dot, e2_dot, e3_dot, alpha1, alpha2, alpha3].
+        """
+        u_dot, forces = self._kernel.u_dot(t, u)
+
+        if post_processing:
+            self.__post_processed_variables.append(
+                [t, *u_dot[3:6], *u_dot[10:13], *forces]
+            )
+
+        return u_dot
+
     def u_dot_parachute(self, t, u, post_processing=False):
         """Calculates derivative of u state vector with respect to time
         when rocket is flying under parachute. A 3 DOF approximation is
@@ -1883,9 +2217,9 @@ class Flight:  # pylint: disable=too-many-public-methods
         z, vx, vy, vz = u[2:6]
 
         # Get atmospheric data
-        rho = self.env.density.get_value_opt(z)
-        wind_velocity_x = self.env.wind_velocity_x.get_value_opt(z)
-        wind_velocity_y = self.env.wind_velocity_y.get_value_opt(z)
+        rho = self.__density(z)
+        wind_velocity_x = self.__wind_velocity_x(z)
+        wind_velocity_y = self.__wind_velocity_y(z)
 
         # Get Parachute data
         cd_s = self.parachute_cd_s
@@ -1929,10 +2263,11 @@ class Flight:  # pylint: disable=too-many-public-methods
 
         return [vx, vy, vz, ax, ay, az, 0, 0, 0, 0, 0, 0, 0]
 
-    @cached_property
+    @property
     def solution_array(self):
-        """Returns solution array of the rocket flight."""
-        return np.array(self.solution)
+        """Returns solution array of the rocket flight. This is a view of the
+        solution buffer, so no copy is made."""
+        return self.solution.array
 
     @property
     def function_evaluations_per_time_step(self):
@@ -2131,36 +2466,41 @@ class Flight:  # pylint: disable=too-many-public-methods
         axis of symmetry as a Function of time."""
         return self.__evaluate_post_process[:, [0, 12]]
 
+    def __along_trajectory(self, function):
+        """Values of a Function of altitude at the altitude of every step, as
+        an array of [t, value] rows."""
+        return np.column_stack((self.z[:, 0], _evaluate_array(function, self.z[:, 1])))
+
     @funcify_method("Time (s)", "Pressure (Pa)", "spline", "constant")
     def pressure(self):
         """Air pressure felt by the rocket as a Function of time."""
-        return [(t, self.env.pressure.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.pressure)
 
     @funcify_method("Time (s)", "Density (kg/m³)", "spline", "constant")
     def density(self):
         """Air density felt by the rocket as a Function of time."""
-        return [(t, self.env.density.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.density)
 
     @funcify_method("Time (s)", "Dynamic Viscosity (Pa s)", "spline", "constant")
     def dynamic_viscosity(self):
         """Air dynamic viscosity felt by the rocket as a Function of
         time."""
-        return [(t, self.env.dynamic_viscosity.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.dynamic_viscosity)
 
     @funcify_method("Time (s)", "Speed of Sound (m/s)", "spline", "constant")
     def speed_of_sound(self):
         """Speed of sound in the air felt by the rocket as a Function of time."""
-        return [(t, self.env.speed_of_sound.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.speed_of_sound)
 
     @funcify_method("Time (s)", "Wind Velocity X (East) (m/s)", "spline", "constant")
     def wind_velocity_x(self):
         """Wind velocity in the X direction (east) as a Function of time."""
-        return [(t, self.env.wind_velocity_x.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.wind_velocity_x)
 
     @funcify_method("Time (s)", "Wind Velocity Y (North) (m/s)", "spline", "constant")
     def wind_velocity_y(self):
         """Wind velocity in the y direction (north) as a Function of time."""
-        return [(t, self.env.wind_velocity_y.get_value_opt(z)) for t, z in self.z]
+        return self.__along_trajectory(self.env.wind_velocity_y)
 
     # Process fourth type of output - values calculated from previous outputs
 
@@ -2577,23 +2917,23 @@ class Flight:  # pylint: disable=too-many-public-methods
     def angle_of_attack(self):
         """Angle of attack of the rocket with respect to the freestream
         velocity vector."""
-        dot_product = [
-            -self.attitude_vector_x.get_value_opt(i)
-            * self.stream_velocity_x.get_value_opt(i)
-            - self.attitude_vector_y.get_value_opt(i)
-            * self.stream_velocity_y.get_value_opt(i)
-            - self.attitude_vector_z.get_value_opt(i)
-            * self.stream_velocity_z.get_value_opt(i)
-            for i in self.time
-        ]
-        # Define freestream speed list
-        free_stream_speed = [self.free_stream_speed.get_value_opt(i) for i in self.time]
-        free_stream_speed = np.nan_to_num(free_stream_speed)
+        get_values = _evaluate_array
+        time = self.time
+        dot_product = (
+            -get_values(self.attitude_vector_x, time)
+            * get_values(self.stream_velocity_x, time)
+            - get_values(self.attitude_vector_y, time)
+            * get_values(self.stream_velocity_y, time)
+            - get_values(self.attitude_vector_z, time)
+            * get_values(self.stream_velocity_z, time)
+        )
+        # Define freestream speed array
+        free_stream_speed = np.nan_to_num(get_values(self.free_stream_speed, time))
 
         # Normalize dot product
-        dot_product_normalized = [
-            i / j if j > 1e-6 else 0 for i, j in zip(dot_product, free_stream_speed)
-        ]
+        moving = free_stream_speed > 1e-6
+        dot_product_normalized = np.zeros_like(dot_product)
+        dot_product_normalized[moving] = dot_product[moving] / free_stream_speed[moving]
         dot_product_normalized = np.nan_to_num(dot_product_normalized)
         dot_product_normalized = np.clip(dot_product_normalized, -1, 1)
 
@@ -2883,7 +3223,14 @@ class Flight:  # pylint: disable=too-many-public-methods
         None
         """
         # Transform parachute sensor feed into functions
-        for parachute in self.rocket.parachutes:
+        parachutes = dict.fromkeys(
+            [
+                *self.rocket.parachutes,
+                *self.parachutes,
+                *(parachute for _, parachute in self.parachute_events),
+            ]
+        )
+        for parachute in parachutes:
             # TODO: these Functions do not need input validation
             parachute.clean_pressure_signal_function = Function(
                 parachute.clean_pressure_signal,
@@ -2901,8 +3248,11 @@ class Flight:  # pylint: disable=too-many-public-methods
 
     @cached_property
     def __evaluate_post_process(self):
-        """Evaluate all post-processing variables by running the simulation
-        again but with the post-processing flag set to True.
+        """Evaluate all post-processing variables. The steps of each flight
+        phase are evaluated at once by the equations of motion of a
+        ``_FunctionKernel``, which evaluates the rail, 6 DOF and parachute
+        equations on the original Functions. Other equations of motion are
+        called again, step by step, with the post-processing flag set to True.
 
         Returns
         -------
@@ -2911,20 +3261,89 @@ class Flight:  # pylint: disable=too-many-public-methods
             time step. Each element of the array is a list containing:
             [t, ax, ay, az, alpha1, alpha2, alpha3, R1, R2, R3, M1, M2, M3]
         """
-        self.__post_processed_variables = []
+        self.__post_processed_variables = GrowableArray(columns=13)
+        solution = self.solution_array
+        post_processed = []
         for phase_index, phase in self.time_iterator(self.flight_phases):
             init_time = phase.t
             final_time = self.flight_phases[phase_index + 1].t
-            current_derivative = phase.derivative
             for callback in phase.callbacks:
                 callback(self)
-            for step in self.solution:
-                if init_time < step[0] <= final_time or (
-                    init_time == self.t_initial and step[0] == self.t_initial
-                ):
-                    current_derivative(step[0], step[1:], post_processing=True)
+            # Steps in (init_time, final_time], plus the initial state
+            first_step = np.searchsorted(
+                solution[:, 0],
+                init_time,
+                side="left" if init_time == self.t_initial else "right",
+            )
+            last_step = np.searchsorted(solution[:, 0], final_time, side="right")
+            if first_step < last_step:
+                steps = solution[first_step:last_step]
+                post_processed.append(
+                    self.__post_process_steps(
+                        phase.derivative, steps[:, 0], steps[:, 1:]
+                    )
+                )
+
+        if not post_processed:
+            return np.array(post_processed)
+        return np.concatenate(post_processed)
+
+    def __post_process_steps(self, derivative, t, u):
+        """Evaluate the post-processing variables at several steps of a
+        flight phase.
 
-        return np.array(self.__post_processed_variables)
+        Parameters
+        ----------
+        derivative : callable
+            Equations of motion of the flight phase.
+        t : np.ndarray
+            Time of each step, of shape (n,).
+        u : np.ndarray
+            State vector of each step, of shape (n, 13).
+
+        Returns
+        -------
+        np.ndarray
+            Post-processed variables of shape (n, 13). See
+            Flight.__evaluate_post_process.
+        """
+        function = getattr(derivative, "__func__", None)
+        is_standard = (
+            getattr(self.u_dot_generalized, "__func__", None)
+            is Flight.u_dot_generalized
+        )
+        kernel = self.__post_processing_kernel
+        if function is Flight.u_dot_parachute:
+            u_dot, forces = kernel.u_dot_parachute(u.T, self.parachute_cd_s)
+        elif is_standard and function is Flight.u_dot_generalized:
+            u_dot, forces = kernel.u_dot(t, u.T)
+        elif is_standard and function is Flight.udot_rail1:
+            # Forces and moments are the same as in 6 DOF flight
+            _, forces = kernel.u_dot(t, u.T)
+            u_dot = kernel.u_dot_rail(t, u.T)
+        else:
+            first = len(self.__post_processed_variables)
+            for step_t, step_u in zip(t, u):
+                derivative(step_t, step_u, post_processing=True)
+            return self.__post_processed_variables[first:].copy()
+        return np.column_stack(
+            np.broadcast_arrays(t, *u_dot[3:6], *u_dot[10:13], *forces)
+        )
+
+    @cached_property
+    def __post_processing_kernel(self):
+        """Equations of motion evaluated on the original Functions for many
+        steps at once, see ``_FunctionKernel``."""
+        return _FunctionKernel(
+            self.rocket,
+            self.env,
+            [
+                self.__total_mass_ddot,
+                self.__r_cm_dot,
+                self.__r_cm_ddot,
+                *self.__inertia_dots,
+            ],
+        )
 
     def post_process(self, interpolation="spline", extrapolation="natural"):
         """This method is **deprecated** and is only kept here for backwards
@@ -2944,6 +3363,174 @@ class Flight:  # pylint: disable=too-many-public-methods
         # TODO: add a deprecation warning maybe?
         self.post_processed = True
 
+    def checkpoint(self, t):
+        """Capture the state of the simulation at a given time, so that new
+        flights can continue from it with Flight.branch. The checkpoint is
+        taken at the last integration step at or before t. It keeps the
+        state vector, the flight phases, the parachutes not triggered yet and
+        the state of the controllers at that step.
+
+        Parameters
+        ----------
+        t : int, float
+            Time of the checkpoint in seconds. Must be between the initial
+            and the final time of the flight, and before the impact.
+
+        Returns
+        -------
+        FlightCheckpoint
+            Checkpoint of the flight at time t.
+        """
+        if not self.t_initial <= t <= self.t_final or (
+            t == self.t_final and len(self.impact_state) > 1
+        ):
+            raise ValueError(
+                f"Checkpoint time must be between {self.t_initial} and "
+                f"{self.t_final} s, and before the impact."
+            )
+        index = int(np.searchsorted(self.time, t, side="right")) - 1
+        t = self.time[index]
+
+        phases = self.flight_phases[:-1]
+        current_phase = [phase for phase in phases if phase.t <= t][-1]
+        # Parachutes triggered before the checkpoint and not yet inflated
+        inflations = [
+            (t_event + parachute.lag, parachute.cd_s)
+            for t_event, parachute in self.parachute_events
+            if t_event <= t < t_event + parachute.lag
+        ]
+        monitors = {}
+        if len(self.out_of_rail_state) > 1 and self.out_of_rail_time <= t:
+            monitors.update(
+                out_of_rail_time=self.out_of_rail_time,
+                out_of_rail_time_index=self.out_of_rail_time_index,
+                out_of_rail_state=self.out_of_rail_state,
+            )
+        if len(self.apogee_state) > 1 and self.apogee_time <= t:
+            monitors.update(
+                apogee_state=self.apogee_state,
+                apogee_time=self.apogee_time,
+                apogee_x=self.apogee_x,
+                apogee_y=self.apogee_y,
+                apogee=self.apogee,
+            )
+        # Controllers called at the checkpoint time are called again
+        controller_states = [
+            state for state in self.__controller_states if state[0] < t
+        ]
+        _, observed_lengths, air_brakes_levels = controller_states[-1]
+        post_processed_variables = np.empty((0, 13))
+        if self._controllers:
+            post_processed_variables = self.__evaluate_post_process[
+                self.__evaluate_post_process[:, 0] <= t
+            ]
+        return FlightCheckpoint(
+            flight=self,
+            index=index,
+            parachutes=self.parachutes
+            + [
+                parachute for t_event, parachute in self.parachute_events if t_event > t
+            ],
+            controllers=self._controllers[:],
+            phases=[
+                (phase.t, phase.name, phase.callbacks)
+                for phase in phases
+                if phase.t < t
+            ],
+            derivative=current_phase.name,
+            callbacks=current_phase.callbacks,
+            inflations=inflations,
+            parachute_events=[
+                event for event in self.parachute_events if event[0] <= t
+            ],
+            triggered_events=[
+                event for event in self.triggered_events if event[0] <= t
+            ],
+            monitors=monitors,
+            observed_variables=[
+                (controller, controller.observed_variables[:length])
+                for controller, length in observed_lengths
+            ],
+            air_brakes_levels=air_brakes_levels,
+            controller_states=controller_states,
+            post_processed_variables=post_processed_variables,
+        )
+
+    def branch(self, checkpoint, **overrides):
+        """Simulate a new flight that continues from a checkpoint of this
+        flight, instead of integrating the whole trajectory again. The new
+        flight shares the solution of this flight up to the checkpoint and
+        may use a different recovery or controller configuration after it.
+
+        Parameters
+        ----------
+        checkpoint : FlightCheckpoint
+            Checkpoint of this flight, see Flight.checkpoint.
+        **overrides
+            Settings of the new flight that differ from this flight. Can be
+            ``parachutes``, a list of Parachute objects that replaces the
+            parachutes not yet triggered at the checkpoint, ``controllers``, a
+            list of controllers that replaces the controllers of the flight,
+            or any of the Flight arguments ``terminate_on_apogee``,
+            ``max_time``, ``max_time_step``, ``min_time_step``, ``rtol``,
+            ``atol``, ``time_overshoot``, ``verbose``, ``name``,
+            ``integrator`` and ``events``. Parachutes triggered before the
+            checkpoint keep their configuration.
+
+        Returns
+        -------
+        Flight
+            The branched flight.
+
+        Examples
+        --------
+        Compare two main parachutes without simulating the ascent twice:
+
+        >>> checkpoint = flight.checkpoint(flight.apogee_time) # doctest: +SKIP
+        >>> small = flight.branch(checkpoint, parachutes=[small_main]) # doctest: +SKIP
+        >>> large = flight.branch(checkpoint, parachutes=[large_main]) # doctest: +SKIP
+        """
+        if checkpoint.flight is not self:
+            raise ValueError("The checkpoint was not taken from this flight.")
+        arguments = {
+            "terminate_on_apogee": self.terminate_on_apogee,
+            "max_time": self.max_time,
+            "max_time_step": self.max_time_step,
+            "min_time_step": self.min_time_step,
+            "rtol": self.rtol,
+            "atol": self.atol,
+            "time_overshoot": self.time_overshoot,
+            "verbose": False,
+            "name": self.name,
+            "integrator": self.integrator,
+            "events": self.events,
+        }
+        invalid_overrides = set(overrides) - {"parachutes", "controllers", *arguments}
+        if invalid_overrides:
+            raise ValueError(
+                f"Invalid overrides {sorted(invalid_overrides)}. Valid ones are "
+                f"{['parachutes', 'controllers', *arguments]}."
+            )
+        checkpoint = copy(checkpoint)
+        checkpoint.parachutes = list(overrides.pop("parachutes", checkpoint.parachutes))
+        checkpoint.controllers = list(
+            overrides.pop("controllers", checkpoint.controllers)
+        )
+        arguments.update(overrides)
+        if arguments["max_time"] <= checkpoint.t:
+            raise ValueError("The max_time must be after the checkpoint time.")
+        return Flight(
+            rocket=self.rocket,
+            environment=self.env,
+            rail_length=self.rail_length,
+            inclination=self.inclination,
+            heading=self.heading,
+            initial_solution=checkpoint,
+            equations_of_motion=self.equations_of_motion,
+            kernel=self.kernel,
+            **arguments,
+        )
+
     def calculate_stall_wind_velocity(self, stall_angle):  # TODO: move to utilities
         """Function to calculate the maximum wind velocity before the angle of
         attack exceeds a desired angle, at the instant of departing rail launch.
@@ -3126,6 +3713,258 @@ class Flight:  # pylint: disable=too-many-public-methods
             encoding="utf-8",
         )
 
+    def save(self, file_name):
+        """Save the results of the flight to a compact binary file (.npz),
+        which can be read back with Flight.load without simulating the
+        flight again.
+
+        The file stores raw float64 arrays: the solution, the flight phase
+        boundaries, the triggered events, the parachute events and the
+        post-processed forces and moments. It also stores the atmosphere at
+        the altitudes reached by the flight and the time varying properties
+        of the rocket at the solution times, which the derived quantities
+        of the loaded flight are computed from.
+
+        Parameters
+        ----------
+        file_name : str
+            The file name or path of the saved file. The .npz extension is
+            appended if not present.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the flight was simulated with a ``scipy.integrate.OdeSolver``
+            subclass that is not one of the named integrators, since the
+            integrators are stored by name.
+        """
+        if isinstance(self.integrator, dict):
+            integrator = {
+                kind: get_integrator_name(value)
+                for kind, value in self.integrator.items()
+            }
+        else:
+            integrator = get_integrator_name(self.integrator)
+        time = np.unique(self.time)
+        heights = np.unique(self.solution_array[:, 3])
+        rocket, env = self.rocket, self.env
+        atmosphere = np.column_stack(
+            [heights]
+            + [
+                _evaluate_array(getattr(env, name), heights)
+                for name in ATMOSPHERE_COLUMNS[1:]
+            ]
+        )
+        rocket_history = np.column_stack(
+            [
+                time,
+                *(
+                    _evaluate_array(function, time)
+                    for function in (
+                        rocket.total_mass,
+                        rocket.I_11,
+                        rocket.I_22,
+                        rocket.I_33,
+                        rocket.motor.thrust,
+                        rocket.thrust_to_weight,
+                        rocket.static_margin,
+                        self.stability_margin,
+                    )
+                ),
+            ]
+        )
+        rail_button_forces = np.empty((0, 5))
+        if self.out_of_rail_time_index != 0 and rocket.rail_buttons:
+            forces = [
+                self.rail_button1_normal_force,
+                self.rail_button1_shear_force,
+                self.rail_button2_normal_force,
+                self.rail_button2_shear_force,
+            ]
+            rail_button_forces = np.column_stack(
+                [forces[0].x_array, *(force.y_array for force in forces)]
+            )
+        parachutes = [
+            archive_parachute(parachute) for _, parachute in self.parachute_events
+        ]
+        metadata = {
+            "version": 1,
+            "name": self.name,
+            "rail_length": self.rail_length,
+            "inclination": self.inclination,
+            "heading": self.heading,
+            "initial_solution": list(self.initial_solution),
+            "terminate_on_apogee": self.terminate_on_apogee,
+            "max_time": self.max_time,
+            "max_time_step": self.max_time_step,
+            "min_time_step": self.min_time_step,
+            "rtol": self.rtol,
+            "atol": self.atol,
+            "time_overshoot": self.time_overshoot,
+            "equations_of_motion": self.equations_of_motion,
+            "kernel": self.kernel,
+            "integrator": integrator,
+            "t_final": self.t_final,
+            "out_of_rail_time": self.out_of_rail_time,
+            "out_of_rail_time_index": self.out_of_rail_time_index,
+            "apogee_time": self.apogee_time,
+            "effective_1rl": self.effective_1rl,
+            "effective_2rl": self.effective_2rl,
+            "elevation": env.elevation,
+            "latitude": env.latitude,
+            "longitude": env.longitude,
+            "earth_radius": env.earth_radius,
+            "standard_g": env.standard_g,
+            "radius": rocket.radius,
+            "rail_buttons": len(rocket.rail_buttons),
+            "burn_out_time": rocket.motor.burn_out_time,
+        }
+        np.savez(
+            file_name,
+            metadata=json.dumps(
+                metadata, default=lambda value: np.asarray(value).tolist()
+            ),
+            solution=self.solution_array,
+            post_processed=self.__evaluate_post_process,
+            phase_times=[phase.t for phase in self.flight_phases],
+            out_of_rail_state=self.out_of_rail_state,
+            apogee_state=self.apogee_state,
+            impact_state=self.impact_state,
+            event_times=[t for t, _, _ in self.triggered_events],
+            event_names=[event.name for _, event, _ in self.triggered_events],
+            event_directions=[event.direction for _, event, _ in self.triggered_events],
+            event_terminal=[event.terminal for _, event, _ in self.triggered_events],
+            event_states=np.reshape(
+                [state for _, _, state in self.triggered_events], (-1, 13)
+            ),
+            parachute_times=[t for t, _ in self.parachute_events],
+            parachute_names=[name for name, _, _ in parachutes],
+            parachute_triggers=[trigger for _, trigger, _ in parachutes],
+            parachute_values=np.reshape(
+                [values for _, _, values in parachutes], (-1, 6)
+            ),
+            function_evaluations=self.function_evaluations,
+            atmosphere=atmosphere,
+            rocket=rocket_history,
+            rail_button_forces=rail_button_forces,
+        )
+
+    @classmethod
+    def load(cls, file_name):
+        """Load a flight saved with Flight.save. No simulation is run: the
+        loaded flight reads its solution and post-processed forces from the
+        file, and its derived quantities, such as ``speed``, ``mach_number``
+        or ``aerodynamic_drag``, are computed from them only when requested.
+
+        The rocket and the environment of the loaded flight are stand-ins
+        that only know the archived atmosphere and rocket properties. The
+        loaded flight cannot be checkpointed or branched.
+
+        Parameters
+        ----------
+        file_name : str
+            The file name or path of the saved file.
+
+        Returns
+        -------
+        Flight
+            The loaded flight.
+        """
+        with np.load(file_name, allow_pickle=False) as archive:
+            data = dict(archive)
+        metadata = json.loads(str(data["metadata"]))
+        if metadata["version"] != 1:
+            raise ValueError(f"Unsupported flight file version {metadata['version']}.")
+
+        flight = cls.__new__(cls)
+        for name in (
+            "name",
+            "rail_length",
+            "inclination",
+            "heading",
+            "initial_solution",
+            "terminate_on_apogee",
+            "max_time",
+            "max_time_step",
+            "min_time_step",
+            "rtol",
+            "atol",
+            "time_overshoot",
+            "equations_of_motion",
+            "kernel",
+            "integrator",
+            "t_final",
+            "out_of_rail_time",
+            "out_of_rail_time_index",
+            "apogee_time",
+            "effective_1rl",
+            "effective_2rl",
+        ):
+            setattr(flight, name, metadata[name])
+        parachute_events = [
+            [t, restore_parachute(name, trigger, values)]
+            for t, name, trigger, values in zip(
+                data["parachute_times"],
+                data["parachute_names"],
+                data["parachute_triggers"],
+                data["parachute_values"],
+            )
+        ]
+        flight.env = _ArchivedEnvironment(metadata, data["atmosphere"])
+        flight.rocket = _ArchivedRocket(
+            metadata,
+            data["rocket"],
+            [parachute for _, parachute in parachute_events],
+        )
+        flight.solution = GrowableArray.shared(data["solution"])
+        flight.function_evaluations = data["function_evaluations"].tolist()
+        flight.t_initial = flight.solution[0][0]
+        flight.t = flight.solution[-1][0]
+        flight.y_sol = flight.solution[-1][1:]
+        flight.events = []
+        flight.parachutes = []
+        flight.parachute_events = parachute_events
+        flight.triggered_events = [
+            [t, FlightEvent(str(name), None, int(direction), bool(terminal)), state]
+            for t, name, direction, terminal, state in zip(
+                data["event_times"],
+                data["event_names"],
+                data["event_directions"],
+                data["event_terminal"],
+                data["event_states"],
+            )
+        ]
+        flight._controllers = []
+        flight.post_processed = False
+        flight.out_of_rail_state = data["out_of_rail_state"]
+        flight.apogee_state = data["apogee_state"]
+        if len(flight.apogee_state) > 1:
+            flight.apogee_x, flight.apogee_y, flight.apogee = flight.apogee_state[:3]
+        flight.impact_state = data["impact_state"]
+        flight.x_impact, flight.y_impact, flight.z_impact = 0, 0, 0
+        flight.impact_velocity = 0
+        if len(flight.impact_state) > 1:
+            flight.x_impact, flight.y_impact, flight.z_impact = flight.impact_state[:3]
+            flight.impact_velocity = flight.impact_state[5]
+        flight.flight_phases = cls.FlightPhases()
+        for t in data["phase_times"]:
+            flight.flight_phases.add_phase(t)
+        flight.__evaluate_post_process = data["post_processed"]
+        forces = data["rail_button_forces"]
+        if len(forces) == 0:
+            flight.__calculate_rail_button_forces = ([], [], [], [])
+        else:
+            flight.__calculate_rail_button_forces = tuple(
+                forces[:, [0, column]] for column in range(1, 5)
+            )
+        flight.prints = _FlightPrints(flight)
+        flight.plots = _FlightPlots(flight)
+        return flight
+
     def export_kml(  # TODO: should be moved out of this class.
         self,
         file_name="trajectory.kml",
@@ -3221,8 +4060,8 @@ class Flight:  # pylint: disable=too-many-public-methods
         self.info()
         self.plots.all()
 
-    def time_iterator(self, node_list):
-        i = 0
+    def time_iterator(self, node_list, start=0):
+        i = start
         while i < len(node_list) - 1:
             yield i, node_list[i]
             i += 1
@@ -3352,7 +4191,9 @@ class Flight:  # pylint: disable=too-many-public-methods
             flight_phase.t += adjust
             self.add(flight_phase, new_index)
 
-        def add_phase(self, t, derivatives=None, callback=None, clear=True, index=None):
+        def add_phase(
+            self, t, derivatives=None, callback=None, clear=True, index=None, name=None
+        ):
             """Add a new flight phase to the list, with the specified
             characteristics. This method creates a new FlightPhase instance and
             adds it to the flight phases list, either at the specified index
@@ -3376,12 +4217,16 @@ class Flight:  # pylint: disable=too-many-public-methods
                 The index at which the new flight phase should be inserted.
                 If not provided, the flight phase will be appended
                 to the end of the list. Default is None.
+            name : str, optional
+                Name of the Flight method that computes the derivatives. If
+                not provided, the name of the derivatives function is used.
+                Default is None.
 
             Returns
             -------
             None
             """
-            self.add(self.FlightPhase(t, derivatives, callback, clear), index)
+            self.add(self.FlightPhase(t, derivatives, callback, clear, name), index)
 
         def flush_after(self, index):
             """This function deletes all flight phases after a given index.
@@ -3413,20 +4258,26 @@ class Flight:  # pylint: disable=too-many-public-methods
                 phase.
             clear : bool
                 A flag indicating whether to clear the solution after the phase.
+            name : str, None
+                Name of the Flight method that computes the derivatives, which
+                identifies the kind of phase and is saved in checkpoints. None
+                if the phase has no derivative function.
             """
 
-            # TODO: add a "name" optional argument to the FlightPhase. Really helps.
-
-            def __init__(self, t, derivative=None, callbacks=None, clear=True):
+            def __init__(
+                self, t, derivative=None, callbacks=None, clear=True, name=None
+            ):
                 self.t = t
                 self.derivative = derivative
                 self.callbacks = callbacks[:] if callbacks is not None else []
                 self.clear = clear
+                if name is None and derivative is not None:
+                    name = derivative.__name__
+                self.name = name
 
             def __repr__(self):
-                name = "None" if self.derivative is None else self.derivative.__name__
                 return (
-                    f"<FlightPhase(t= {self.t}, derivative= {name}, "
+                    f"<FlightPhase(t= {self.t}, derivative= {self.name}, "
                     f"callbacks= {self.callbacks}, clear= {self.clear})>"
                 )
 
@@ -0,0 +1,179 @@
+"""Stand-ins for the Rocket and the Environment of a Flight loaded with
+``Flight.load``.
+
+A saved flight keeps the atmosphere profiles sampled at the altitudes of its
+solution and the time varying rocket properties sampled at its solution
+times. The classes in this module expose those samples with the attribute
+names used by the Flight methods, so that the derived quantities of a loaded
+flight are computed, when requested, exactly as for a simulated one. The
+Functions are only created when they are first accessed.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+from ..mathutils.function import Function
+from ..rocket.parachute import Parachute
+
+# Columns of the "atmosphere" array of a flight archive
+ATMOSPHERE_COLUMNS = (
+    "height",
+    "pressure",
+    "density",
+    "dynamic_viscosity",
+    "speed_of_sound",
+    "wind_velocity_x",
+    "wind_velocity_y",
+)
+# Columns of the "rocket" array of a flight archive
+ROCKET_COLUMNS = (
+    "time",
+    "total_mass",
+    "I_11",
+    "I_22",
+    "I_33",
+    "thrust",
+    "thrust_to_weight",
+    "static_margin",
+    "stability_margin",
+)
+
+
+class _ArchivedEnvironment:
+    """Environment of a loaded flight. The atmosphere is only known at the
+    altitudes reached by the flight."""
+
+    def __init__(self, metadata, atmosphere):
+        self.elevation = metadata["elevation"]
+        self.latitude = metadata["latitude"]
+        self.longitude = metadata["longitude"]
+        self.earth_radius = metadata["earth_radius"]
+        self.standard_g = metadata["standard_g"]
+        self._atmosphere = atmosphere
+
+    def __repr__(self):
+        return f"<ArchivedEnvironment(elevation= {self.elevation})>"
+
+    def __profile(self, name, unit):
+        column = ATMOSPHERE_COLUMNS.index(name)
+        return Function(
+            self._atmosphere[:, [0, column]],
+            "Height Above Sea Level (m)",
+            f"{name.replace('_', ' ').title()} ({unit})",
+            "linear",
+            "constant",
+        )
+
+    @cached_property
+    def pressure(self):
+        return self.__profile("pressure", "Pa")
+
+    @cached_property
+    def density(self):
+        return self.__profile("density", "kg/m³")
+
+    @cached_property
+    def dynamic_viscosity(self):
+        return self.__profile("dynamic_viscosity", "Pa s")
+
+    @cached_property
+    def speed_of_sound(self):
+        return self.__profile("speed_of_sound", "m/s")
+
+    @cached_property
+    def wind_velocity_x(self):
+        return self.__profile("wind_velocity_x", "m/s")
+
+    @cached_property
+    def wind_velocity_y(self):
+        return self.__profile("wind_velocity_y", "m/s")
+
+
+class _ArchivedMotor:
+    """Motor of a loaded flight."""
+
+    def __init__(self, burn_out_time, rocket):
+        self.burn_out_time = burn_out_time
+        self.__rocket = rocket
+
+    @cached_property
+    def thrust(self):
+        return self.__rocket._history("thrust", "Thrust (N)")
+
+
+class _ArchivedRocket:
+    """Rocket of a loaded flight. Its properties are only known at the
+    solution times of the flight."""
+
+    def __init__(self, metadata, history, parachutes):
+        self.radius = metadata["radius"]
+        # Only the number of rail buttons is archived
+        self.rail_buttons = [None] * metadata["rail_buttons"]
+        self.parachutes = parachutes
+        self.motor = _ArchivedMotor(metadata["burn_out_time"], self)
+        self.__history = history
+
+    def __repr__(self):
+        return f"<ArchivedRocket(radius= {self.radius})>"
+
+    def _history(self, name, output):
+        column = ROCKET_COLUMNS.index(name)
+        return Function(
+            self.__history[:, [0, column]], "Time (s)", output, "linear", "constant"
+        )
+
+    @cached_property
+    def total_mass(self):
+        return self._history("total_mass", "Total Mass (kg)")
+
+    @cached_property
+    def I_11(self):
+        return self._history("I_11", "Inertia I_11 (kg m²)")
+
+    @cached_property
+    def I_22(self):
+        return self._history("I_22", "Inertia I_22 (kg m²)")
+
+    @cached_property
+    def I_33(self):
+        return self._history("I_33", "Inertia I_33 (kg m²)")
+
+    @cached_property
+    def thrust_to_weight(self):
+        return self._history("thrust_to_weight", "Thrust/Weight")
+
+    @cached_property
+    def static_margin(self):
+        return self._history("static_margin", "Static Margin (c)")
+
+    @cached_property
+    def _stability_margin(self):
+        return self._history("stability_margin", "Stability Margin (c)")
+
+    def stability_margin(self, mach, time):  # pylint: disable=unused-argument
+        """Stability margin at the given time. It was archived along the
+        flight, so the mach number is not needed."""
+        return self._stability_margin.get_value_opt(time)
+
+
+def archive_parachute(parachute):
+    """Describe a parachute as the strings and floats stored in a flight
+    archive. Callable triggers cannot be stored and are saved as NaN."""
+    trigger = parachute.trigger
+    if callable(trigger):
+        trigger = np.nan
+    return (
+        parachute.name,
+        str(trigger),
+        [parachute.cd_s, parachute.sampling_rate, parachute.lag, *parachute.noise],
+    )
+
+
+def restore_parachute(name, trigger, values):
+    """Create a parachute from the data given by ``archive_parachute``. A
+    parachute whose trigger was a callable never triggers."""
+    cd_s, sampling_rate, lag, *noise = values
+    if trigger.lower() != "apogee":
+        trigger = float(trigger)
+    return Parachute(name, cd_s, trigger, sampling_rate, lag, tuple(noise))
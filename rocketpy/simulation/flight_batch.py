@@ -0,0 +1,1147 @@
+"""Lockstep simulation of many flights that share the same topology.
+
+A ``FlightBatch`` integrates N flights together. Their states are stored in a
+single (N, 13) array and the equations of motion are evaluated for every
+flight at once with NumPy array operations, using the tables of one compiled
+flight kernel per flight (see ``rocketpy.simulation.flight_kernel``) stacked
+along a leading batch axis. Flights that reach their terminal event leave the
+active mask and are no longer integrated.
+"""
+
+from copy import deepcopy
+
+import numpy as np
+from scipy.integrate import RK45
+
+from .flight_kernel import _FlightKernel, _VectorizedKernel
+
+# Flight phase of each member of the batch
+_RAIL = 0
+_FLIGHT = 1
+_PARACHUTE = 2
+
+# Parachute trigger kinds that are evaluated for all members at once
+_TRIGGER_APOGEE = 0
+_TRIGGER_ALTITUDE = 1
+_TRIGGER_CALLABLE = 2
+
+
+class _StackedTable:
+    """Uniform tables of several flights stacked along a leading batch axis.
+    Every table must have the same number of grid points and columns, but
+    their grids may differ."""
+
+    def __init__(self, tables):
+        """Stack the tables.
+
+        Parameters
+        ----------
+        tables : list[_UniformTable]
+            Tables to be stacked, one per compiled kernel.
+        """
+        self.start = np.array([table.start for table in tables])
+        self.inverse_step = np.array([table.inverse_step for table in tables])
+        self.last_index = tables[0].last_index
+        self.values = np.stack([table.values for table in tables])
+        self.slopes = np.stack([table.slopes for table in tables])
+
+    def evaluate(self, x, kernels):
+        """Interpolate all columns of several tables, each at its own point.
+
+        Parameters
+        ----------
+        x : float, np.ndarray
+            Points at which the tables are evaluated, of shape (m,).
+        kernels : np.ndarray
+            Index of the table evaluated at each point, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated values, of shape (m, k).
+        """
+        position = np.clip(
+            (x - self.start[kernels]) * self.inverse_step[kernels], 0, self.last_index
+        )
+        # NaN positions, from diverging trial states, are kept as NaN values
+        index = np.minimum(np.nan_to_num(position).astype(np.intp), self.last_index - 1)
+        weight = (position - index)[:, np.newaxis]
+        return self.values[kernels, index] + weight * self.slopes[kernels, index]
+
+
+class _SelectedTable:
+    """Stacked table restricted to the compiled kernels of some flights,
+    called like a ``_UniformTable`` with one point per flight."""
+
+    def __init__(self, table, kernels):
+        self.table = table
+        self.kernels = kernels
+
+    def __call__(self, x):
+        """Interpolate all columns of each flight's table at its point.
+
+        Parameters
+        ----------
+        x : float, np.ndarray
+            Points at which the tables are evaluated, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated values, of shape (k, m), one row per column.
+        """
+        return self.table.evaluate(x, self.kernels).T
+
+
+class _KernelSelection(_VectorizedKernel):
+    """Compiled kernels of several flights seen as a single kernel, whose
+    tables and constants hold one value per flight. The inherited equations
+    of motion then evaluate every flight at once."""
+
+    # Rockets with air brakes are not simulated in batches
+    air_brakes = ()
+
+    def __init__(self, batch_kernel, kernels):  # pylint: disable=super-init-not-called
+        """Select the tables and constants of some flights.
+
+        Parameters
+        ----------
+        batch_kernel : _BatchFlightKernel
+            Stacked tables and constants of every flight of the batch.
+        kernels : np.ndarray
+            Index of the compiled kernel of each selected flight, of shape
+            (m,).
+        """
+        self.motor_table = _SelectedTable(batch_kernel.motor_table, kernels)
+        self.atmosphere_table = _SelectedTable(batch_kernel.atmosphere_table, kernels)
+        self.drag_table = _SelectedTable(batch_kernel.drag_table, kernels)
+        self.surfaces = [
+            (
+                cpz[kernels],
+                reference_area[kernels],
+                reference_length[kernels],
+                None if cant_angle is None else cant_angle[kernels],
+                _SelectedTable(table, kernels),
+            )
+            for cpz, reference_area, reference_length, cant_angle, table in (
+                batch_kernel.surfaces
+            )
+        ]
+        for name in _BatchFlightKernel.CONSTANTS:
+            setattr(self, name, getattr(batch_kernel, name)[kernels])
+
+
+class _BatchFlightKernel:
+    """Equations of motion of several flights, evaluated at once from the
+    stacked tables of their compiled kernels: the rail, 6 DOF and parachute
+    equations of ``_FlightKernel``, applied through a ``_KernelSelection``
+    to arrays of shape (m,)."""
+
+    # Constants of the compiled kernels, stacked with one value per flight
+    CONSTANTS = (
+        "burn_out_time",
+        "area",
+        "dry_mass",
+        "nozzle_to_cdm",
+        "s_nozzle_11",
+        "s_nozzle_33",
+        "cp_eccentricity_x",
+        "cp_eccentricity_y",
+        "thrust_eccentricity_x",
+        "thrust_eccentricity_y",
+    )
+
+    def __init__(self, kernels):
+        """Stack the tables of the compiled kernels.
+
+        Parameters
+        ----------
+        kernels : list[_FlightKernel]
+            Compiled kernels, which must share the same topology: the same
+            number of aerodynamic surfaces, in the same order, and the same
+            surfaces with roll parameters.
+        """
+        self.motor_table = _StackedTable([kernel.motor_table for kernel in kernels])
+        self.atmosphere_table = _StackedTable(
+            [kernel.atmosphere_table for kernel in kernels]
+        )
+        self.drag_table = _StackedTable([kernel.drag_table for kernel in kernels])
+        self.surfaces = []
+        for surfaces in zip(*(kernel.surfaces for kernel in kernels)):
+            cpz, reference_area, reference_length, cant_angle, _ = zip(*surfaces)
+            self.surfaces.append(
+                (
+                    np.array(cpz),
+                    np.array(reference_area),
+                    np.array(reference_length),
+                    None if cant_angle[0] is None else np.array(cant_angle),
+                    _StackedTable([surface[4] for surface in surfaces]),
+                )
+            )
+
+        for name in self.CONSTANTS:
+            setattr(self, name, np.array([getattr(kernel, name) for kernel in kernels]))
+
+    def u_dot(self, t, u, kernels):
+        """Evaluate the 6 DOF equations of motion of several flights, with
+        ``_FlightKernel.u_dot``.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds, shared by every flight.
+        u : np.ndarray
+            State vectors, of shape (m, 13).
+        kernels : np.ndarray
+            Index of the compiled kernel of each flight, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            State vector derivatives, of shape (m, 13).
+        """
+        u_dot, _ = _KernelSelection(self, kernels).u_dot(t, u.T)
+        return np.column_stack(u_dot)
+
+    def u_dot_rail(self, t, u, kernels):
+        """Evaluate the 1 DOF equations of motion of several flights that are
+        still on the launch rail, with ``_FlightKernel.u_dot_rail``.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds, shared by every flight.
+        u : np.ndarray
+            State vectors, of shape (m, 13).
+        kernels : np.ndarray
+            Index of the compiled kernel of each flight, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            State vector derivatives, of shape (m, 13).
+        """
+        u_dot = _KernelSelection(self, kernels).u_dot_rail(t, u.T)
+        return np.column_stack(np.broadcast_arrays(*u_dot))
+
+    def u_dot_parachute(self, u, kernels, cd_s):
+        """Evaluate the 3 DOF equations of motion of several flights
+        descending under parachute, with ``_FlightKernel.u_dot_parachute``.
+
+        Parameters
+        ----------
+        u : np.ndarray
+            State vectors, of shape (m, 13).
+        kernels : np.ndarray
+            Index of the compiled kernel of each flight, of shape (m,).
+        cd_s : np.ndarray
+            Drag coefficient times reference area of the inflated parachute
+            of each flight, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            State vector derivatives, of shape (m, 13).
+        """
+        u_dot, _ = _KernelSelection(self, kernels).u_dot_parachute(u.T, cd_s)
+        return np.column_stack(np.broadcast_arrays(*u_dot))
+
+
+def _hermite(s, h, y0, f0, y1, f1):
+    """Cubic Hermite interpolation of several steps at once.
+
+    Parameters
+    ----------
+    s : np.ndarray
+        Normalized position inside each step, between 0 and 1, of shape (m,).
+    h : float
+        Step size.
+    y0, f0 : np.ndarray
+        States and derivatives at the start of each step, of shape (m, 13).
+    y1, f1 : np.ndarray
+        States and derivatives at the end of each step, of shape (m, 13).
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated states, of shape (m, 13).
+    """
+    s = s[:, np.newaxis]
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+def _locate(event_function, h, y0, f0, y1, f1, iterations=40):
+    """Locate the zero crossings of an event function inside several steps
+    at once, by bisection on the cubic Hermite interpolant of each step.
+
+    Parameters
+    ----------
+    event_function : callable
+        Event function ``g(u)`` of an array of states of shape (m, 13),
+        returning an array of shape (m,). It must change sign inside every
+        step.
+    h : float
+        Step size.
+    y0, f0 : np.ndarray
+        States and derivatives at the start of each step, of shape (m, 13).
+    y1, f1 : np.ndarray
+        States and derivatives at the end of each step, of shape (m, 13).
+    iterations : int, optional
+        Number of bisections. Default is 40.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Normalized position of the crossing inside each step, of shape (m,),
+        and the state at the crossing, of shape (m, 13).
+    """
+    low = np.zeros(len(y0))
+    high = np.ones(len(y0))
+    g_low = event_function(y0)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        g_middle = event_function(_hermite(middle, h, y0, f0, y1, f1))
+        same_sign = np.sign(g_middle) == np.sign(g_low)
+        low = np.where(same_sign, middle, low)
+        g_low = np.where(same_sign, g_middle, g_low)
+        high = np.where(same_sign, high, middle)
+    return high, _hermite(high, h, y0, f0, y1, f1)
+
+
+def _broadcast(name, value, number_of_flights):
+    """Broadcast a scalar argument of FlightBatch to a list with one value per
+    flight. Lists, tuples and arrays must already have one value per flight."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        if len(value) != number_of_flights:
+            raise ValueError(
+                f"'{name}' has {len(value)} values, but the batch has "
+                f"{number_of_flights} flights."
+            )
+        return list(value)
+    return [value] * number_of_flights
+
+
+class FlightBatch:  # pylint: disable=too-many-instance-attributes
+    """Simulates many flights together, in lockstep.
+
+    The flights are integrated with the Dormand-Prince method (RK45) and a
+    step size shared by all flights, controlled by the largest error among
+    them. At every step, the equations of motion of all active flights are
+    evaluated at once with NumPy array operations over a state array of
+    shape (N, 13). Each flight goes through the same phases as a ``Flight``:
+    1 DOF motion on the launch rail, 6 DOF flight and 3 DOF descent under
+    parachute. Flights that hit the ground, or reach apogee when
+    ``terminate_on_apogee`` is True, leave the active mask and are no longer
+    integrated.
+
+    Every Rocket and Environment is compiled into the tables of a flight
+    kernel, the same used by ``Flight(..., kernel="compiled")``. Flights that
+    share the same Rocket and Environment objects share their tables.
+
+    Attributes
+    ----------
+    FlightBatch.rockets : list[Rocket]
+        Rocket of each flight.
+    FlightBatch.environments : list[Environment]
+        Environment of each flight.
+    FlightBatch.rail_length : np.ndarray
+        Launch rail length of each flight, in meters.
+    FlightBatch.inclination : np.ndarray
+        Rail inclination of each flight, in degrees.
+    FlightBatch.heading : np.ndarray
+        Rail heading of each flight, in degrees.
+    FlightBatch.number_of_flights : int
+        Number of flights in the batch.
+    FlightBatch.max_time_step : float
+        Maximum integration time step, in seconds.
+    FlightBatch.min_time_step : float
+        Minimum integration time step, in seconds.
+    FlightBatch.rtol : float
+        Relative error tolerance of the integration.
+    FlightBatch.atol : list
+        Absolute error tolerance of each state variable.
+    FlightBatch.steps : int
+        Number of lockstep integration steps taken.
+    FlightBatch.state : np.ndarray
+        Final state of each flight, of shape (N, 13), as in
+        [x, y, z, vx, vy, vz, e0, e1, e2, e3, w1, w2, w3].
+    FlightBatch.active : np.ndarray
+        Boolean mask of the flights still being integrated. After the
+        simulation, only flights that reached ``max_time`` remain active.
+    FlightBatch.diverged : np.ndarray
+        Boolean mask of the flights stopped because their integration error
+        was not controlled even by the minimum time step, usually because
+        their state diverged.
+    FlightBatch.t_final : np.ndarray
+        Time at which each flight stopped, in seconds.
+    FlightBatch.out_of_rail_time : np.ndarray
+        Time at which each flight left the launch rail, in seconds.
+    FlightBatch.out_of_rail_velocity : np.ndarray
+        Speed of each flight when leaving the launch rail, in m/s.
+    FlightBatch.apogee_time : np.ndarray
+        Time of apogee of each flight, in seconds.
+    FlightBatch.apogee : np.ndarray
+        Apogee altitude above sea level of each flight, in meters.
+    FlightBatch.apogee_x, FlightBatch.apogee_y : np.ndarray
+        Position of each flight at apogee, in meters.
+    FlightBatch.x_impact, FlightBatch.y_impact : np.ndarray
+        Impact position of each flight, in meters.
+    FlightBatch.impact_velocity : np.ndarray
+        Vertical velocity of each flight at impact, in m/s.
+    FlightBatch.parachute_events : list[list]
+        For each flight, a list of [t, parachute] with the trigger time of
+        every parachute.
+
+    Events a flight never reached are set to NaN.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        rockets,
+        environments,
+        rail_length,
+        inclination=80.0,
+        heading=90.0,
+        terminate_on_apogee=False,
+        max_time=600,
+        max_time_step=np.inf,
+        min_time_step=0,
+        rtol=1e-6,
+        atol=None,
+        name="FlightBatch",
+    ):
+        """Run the trajectory simulation of every flight in the batch.
+
+        Parameters
+        ----------
+        rockets : Rocket, list[Rocket]
+            Rocket of each flight, or a single Rocket used by every flight.
+            All rockets must share the same topology: the same number of
+            aerodynamic surfaces, in the same order, and the same number of
+            parachutes. Rockets with air brakes or controllers are not
+            supported.
+        environments : Environment, list[Environment]
+            Environment of each flight, or a single Environment used by every
+            flight.
+        rail_length : int, float, list
+            Launch rail length of each flight, in meters, or a single value
+            used by every flight.
+        inclination : int, float, list, optional
+            Rail inclination of each flight, in degrees, relative to the
+            ground. Default is 80.
+        heading : int, float, list, optional
+            Rail heading of each flight, in degrees, relative to north.
+            Default is 90.
+        terminate_on_apogee : bool, optional
+            If True, every flight stops at apogee. Default is False.
+        max_time : int, float, optional
+            Maximum simulation time, in seconds. Default is 600.
+        max_time_step : int, float, optional
+            Maximum integration time step, in seconds. Default is np.inf.
+        min_time_step : int, float, optional
+            Minimum integration time step, in seconds. Flights whose error
+            requires smaller steps are stopped and flagged as diverged.
+            Steps are never smaller than ten times the floating point
+            spacing of the time, whatever this value. Default is 0.
+        rtol : float, optional
+            Relative error tolerance of the integration. Default is 1e-6.
+        atol : list, optional
+            Absolute error tolerance of each state variable. Default is
+            6*[1e-3] + 4*[1e-6] + 3*[1e-3], as in Flight.
+        name : str, optional
+            Name of the batch. Default is "FlightBatch".
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Flights switch from rail to 6 DOF flight, and to parachute descent,
+        at the end of the step in which the event happens. The reported
+        event times and states, however, are located inside the step by
+        root finding on the cubic Hermite interpolant of the step.
+        """
+        sequences = [
+            value
+            for value in (rockets, environments, rail_length, inclination, heading)
+            if isinstance(value, (list, tuple, np.ndarray))
+        ]
+        number_of_flights = len(sequences[0]) if sequences else 1
+        if number_of_flights == 0:
+            raise ValueError("A FlightBatch must have at least one flight.")
+        if max_time_step <= 0:
+            raise ValueError("The maximum time step must be a positive value.")
+        if not 0 <= min_time_step <= max_time_step:
+            raise ValueError(
+                "The minimum time step must be between 0 and the maximum time step."
+            )
+
+        self.rockets = _broadcast("rockets", rockets, number_of_flights)
+        self.environments = _broadcast("environments", environments, number_of_flights)
+        self.rail_length = np.array(
+            _broadcast("rail_length", rail_length, number_of_flights), dtype=float
+        )
+        if np.any(self.rail_length <= 0):
+            raise ValueError("Rail length must be a positive value.")
+        self.inclination = np.array(
+            _broadcast("inclination", inclination, number_of_flights), dtype=float
+        )
+        self.heading = np.array(
+            _broadcast("heading", heading, number_of_flights), dtype=float
+        )
+        self.number_of_flights = number_of_flights
+        self.terminate_on_apogee = terminate_on_apogee
+        self.max_time = max_time
+        self.max_time_step = max_time_step
+        self.min_time_step = min_time_step
+        self.rtol = rtol
+        self.atol = np.asarray(atol or 6 * [1e-3] + 4 * [1e-6] + 3 * [1e-3])
+        self.name = name
+
+        self.__init_kernels()
+        self.__init_parachutes()
+        self.__init_flight_state()
+        self.__simulate()
+
+    @classmethod
+    def from_stochastic(cls, environment, rocket, flight, number_of_flights, **kwargs):
+        """Sample the flights of a batch from stochastic models, as done by
+        ``MonteCarlo`` for each of its simulations.
+
+        Parameters
+        ----------
+        environment : StochasticEnvironment
+            Stochastic environment sampled for each flight.
+        rocket : StochasticRocket
+            Stochastic rocket sampled for each flight.
+        flight : StochasticFlight
+            Stochastic flight from which the rail length, inclination,
+            heading and ``terminate_on_apogee`` of each flight are sampled.
+            Its initial solution must not be set, since every flight of the
+            batch starts on the launch rail.
+        number_of_flights : int
+            Number of flights to be sampled.
+        **kwargs
+            Other arguments passed to ``FlightBatch``, such as ``max_time``
+            or ``rtol``.
+
+        Returns
+        -------
+        FlightBatch
+            The simulated batch. Its ``inputs_log`` attribute holds the
+            sampled inputs of each flight.
+        """
+        if flight.initial_solution is not None:
+            raise ValueError(
+                "FlightBatch does not support an initial solution. Every "
+                "flight starts on the launch rail."
+            )
+        environments, rockets, inputs_log = [], [], []
+        rail_lengths, inclinations, headings = [], [], []
+        for _ in range(number_of_flights):
+            # The stochastic environment changes the same Environment object
+            # at every sample, so each sample is copied
+            environments.append(deepcopy(environment.create_object()))
+            rockets.append(rocket.create_object())
+            rail_lengths.append(flight._randomize_rail_length())
+            inclinations.append(flight._randomize_inclination())
+            headings.append(flight._randomize_heading())
+            inputs_log.append(
+                dict(
+                    item
+                    for d in [
+                        environment.last_rnd_dict,
+                        rocket.last_rnd_dict,
+                        flight.last_rnd_dict,
+                    ]
+                    for item in d.items()
+                )
+            )
+        batch = cls(
+            rockets,
+            environments,
+            rail_lengths,
+            inclinations,
+            headings,
+            terminate_on_apogee=bool(flight.terminate_on_apogee),
+            **kwargs,
+        )
+        batch.inputs_log = inputs_log
+        return batch
+
+    def __repr__(self):
+        return (
+            f"<FlightBatch(number_of_flights= {self.number_of_flights}, "
+            f"max_time= {self.max_time}, "
+            f"name= {self.name})>"
+        )
+
+    def __init_kernels(self):
+        """Compile one flight kernel per distinct (rocket, environment) pair
+        and stack their tables."""
+        kernels, kernel_index, indexes = [], [], {}
+        for rocket, environment in zip(self.rockets, self.environments):
+            if rocket._controllers or rocket.air_brakes:
+                raise ValueError(
+                    "FlightBatch does not support rockets with air brakes or "
+                    "controllers."
+                )
+            key = (id(rocket), id(environment))
+            if key not in indexes:
+                indexes[key] = len(kernels)
+                kernels.append(_FlightKernel(rocket, environment))
+            kernel_index.append(indexes[key])
+
+        reference = kernels[0]
+        for kernel in kernels[1:]:
+            if len(kernel.surfaces) != len(reference.surfaces) or any(
+                (surface[3] is None) != (reference_surface[3] is None)
+                for surface, reference_surface in zip(
+                    kernel.surfaces, reference.surfaces
+                )
+            ):
+                raise ValueError(
+                    "Every rocket of a FlightBatch must have the same "
+                    "aerodynamic surfaces, in the same order."
+                )
+        self.__kernel = _BatchFlightKernel(kernels)
+        self.__kernel_index = np.array(kernel_index)
+
+    def __init_parachutes(self):
+        """Gather the parameters of the parachutes of every flight into
+        arrays of shape (N, P), where P is the number of parachutes."""
+        number_of_parachutes = len(self.rockets[0].parachutes)
+        if any(
+            len(rocket.parachutes) != number_of_parachutes for rocket in self.rockets
+        ):
+            raise ValueError(
+                "Every rocket of a FlightBatch must have the same number of "
+                "parachutes."
+            )
+        shape = (self.number_of_flights, number_of_parachutes)
+        self.__parachute_cd_s = np.zeros(shape)
+        self.__parachute_lag = np.zeros(shape)
+        self.__parachute_period = np.zeros(shape)
+        self.__trigger_kind = np.zeros(shape, dtype=int)
+        self.__trigger_height = np.full(shape, np.nan)
+        # Last pressure noise sample of each parachute of each flight, which
+        # correlates the next sample, see Parachute.noise_function. Flights
+        # may share Parachute objects, so their noise signals are not used
+        self.__last_noise = np.zeros(shape)
+        for i, rocket in enumerate(self.rockets):
+            for j, parachute in enumerate(rocket.parachutes):
+                self.__parachute_cd_s[i, j] = parachute.cd_s
+                self.__parachute_lag[i, j] = parachute.lag
+                self.__parachute_period[i, j] = 1 / parachute.sampling_rate
+                self.__last_noise[i, j] = np.random.normal(
+                    parachute.noise_bias, parachute.noise_deviation
+                )
+                noiseless = parachute.noise_bias == 0 and parachute.noise_deviation == 0
+                trigger = parachute.trigger
+                if isinstance(trigger, str) and trigger.lower() == "apogee":
+                    self.__trigger_kind[i, j] = _TRIGGER_APOGEE
+                elif isinstance(trigger, (int, float)) and noiseless:
+                    self.__trigger_kind[i, j] = _TRIGGER_ALTITUDE
+                    self.__trigger_height[i, j] = trigger
+                else:
+                    self.__trigger_kind[i, j] = _TRIGGER_CALLABLE
+        # Time at which each parachute is triggered and inflated
+        self.__trigger_time = np.full(shape, np.nan)
+        self.__inflation_time = np.full(shape, np.nan)
+        self.__next_sample_time = np.zeros(shape)
+        self.parachute_events = [[] for _ in range(self.number_of_flights)]
+
+    def __init_flight_state(self):
+        """Initialize the state of every flight on its launch rail, and the
+        result arrays."""
+        n = self.number_of_flights
+        self.__elevation = np.array([env.elevation for env in self.environments])
+        self.__effective_1rl = np.array(
+            [
+                self.__effective_rail_length(rocket, rail_length)
+                for rocket, rail_length in zip(self.rockets, self.rail_length)
+            ]
+        )
+        psi = -self.heading * (np.pi / 180)  # Precession / Heading Angle
+        theta = (self.inclination - 90) * (np.pi / 180)  # Nutation Angle
+        self.state = np.zeros((n, 13))
+        self.state[:, 2] = self.__elevation
+        self.state[:, 6] = np.cos(psi / 2) * np.cos(theta / 2)
+        self.state[:, 7] = np.cos(psi / 2) * np.sin(theta / 2)
+        self.state[:, 8] = np.sin(psi / 2) * np.sin(theta / 2)
+        self.state[:, 9] = np.sin(psi / 2) * np.cos(theta / 2)
+
+        self.__phase = np.full(n, _RAIL)
+        self.__cd_s = np.zeros(n)
+        self.active = np.ones(n, dtype=bool)
+        self.diverged = np.zeros(n, dtype=bool)
+        self.steps = 0
+        self.t_final = np.full(n, np.nan)
+        self.out_of_rail_time = np.full(n, np.nan)
+        self.out_of_rail_velocity = np.full(n, np.nan)
+        self.apogee_time = np.full(n, np.nan)
+        self.apogee = np.full(n, np.nan)
+        self.apogee_x = np.full(n, np.nan)
+        self.apogee_y = np.full(n, np.nan)
+        self.x_impact = np.full(n, np.nan)
+        self.y_impact = np.full(n, np.nan)
+        self.impact_velocity = np.full(n, np.nan)
+        self.inputs_log = []
+
+    @staticmethod
+    def __effective_rail_length(rocket, rail_length):
+        """Rail length minus the distance measured from nozzle exit to the
+        upper rail button, as in Flight.effective_1rl."""
+        nozzle = rocket.nozzle_position
+        try:
+            rail_buttons = rocket.rail_buttons[0]
+            upper_r_button = (
+                rail_buttons.component.buttons_distance * rocket._csys
+                + rail_buttons.position
+            )
+        except IndexError:  # No rail buttons defined
+            upper_r_button = nozzle
+        return rail_length - abs(nozzle - upper_r_button)
+
+    def __u_dot(self, t, u, members):
+        """Evaluate the equations of motion of the given members, each with
+        the equations of its current flight phase.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds.
+        u : np.ndarray
+            State vectors of the members, of shape (m, 13).
+        members : np.ndarray
+            Indexes of the members, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            State vector derivatives, of shape (m, 13).
+        """
+        u_dot = np.empty_like(u)
+        phase = self.__phase[members]
+        kernels = self.__kernel_index[members]
+        rail = phase == _RAIL
+        if rail.any():
+            u_dot[rail] = self.__kernel.u_dot_rail(t, u[rail], kernels[rail])
+        flight = phase == _FLIGHT
+        if flight.any():
+            u_dot[flight] = self.__kernel.u_dot(t, u[flight], kernels[flight])
+        parachute = phase == _PARACHUTE
+        if parachute.any():
+            u_dot[parachute] = self.__kernel.u_dot_parachute(
+                u[parachute], kernels[parachute], self.__cd_s[members[parachute]]
+            )
+        return u_dot
+
+    def __simulate(self):
+        """Integrate every flight until all of them are finished or the
+        maximum time is reached. All active flights take the same steps,
+        whose size is controlled by the largest error among them."""
+        t = 0.0
+        h = min(self.max_time_step, 1e-3)
+        u_dot = np.zeros_like(self.state)
+        members = np.flatnonzero(self.active)
+        u_dot[members] = self.__u_dot(t, self.state[members], members)
+        step_rejected = False
+        while members.size and t < self.max_time:
+            h = min(max(h, self.min_time_step), self.max_time_step)
+            last_step = h >= self.max_time - t
+            h = min(h, self.max_time - t)
+            y0, f0 = self.state[members], u_dot[members]
+            y1, f1, error = self.__dormand_prince_step(t, h, y0, f0, members)
+            error_norms = self.__error_norms(y0, y1, error)
+            error_norm = np.max(error_norms)
+            factor = self.__step_factor(error_norm)
+            if not error_norm <= 1:
+                # Reject the step, which may have diverged, and retry. Members
+                # that would need a step below the minimum stop instead
+                if h * factor < self.__min_step(t):
+                    failing = ~(error_norms <= 1)
+                    self.__stop_diverged(members[failing], t, y0[failing])
+                    members = np.flatnonzero(self.active)
+                else:
+                    h *= factor
+                step_rejected = True
+                continue
+            if step_rejected:
+                factor = min(1, factor)
+            step_rejected = False
+
+            t = self.max_time if last_step else t + h
+            self.state[members] = y1
+            u_dot[members] = f1
+            self.steps += 1
+
+            switched = self.__check_events(t, h, members, y0, f0, y1, f1)
+            switched |= self.__check_parachutes(t, h, members, y0, f0, y1, f1)
+            switched &= self.active[members]
+            if switched.any():
+                members_switched = members[switched]
+                u_dot[members_switched] = self.__u_dot(
+                    t, self.state[members_switched], members_switched
+                )
+            members = np.flatnonzero(self.active)
+            h *= factor
+
+        self.t_final[self.active] = t
+
+    def __error_norms(self, y0, y1, error):
+        """Root mean square of the scaled local errors of a step, for every
+        member that took it. The step size is controlled by the largest."""
+        scale = self.atol + np.maximum(np.abs(y0), np.abs(y1)) * self.rtol
+        return np.sqrt(np.mean((error / scale) ** 2, axis=1))
+
+    def __min_step(self, t):
+        """Smallest step size allowed at ``t``, which is at least ten times
+        the floating point spacing of ``t``, as in scipy's solvers."""
+        return max(10 * np.spacing(t), self.min_time_step)
+
+    @staticmethod
+    def __step_factor(error_norm):
+        """Factor by which the step size is multiplied after a step with the
+        given error norm. Diverged steps, with a NaN error, are shrunk."""
+        if np.isnan(error_norm):
+            return 0.2
+        if error_norm == 0:
+            return 10
+        return min(10, max(0.2, 0.9 * error_norm**-0.2))
+
+    def __integrate(self, t, t_end, y, members):
+        """Integrate the given members from ``t`` to ``t_end`` with error
+        controlled steps, without detecting events.
+
+        Parameters
+        ----------
+        t : float
+            Initial time.
+        t_end : float
+            Final time.
+        y : np.ndarray
+            States of the members at ``t``, of shape (m, 13).
+        members : np.ndarray
+            Indexes of the members, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            States of the members at ``t_end``, of shape (m, 13).
+        """
+        y_end = np.array(y)
+        rows = np.arange(len(members))
+        f = self.__u_dot(t, y, members)
+        h = t_end - t
+        while t < t_end and rows.size:
+            last_step = h >= t_end - t
+            h = min(h, t_end - t)
+            y1, f1, error = self.__dormand_prince_step(t, h, y, f, members)
+            error_norms = self.__error_norms(y, y1, error)
+            error_norm = np.max(error_norms)
+            factor = self.__step_factor(error_norm)
+            if error_norm <= 1:
+                t, y, f = t_end if last_step else t + h, y1, f1
+            elif h * factor < self.__min_step(t):
+                failing = ~(error_norms <= 1)
+                self.__stop_diverged(members[failing], t, y[failing])
+                y_end[rows[failing]] = y[failing]
+                rows, members = rows[~failing], members[~failing]
+                y, f = y[~failing], f[~failing]
+                continue
+            h *= factor
+        y_end[rows] = y
+        return y_end
+
+    def __dormand_prince_step(
+        self, t, h, y, f, members
+    ):  # pylint: disable=too-many-arguments
+        """Take one Dormand-Prince step of size ``h`` for the given members,
+        given their derivative ``f`` at ``t``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            States and derivatives at ``t + h`` and the estimated local error
+            of each state, all of shape (m, 13).
+        """
+        k = np.empty((RK45.n_stages + 1, *y.shape))
+        k[0] = f
+        for stage, (a, c) in enumerate(zip(RK45.A[1:], RK45.C[1:]), start=1):
+            dy = np.tensordot(a[:stage], k[:stage], axes=1) * h
+            k[stage] = self.__u_dot(t + c * h, y + dy, members)
+        y_new = y + h * np.tensordot(RK45.B, k[:-1], axes=1)
+        # Derivative at the new point is the first stage of the next step
+        k[-1] = self.__u_dot(t + h, y_new, members)
+        error = h * np.tensordot(RK45.E, k, axes=1)
+        return y_new, k[-1], error
+
+    def __switch_phase(self, members, phase, t_switch, state, t):
+        """Switch the flight phase of some members at ``t_switch``, inside
+        the step that ended at ``t``. Their state is restarted from the state
+        at the switch and integrated up to ``t`` with the new equations.
+
+        Parameters
+        ----------
+        members : np.ndarray
+            Indexes of the members, of shape (m,).
+        phase : int
+            New flight phase.
+        t_switch : np.ndarray
+            Time of the switch of each member, of shape (m,).
+        state : np.ndarray
+            State of each member at the switch, of shape (m, 13).
+        t : float
+            Time at the end of the step.
+        """
+        self.__phase[members] = phase
+        for t_start in np.unique(t_switch):
+            rows = t_switch == t_start
+            self.state[members[rows]] = self.__integrate(
+                t_start, t, state[rows], members[rows]
+            )
+
+    def __check_events(
+        self, t, h, members, y0, f0, y1, f1
+    ):  # pylint: disable=too-many-arguments
+        """Detect and locate the rail exit, apogee and impact of the members
+        during the step that ended at ``t``.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, over ``members``, of the members whose flight phase
+            changed.
+        """
+        t_old = t - h
+        switched = np.zeros(len(members), dtype=bool)
+        elevation = self.__elevation[members]
+
+        # Rail exit, when the upper rail button leaves the rail
+        effective_1rl = self.__effective_1rl[members]
+
+        def rail_exit(u, rows):
+            return (
+                u[:, 0] ** 2
+                + u[:, 1] ** 2
+                + (u[:, 2] - elevation[rows]) ** 2
+                - effective_1rl[rows] ** 2
+            )
+
+        on_rail = self.__phase[members] == _RAIL
+        rows = np.flatnonzero(
+            on_rail
+            & (rail_exit(y0, slice(None)) < 0)
+            & (rail_exit(y1, slice(None)) >= 0)
+        )
+        if rows.size:
+            s, state = _locate(
+                lambda u: rail_exit(u, rows), h, y0[rows], f0[rows], y1[rows], f1[rows]
+            )
+            exited = members[rows]
+            self.out_of_rail_time[exited] = t_old + s * h
+            self.out_of_rail_velocity[exited] = np.linalg.norm(state[:, 3:6], axis=1)
+            self.__switch_phase(
+                exited, _FLIGHT, self.out_of_rail_time[exited], state, t
+            )
+            switched[rows] = True
+
+        # Apogee, when the vertical velocity becomes negative
+        rows = np.flatnonzero(
+            np.isnan(self.apogee_time[members]) & (y0[:, 5] > 0) & (y1[:, 5] <= 0)
+        )
+        if rows.size:
+            s, state = _locate(
+                lambda u: u[:, 5], h, y0[rows], f0[rows], y1[rows], f1[rows]
+            )
+            reached = members[rows]
+            self.apogee_time[reached] = t_old + s * h
+            self.apogee_x[reached], self.apogee_y[reached], self.apogee[reached] = (
+                state[:, :3].T
+            )
+            if self.terminate_on_apogee:
+                self.__finish(reached, self.apogee_time[reached], state)
+
+        # Impact, when the altitude goes below the ground level
+        rows = np.flatnonzero(
+            self.active[members] & (y0[:, 2] > elevation) & (y1[:, 2] <= elevation)
+        )
+        if rows.size:
+            s, state = _locate(
+                lambda u: u[:, 2] - elevation[rows],
+                h,
+                y0[rows],
+                f0[rows],
+                y1[rows],
+                f1[rows],
+            )
+            landed = members[rows]
+            self.x_impact[landed] = state[:, 0]
+            self.y_impact[landed] = state[:, 1]
+            self.impact_velocity[landed] = state[:, 5]
+            self.__finish(landed, t_old + s * h, state)
+
+        return switched
+
+    def __check_parachutes(
+        self, t, h, members, y0, f0, y1, f1
+    ):  # pylint: disable=too-many-arguments
+        """Sample the parachute triggers of the members during the step that
+        ended at ``t`` and inflate the parachutes whose lag has elapsed.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, over ``members``, of the members whose flight phase
+            changed.
+        """
+        switched = np.zeros(len(members), dtype=bool)
+        for j in range(self.__parachute_cd_s.shape[1]):
+            rows = np.flatnonzero(
+                self.active[members]
+                & (self.__phase[members] != _RAIL)
+                & np.isnan(self.__trigger_time[members, j])
+            )
+            kind = self.__trigger_kind[members[rows], j]
+            self.__sample_descent_triggers(
+                t, h, j, members, rows[kind != _TRIGGER_CALLABLE], y0, f0, y1, f1
+            )
+            for row in rows[kind == _TRIGGER_CALLABLE]:
+                self.__sample_callable_trigger(
+                    t, h, j, members[row], y0[row], f0[row], y1[row], f1[row]
+                )
+
+            # Inflate the parachutes whose lag has elapsed
+            rows = np.flatnonzero(
+                self.active[members] & (self.__inflation_time[members, j] <= t)
+            )
+            if rows.size:
+                inflated = members[rows]
+                inflation_time = self.__inflation_time[inflated, j]
+                s = np.clip((inflation_time - (t - h)) / h, 0, 1)
+                self.__cd_s[inflated] = self.__parachute_cd_s[inflated, j]
+                self.__switch_phase(
+                    inflated,
+                    _PARACHUTE,
+                    inflation_time,
+                    _hermite(s, h, y0[rows], f0[rows], y1[rows], f1[rows]),
+                    t,
+                )
+                self.__inflation_time[inflated, j] = np.inf
+                switched[rows] = True
+        return switched
+
+    def __sample_descent_triggers(
+        self, t, h, j, members, rows, y0, f0, y1, f1
+    ):  # pylint: disable=too-many-arguments
+        """Evaluate the "apogee" and altitude triggers of the j-th parachute
+        of ``members[rows]``, without noise, for all of them at once. Both
+        triggers require the rocket to be descending, and the altitude
+        trigger also requires it to be below the trigger height. The
+        parachute is triggered at the first sampling time after both
+        conditions are met."""
+        rows = rows[self.apogee_time[members[rows]] <= t]
+        if not rows.size:
+            return
+        sampled = members[rows]
+        elevation = self.__elevation[sampled]
+        trigger_height = self.__trigger_height[sampled, j]
+        is_altitude = self.__trigger_kind[sampled, j] == _TRIGGER_ALTITUDE
+        start_height = y0[rows, 2] - elevation
+        end_height = y1[rows, 2] - elevation
+        below = ~is_altitude | (end_height < trigger_height)
+        rows, sampled = rows[below], sampled[below]
+        condition_time = self.apogee_time[sampled]
+        crossed = np.flatnonzero(
+            is_altitude[below] & (start_height[below] >= trigger_height[below])
+        )
+        if crossed.size:
+            crossed_rows = rows[crossed]
+            height = trigger_height[below][crossed] + elevation[below][crossed]
+            s, _ = _locate(
+                lambda u: u[:, 2] - height,
+                h,
+                y0[crossed_rows],
+                f0[crossed_rows],
+                y1[crossed_rows],
+                f1[crossed_rows],
+            )
+            condition_time[crossed] = np.maximum(condition_time[crossed], t - h + s * h)
+        period = self.__parachute_period[sampled, j]
+        self.__trigger(sampled, j, np.ceil(condition_time / period) * period)
+
+    def __sample_callable_trigger(
+        self, t, h, j, member, y0, f0, y1, f1
+    ):  # pylint: disable=too-many-arguments
+        """Evaluate the trigger function of the j-th parachute of a member at
+        each of its sampling times inside the step, with the noisy pressure
+        signal, as done by Flight. The noise is correlated with the previous
+        sample of the same member, and the signals are not recorded in the
+        Parachute, which may be shared by other members."""
+        env = self.environments[member]
+        parachute = self.rockets[member].parachutes[j]
+        period = self.__parachute_period[member, j]
+        first_sample_time = max(self.__next_sample_time[member, j], t - h)
+        sample_times = np.arange(first_sample_time, t, period)
+        states = _hermite((sample_times - (t - h)) / h, h, y0, f0, y1, f1)
+        alpha, beta = parachute.noise_corr
+        for sample_time, u in zip(sample_times, states):
+            noise = alpha * self.__last_noise[member, j] + beta * np.random.normal(
+                parachute.noise_bias, parachute.noise_deviation
+            )
+            self.__last_noise[member, j] = noise
+            noisy_pressure = env.pressure.get_value_opt(u[2]) + noise
+            height_above_ground_level = (
+                env.barometric_height.get_value_opt(noisy_pressure) - env.elevation
+            )
+            if parachute.triggerfunc(noisy_pressure, height_above_ground_level, u):
+                self.__trigger(np.array([member]), j, np.array([sample_time]))
+                return
+        self.__next_sample_time[member, j] = (
+            first_sample_time + len(sample_times) * period
+        )
+
+    def __trigger(self, members, j, t):
+        """Trigger the j-th parachute of the given members at times ``t``."""
+        self.__trigger_time[members, j] = t
+        self.__inflation_time[members, j] = t + self.__parachute_lag[members, j]
+        for i, trigger_time in zip(members, t):
+            self.parachute_events[i].append(
+                [trigger_time, self.rockets[i].parachutes[j]]
+            )
+
+    def __finish(self, members, t, state):
+        """Remove members from the active mask, storing their final time
+        and state."""
+        self.active[members] = False
+        self.t_final[members] = t
+        self.state[members] = state
+
+    def __stop_diverged(self, members, t, state):
+        """Finish members whose error is not controlled by the minimum step
+        size, flagging them as diverged."""
+        self.diverged[members] = True
+        self.__finish(members, t, state)
+
+    @property
+    def results(self):
+        """Dictionary with the main results of every flight, as arrays of
+        shape (N,). The keys follow the default export list of MonteCarlo."""
+        return {
+            "apogee": self.apogee,
+            "apogee_time": self.apogee_time,
+            "apogee_x": self.apogee_x,
+            "apogee_y": self.apogee_y,
+            "t_final": self.t_final,
+            "x_impact": self.x_impact,
+            "y_impact": self.y_impact,
+            "impact_velocity": self.impact_velocity,
+            "out_of_rail_time": self.out_of_rail_time,
+            "out_of_rail_velocity": self.out_of_rail_velocity,
+        }
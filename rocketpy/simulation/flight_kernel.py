@@ -0,0 +1,799 @@
+"""Compiled evaluation of the Flight equations of motion.
+
+The standard equations of motion query a dozen independent Function objects
+at every call (motor inertias and mass flow, atmosphere, drag curves, lift
+and roll coefficients of every aerodynamic surface). The ``_FlightKernel``
+defined here samples all of those Functions once, before the integration
+starts, into contiguous NumPy tables defined over three shared uniform grids:
+
+- a time grid for every mass, inertia and thrust related quantity;
+- an altitude grid for the atmosphere (density, wind, speed of sound and
+  gravity);
+- a Mach number grid for the drag curves and the aerodynamic coefficients.
+
+Because the grids are uniform, locating a value inside a table is a single
+arithmetic operation and a whole row of quantities is linearly interpolated
+at once.
+
+The equations of motion of the kernel are written with arithmetic only, so
+that they also evaluate many states at once when the tables return arrays:
+``FlightBatch`` runs them over the stacked tables of several flights, and
+``Flight`` runs them over the original Functions, through a
+``_FunctionKernel``, to post-process every step of a flight phase at once.
+"""
+
+import numpy as np
+
+from ..mathutils.function import Function
+
+
+class _UniformTable:
+    """Columns of tabulated values over a shared uniform grid. Evaluating the
+    table linearly interpolates every column at once. Values outside the grid
+    are held constant at the closest grid edge."""
+
+    def __init__(self, grid, values):
+        """Build the table.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            Uniformly spaced and increasing grid of shape (n,).
+        values : np.ndarray
+            Tabulated values of shape (n, k), one column per quantity.
+        """
+        self.grid = np.asarray(grid, dtype=np.float64)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.start = self.grid[0]
+        self.step = self.grid[1] - self.grid[0]
+        self.inverse_step = 1 / self.step
+        self.last_index = len(self.grid) - 1
+        self.slopes = np.ascontiguousarray(np.diff(self.values, axis=0))
+        self._first_row = self.values[0].tolist()
+        self._last_row = self.values[-1].tolist()
+
+    def __call__(self, x):
+        """Interpolate all columns of the table at a scalar ``x``.
+
+        Parameters
+        ----------
+        x : float
+            Point at which the table is evaluated.
+
+        Returns
+        -------
+        list
+            Interpolated values of every column, as Python floats.
+        """
+        position = (x - self.start) * self.inverse_step
+        if position <= 0:
+            return self._first_row
+        if position >= self.last_index:
+            return self._last_row
+        index = int(position)
+        return (self.values[index] + (position - index) * self.slopes[index]).tolist()
+
+    def evaluate(self, x):
+        """Interpolate all columns of the table at an array of points.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Points at which the table is evaluated, of shape (m,).
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated values, of shape (m, k).
+        """
+        position = np.clip(
+            (np.asarray(x, dtype=np.float64) - self.start) * self.inverse_step,
+            0,
+            self.last_index,
+        )
+        index = np.minimum(position.astype(np.intp), self.last_index - 1)
+        weight = (position - index)[:, np.newaxis]
+        return self.values[index] + weight * self.slopes[index]
+
+
+class _FlightKernel:
+    """Tabulated version of ``Flight.u_dot_generalized``.
+
+    All Rocket, Motor and Environment Functions required by the equations of
+    motion are sampled at construction time. Calling ``u_dot`` afterwards only
+    performs table lookups and floating point arithmetic. The tables are
+    linear interpolations of the original Functions, so results agree with
+    the standard equations of motion up to the grid resolution, which can be
+    tuned through the ``time_samples``, ``altitude_samples`` and
+    ``mach_samples`` class attributes.
+
+    Notes
+    -----
+    The lift coefficient of every aerodynamic surface is tabulated as its
+    derivative with respect to the angle of attack, ``cl(1, mach)``, which is
+    exact for every surface defined in RocketPy since their lift is linear in
+    the angle of attack. Air brakes are not tabulated, since their deployment
+    level may change during the simulation.
+    """
+
+    time_samples = 2000
+    altitude_samples = 2000
+    mach_samples = 500
+    max_mach = 5.0
+
+    # Parachute descent constants, the same as in Flight.u_dot_parachute
+    PARACHUTE_ADDED_MASS_COEFFICIENT = 1  # depends on parachute's porosity
+    PARACHUTE_RADIUS = 1.5
+    PARACHUTE_GRAVITY = 9.8
+
+    # Columns of the motor (time) table
+    MOTOR_COLUMNS = (
+        "total_mass",
+        "total_mass_dot",
+        "total_mass_ddot",
+        "r_cm",
+        "r_cm_dot",
+        "r_cm_ddot",
+        "thrust",
+        "I_11",
+        "I_12",
+        "I_13",
+        "I_22",
+        "I_23",
+        "I_33",
+        "I_11_dot",
+        "I_12_dot",
+        "I_13_dot",
+        "I_22_dot",
+        "I_23_dot",
+        "I_33_dot",
+    )
+    # Columns of the atmosphere (altitude) table
+    ATMOSPHERE_COLUMNS = (
+        "density",
+        "wind_velocity_x",
+        "wind_velocity_y",
+        "speed_of_sound",
+        "gravity",
+    )
+
+    def __init__(self, rocket, environment):
+        """Sample the rocket and environment into flat tables.
+
+        Parameters
+        ----------
+        rocket : Rocket
+            Rocket whose motor, drag curves and aerodynamic surfaces are
+            tabulated.
+        environment : Environment
+            Environment whose atmospheric profiles are tabulated.
+        """
+        self.rocket = rocket
+        self.env = environment
+        self.burn_out_time = rocket.motor.burn_out_time
+        self.motor_table = self.__compile_motor_table()
+        self.atmosphere_table = self.__compile_atmosphere_table()
+        self.drag_table, self.surfaces = self.__compile_aerodynamic_tables()
+        self._compile_constants()
+
+    def __compile_motor_table(self):
+        rocket = self.rocket
+        motor = rocket.motor
+        t_start = min(0, motor.burn_start_time)
+        t_end = self.burn_out_time
+        # one extra node after burn out holds the constant post burn values
+        step = (t_end - t_start) / (self.time_samples - 1)
+        grid = t_start + step * np.arange(self.time_samples + 1)
+
+        r_cm = rocket.com_to_cdm_function
+        mass_flow_rate = rocket.total_mass_flow_rate
+        inertias = [
+            rocket.I_11,
+            rocket.I_12,
+            rocket.I_13,
+            rocket.I_22,
+            rocket.I_23,
+            rocket.I_33,
+        ]
+        values = np.empty((len(grid), len(self.MOTOR_COLUMNS)))
+        for i, t in enumerate(grid):
+            values[i, :7] = [
+                rocket.total_mass.get_value_opt(t),
+                mass_flow_rate.get_value_opt(t),
+                mass_flow_rate.differentiate_complex_step(t),
+                r_cm.get_value_opt(t),
+                r_cm.differentiate_complex_step(t),
+                r_cm.differentiate(t, order=2),
+                motor.thrust.get_value_opt(t),
+            ]
+            values[i, 7:13] = [inertia.get_value_opt(t) for inertia in inertias]
+            values[i, 13:] = [
+                inertia.differentiate_complex_step(t) for inertia in inertias
+            ]
+        return _UniformTable(grid, values)
+
+    def __compile_atmosphere_table(self):
+        env = self.env
+        z_start = env.elevation - 1000
+        z_end = max(env.max_expected_height, env.elevation + 1000)
+        grid = np.linspace(z_start, z_end, self.altitude_samples)
+        functions = [getattr(env, name) for name in self.ATMOSPHERE_COLUMNS]
+        values = np.array(
+            [[function.get_value_opt(z) for function in functions] for z in grid]
+        )
+        return _UniformTable(grid, values)
+
+    def __compile_aerodynamic_tables(self):
+        rocket = self.rocket
+        drag_curves = [rocket.power_on_drag, rocket.power_off_drag]
+        mach_end = self.max_mach
+        for curve in drag_curves:
+            if not callable(curve.source):
+                mach_end = max(mach_end, curve.x_array[-1])
+        grid = np.linspace(0, mach_end, self.mach_samples)
+
+        drag_values = np.array(
+            [[curve.get_value_opt(mach) for curve in drag_curves] for mach in grid]
+        )
+        drag_table = _UniformTable(grid, drag_values)
+
+        surfaces = []
+        for aero_surface, position in rocket.aerodynamic_surfaces:
+            cpz = _surface_cpz(rocket, aero_surface, position)
+            roll_parameters = getattr(aero_surface, "roll_parameters", None)
+            if roll_parameters is not None:
+                clf_delta, cld_omega, cant_angle_rad = roll_parameters
+            columns = []
+            for mach in grid:
+                row = [aero_surface.cl.get_value_opt(1, mach)]
+                if roll_parameters is not None:
+                    row += [
+                        clf_delta.get_value_opt(mach),
+                        cld_omega.get_value_opt(mach),
+                    ]
+                columns.append(row)
+            surfaces.append(
+                (
+                    cpz,
+                    aero_surface.reference_area,
+                    aero_surface.reference_length,
+                    cant_angle_rad if roll_parameters is not None else None,
+                    _UniformTable(grid, np.array(columns)),
+                )
+            )
+        return drag_table, surfaces
+
+    def _compile_constants(self):
+        rocket = self.rocket
+        self.dry_mass = rocket.dry_mass
+        self.area = rocket.area
+        self.nozzle_to_cdm = rocket.nozzle_to_cdm
+        self.s_nozzle_11 = rocket.nozzle_gyration_tensor.xx
+        self.s_nozzle_33 = rocket.nozzle_gyration_tensor.zz
+        self.cp_eccentricity_x = rocket.cp_eccentricity_x
+        self.cp_eccentricity_y = rocket.cp_eccentricity_y
+        self.thrust_eccentricity_x = rocket.thrust_eccentricity_x
+        self.thrust_eccentricity_y = rocket.thrust_eccentricity_y
+        self.air_brakes = rocket.air_brakes
+
+    def u_dot(self, t, u):  # pylint: disable=too-many-locals,too-many-statements
+        """Evaluate the 6 DOF equations of motion from the compiled tables.
+        The equations are the same as in ``Flight.u_dot_generalized``,
+        written out component by component.
+
+        The equations are only made of arithmetic and of the table lookups,
+        ``_select`` and ``_lift_direction`` methods, so that they are also
+        evaluated for several flights at once, with arrays of shape (m,) in
+        place of each state component, by ``FlightBatch``.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds.
+        u : list
+            State vector defined by u = [x, y, z, vx, vy, vz, e0, e1, e2, e3,
+            omega1, omega2, omega3].
+
+        Returns
+        -------
+        u_dot : list
+            State vector derivative defined by u_dot = [vx, vy, vz, ax, ay,
+            az, e0_dot, e1_dot, e2_dot, e3_dot, alpha1, alpha2, alpha3].
+        forces : list
+            Aerodynamic forces and moments [R1, R2, R3, M1, M2, M3] in the
+            body frame.
+        """
+        _, _, z, vx, vy, vz, e0, e1, e2, e3, w1, w2, w3 = u
+
+        # Table lookups: one per grid
+        (
+            m,
+            m_dot,
+            m_ddot,
+            r_cm,
+            r_cm_dot,
+            r_cm_ddot,
+            thrust,
+            I_11,
+            I_12,
+            I_13,
+            I_22,
+            I_23,
+            I_33,
+            I_11_dot,
+            I_12_dot,
+            I_13_dot,
+            I_22_dot,
+            I_23_dot,
+            I_33_dot,
+        ) = self.motor_table(t)
+        rho, wind_x, wind_y, speed_of_sound, gravity = self.atmosphere_table(z)
+
+        # Transformation matrix (body to inertial frame)
+        a11 = 1 - 2 * (e2**2 + e3**2)
+        a12 = 2 * (e1 * e2 - e0 * e3)
+        a13 = 2 * (e1 * e3 + e0 * e2)
+        a21 = 2 * (e1 * e2 + e0 * e3)
+        a22 = 1 - 2 * (e1**2 + e3**2)
+        a23 = 2 * (e2 * e3 - e0 * e1)
+        a31 = 2 * (e1 * e3 - e0 * e2)
+        a32 = 2 * (e2 * e3 + e0 * e1)
+        a33 = 1 - 2 * (e1**2 + e2**2)
+
+        # Drag force
+        free_stream_speed = ((wind_x - vx) ** 2 + (wind_y - vy) ** 2 + vz**2) ** 0.5
+        free_stream_mach = free_stream_speed / speed_of_sound
+        power_on_drag, power_off_drag = self.drag_table(free_stream_mach)
+        drag_coeff = self._select(t < self.burn_out_time, power_on_drag, power_off_drag)
+        R1, R2, M1, M2, M3 = 0, 0, 0, 0, 0
+        R3 = -0.5 * rho * free_stream_speed**2 * self.area * drag_coeff
+        for air_brakes in self.air_brakes:
+            if air_brakes.deployment_level > 0:
+                air_brakes_cd = self._evaluate(
+                    air_brakes.drag_coefficient,
+                    air_brakes.deployment_level,
+                    free_stream_mach,
+                )
+                air_brakes_force = (
+                    -0.5
+                    * rho
+                    * free_stream_speed**2
+                    * air_brakes.reference_area
+                    * air_brakes_cd
+                )
+                if air_brakes.override_rocket_drag:
+                    R3 = air_brakes_force
+                else:
+                    R3 += air_brakes_force
+
+        # Velocity in body frame
+        vx_b = a11 * vx + a21 * vy + a31 * vz
+        vy_b = a12 * vx + a22 * vy + a32 * vz
+        vz_b = a13 * vx + a23 * vy + a33 * vz
+
+        # Lift and roll moment of each aerodynamic surface
+        for cpz, reference_area, reference_length, cant_angle, table in self.surfaces:
+            comp_z = z + a33 * cpz
+            _, comp_wind_vx, comp_wind_vy, _, _ = self.atmosphere_table(comp_z)
+            comp_stream_vx_b = (
+                a11 * comp_wind_vx + a21 * comp_wind_vy - (vx_b + w2 * cpz)
+            )
+            comp_stream_vy_b = (
+                a12 * comp_wind_vx + a22 * comp_wind_vy - (vy_b - w1 * cpz)
+            )
+            comp_stream_vz_b = a13 * comp_wind_vx + a23 * comp_wind_vy - vz_b
+            comp_stream_speed = (
+                comp_stream_vx_b**2 + comp_stream_vy_b**2 + comp_stream_vz_b**2
+            ) ** 0.5
+            comp_stream_mach = comp_stream_speed / speed_of_sound
+            comp_attack_angle, lift_dir_x, lift_dir_y = self._lift_direction(
+                comp_stream_vx_b, comp_stream_vy_b, comp_stream_vz_b, comp_stream_speed
+            )
+            c_lift, *roll_coefficients = self._surface_coefficients(
+                table, comp_attack_angle, comp_stream_mach
+            )
+            comp_lift = 0.5 * rho * comp_stream_speed**2 * reference_area * c_lift
+            comp_lift_xb = comp_lift * lift_dir_x
+            comp_lift_yb = comp_lift * lift_dir_y
+            R1 += comp_lift_xb
+            R2 += comp_lift_yb
+            M1 -= (cpz + r_cm) * comp_lift_yb
+            M2 += (cpz + r_cm) * comp_lift_xb
+            if cant_angle is not None:
+                clf_delta, cld_omega = roll_coefficients
+                M3_forcing = (
+                    (1 / 2 * rho * comp_stream_speed**2)
+                    * reference_area
+                    * reference_length
+                    * clf_delta
+                    * cant_angle
+                )
+                M3_damping = (
+                    (1 / 2 * rho * comp_stream_speed)
+                    * reference_area
+                    * reference_length**2
+                    * cld_omega
+                    * w3
+                    / 2
+                )
+                M3 += M3_forcing - M3_damping
+
+        # Off center moments
+        M1 += self.cp_eccentricity_y * R3 + self.thrust_eccentricity_x * thrust
+        M2 -= self.cp_eccentricity_x * R3 - self.thrust_eccentricity_y * thrust
+        M3 += self.cp_eccentricity_x * R2 - self.cp_eccentricity_y * R1
+
+        # Weight in body frame
+        weight = -m * gravity
+        g1, g2, g3 = a31 * weight, a32 * weight, a33 * weight
+
+        # Translational terms (T20), all vectors along the body z axis
+        nozzle_arm = self.nozzle_to_cdm - r_cm
+        p = m * r_cm
+        q = 2 * m_dot * nozzle_arm - 2 * m * r_cm_dot
+        T04 = thrust - m * r_cm_ddot - 2 * m_dot * r_cm_dot + m_ddot * nozzle_arm
+        T20_1 = -w1 * w3 * p + w2 * q + g1 + R1
+        T20_2 = -w2 * w3 * p - w1 * q + g2 + R2
+        T20_3 = (w1**2 + w2**2) * p + T04 + g3 + R3
+
+        # Rotational terms (T21)
+        Iw1 = I_11 * w1 + I_12 * w2 + I_13 * w3
+        Iw2 = I_12 * w1 + I_22 * w2 + I_23 * w3
+        Iw3 = I_13 * w1 + I_23 * w2 + I_33 * w3
+        T05_11 = m_dot * self.s_nozzle_11 - I_11_dot
+        T05_22 = m_dot * self.s_nozzle_11 - I_22_dot
+        T05_33 = m_dot * self.s_nozzle_33 - I_33_dot
+        T21_1 = (
+            Iw2 * w3
+            - Iw3 * w2
+            + T05_11 * w1
+            - I_12_dot * w2
+            - I_13_dot * w3
+            - g2 * r_cm
+            + M1
+        )
+        T21_2 = (
+            Iw3 * w1
+            - Iw1 * w3
+            - I_12_dot * w1
+            + T05_22 * w2
+            - I_23_dot * w3
+            + g1 * r_cm
+            + M2
+        )
+        T21_3 = Iw1 * w2 - Iw2 * w1 - I_13_dot * w1 - I_23_dot * w2 + T05_33 * w3 + M3
+
+        # Angular acceleration: solve I_CM @ w_dot = T21 + (T20 ^ r_CM)
+        b1 = T21_1 + T20_2 * r_cm
+        b2 = T21_2 - T20_1 * r_cm
+        b3 = T21_3
+        H = m * r_cm**2
+        c11, c12, c13 = I_11 - H, I_12, I_13
+        c22, c23, c33 = I_22 - H, I_23, I_33
+        adj11 = c22 * c33 - c23 * c23
+        adj12 = c13 * c23 - c12 * c33
+        adj13 = c12 * c23 - c22 * c13
+        adj22 = c11 * c33 - c13 * c13
+        adj23 = c12 * c13 - c11 * c23
+        adj33 = c11 * c22 - c12 * c12
+        det = c11 * adj11 + c12 * adj12 + c13 * adj13
+        alpha1 = (adj11 * b1 + adj12 * b2 + adj13 * b3) / det
+        alpha2 = (adj12 * b1 + adj22 * b2 + adj23 * b3) / det
+        alpha3 = (adj13 * b1 + adj23 * b2 + adj33 * b3) / det
+
+        # Linear acceleration: K @ (T20 / m - (r_CM ^ w_dot))
+        l1 = T20_1 / m + r_cm * alpha2
+        l2 = T20_2 / m - r_cm * alpha1
+        l3 = T20_3 / m
+        ax = a11 * l1 + a12 * l2 + a13 * l3
+        ay = a21 * l1 + a22 * l2 + a23 * l3
+        az = a31 * l1 + a32 * l2 + a33 * l3
+
+        u_dot = [
+            vx,
+            vy,
+            vz,
+            ax,
+            ay,
+            az,
+            0.5 * (-w1 * e1 - w2 * e2 - w3 * e3),
+            0.5 * (w1 * e0 + w3 * e2 - w2 * e3),
+            0.5 * (w2 * e0 - w3 * e1 + w1 * e3),
+            0.5 * (w3 * e0 + w2 * e1 - w1 * e2),
+            alpha1,
+            alpha2,
+            alpha3,
+        ]
+        return u_dot, [R1, R2, R3, M1, M2, M3]
+
+    def u_dot_rail(self, t, u):
+        """Evaluate the 1 DOF equations of motion of the rocket on the launch
+        rail, the same as in ``Flight.udot_rail1``.
+
+        Parameters
+        ----------
+        t : float
+            Time in seconds.
+        u : list
+            State vector defined by u = [x, y, z, vx, vy, vz, e0, e1, e2, e3,
+            omega1, omega2, omega3].
+
+        Returns
+        -------
+        list
+            State vector derivative defined by u_dot = [vx, vy, vz, ax, ay,
+            az, e0_dot, e1_dot, e2_dot, e3_dot, alpha1, alpha2, alpha3].
+        """
+        _, _, z, vx, vy, vz, e0, e1, e2, e3, _, _, _ = u
+        motor = self.motor_table(t)
+        m, thrust = motor[0], motor[6]
+        rho, wind_x, wind_y, speed_of_sound, gravity = self.atmosphere_table(z)
+
+        free_stream_speed = ((wind_x - vx) ** 2 + (wind_y - vy) ** 2 + vz**2) ** 0.5
+        power_on_drag, _ = self.drag_table(free_stream_speed / speed_of_sound)
+        R3 = -0.5 * rho * free_stream_speed**2 * self.area * power_on_drag
+
+        # Linear acceleration, which can not be negative on the rail
+        a3 = (R3 + thrust) / m - (e0**2 - e1**2 - e2**2 + e3**2) * gravity
+        a3 = self._select(a3 > 0, a3, 0)
+        return [
+            vx,
+            vy,
+            vz,
+            2 * (e1 * e3 + e0 * e2) * a3,
+            2 * (e2 * e3 - e0 * e1) * a3,
+            (1 - 2 * (e1**2 + e2**2)) * a3,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+        ]
+
+    def u_dot_parachute(self, u, cd_s):
+        """Evaluate the 3 DOF equations of motion of the rocket descending
+        under parachute, the same as in ``Flight.u_dot_parachute``.
+
+        Parameters
+        ----------
+        u : list
+            State vector defined by u = [x, y, z, vx, vy, vz, e0, e1, e2, e3,
+            omega1, omega2, omega3].
+        cd_s : float
+            Drag coefficient times reference area of the inflated parachute.
+
+        Returns
+        -------
+        u_dot : list
+            State vector derivative defined by u_dot = [vx, vy, vz, ax, ay,
+            az, e0_dot, e1_dot, e2_dot, e3_dot, alpha1, alpha2, alpha3].
+        forces : list
+            Parachute drag forces and moments [Dx, Dy, Dz, 0, 0, 0] in the
+            inertial frame.
+        """
+        _, _, z, vx, vy, vz = u[:6]
+        rho, wind_x, wind_y, _, _ = self.atmosphere_table(z)
+
+        # Rocket mass and added mass of the air moved by the parachute
+        mp = self.dry_mass
+        ma = (
+            self.PARACHUTE_ADDED_MASS_COEFFICIENT
+            * rho
+            * (4 / 3)
+            * np.pi
+            * self.PARACHUTE_RADIUS**3
+        )
+
+        freestream_x = vx - wind_x
+        freestream_y = vy - wind_y
+        freestream_z = vz
+        free_stream_speed = (freestream_x**2 + freestream_y**2 + freestream_z**2) ** 0.5
+        pseudo_drag = -0.5 * rho * cd_s * free_stream_speed
+        Dx = pseudo_drag * freestream_x
+        Dy = pseudo_drag * freestream_y
+        Dz = pseudo_drag * freestream_z
+        u_dot = [
+            vx,
+            vy,
+            vz,
+            Dx / (mp + ma),
+            Dy / (mp + ma),
+            (Dz - self.PARACHUTE_GRAVITY * mp) / (mp + ma),
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+        ]
+        return u_dot, [Dx, Dy, Dz, 0, 0, 0]
+
+    @staticmethod
+    def _surface_coefficients(table, attack_angle, mach):
+        """Lift coefficient of an aerodynamic surface, followed by its roll
+        forcing and damping coefficients if it has roll parameters."""
+        coefficients = table(mach)
+        return [coefficients[0] * attack_angle, *coefficients[1:]]
+
+    @staticmethod
+    def _evaluate(function, *args):
+        """Evaluate a Function that is not tabulated."""
+        return function.get_value_opt(*args)
+
+    @staticmethod
+    def _select(condition, if_true, if_false):
+        """Return ``if_true`` where ``condition`` holds, else ``if_false``."""
+        return if_true if condition else if_false
+
+    @staticmethod
+    def _lift_direction(stream_vx, stream_vy, stream_vz, stream_speed):
+        """Angle of attack and unit direction of the lift of an aerodynamic
+        surface, from the free stream velocity in the body frame. The lift
+        vanishes, and zeros are returned, if the stream is axial.
+
+        Returns
+        -------
+        tuple
+            Angle of attack and the x and y components of the lift direction.
+        """
+        if stream_vx**2 + stream_vy**2 == 0:
+            return 0, 0, 0
+        stream_vz_normalized = stream_vz / stream_speed
+        if -1 * stream_vz_normalized >= 1:
+            return 0, 0, 0
+        lift_dir_norm = (stream_vx**2 + stream_vy**2) ** 0.5
+        return (
+            np.arccos(-stream_vz_normalized),
+            stream_vx / lift_dir_norm,
+            stream_vy / lift_dir_norm,
+        )
+
+
+class _VectorizedKernel(_FlightKernel):
+    """Base of the kernels whose tables return arrays, with one value per
+    evaluated state. The inherited equations of motion then evaluate every
+    state at once. Subclasses set the tables, surfaces and constants."""
+
+    @staticmethod
+    def _evaluate(function, *args):
+        return _evaluate_array(function, *np.broadcast_arrays(*args))
+
+    @staticmethod
+    def _select(condition, if_true, if_false):
+        return np.where(condition, if_true, if_false)
+
+    @staticmethod
+    def _lift_direction(stream_vx, stream_vy, stream_vz, stream_speed):
+        lift_dir_norm = np.sqrt(stream_vx**2 + stream_vy**2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stream_vz_normalized = stream_vz / stream_speed
+            has_lift = (lift_dir_norm != 0) & (-stream_vz_normalized < 1)
+            return (
+                np.where(has_lift, np.arccos(np.clip(-stream_vz_normalized, -1, 1)), 0),
+                np.where(has_lift, stream_vx / lift_dir_norm, 0),
+                np.where(has_lift, stream_vy / lift_dir_norm, 0),
+            )
+
+
+class _FunctionTable:
+    """Functions evaluated together at an array of points, called like a
+    ``_UniformTable``."""
+
+    def __init__(self, functions):
+        self.functions = functions
+
+    def __call__(self, x):
+        """Evaluate every Function at the points x.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Points at which the Functions are evaluated, of shape (m,).
+
+        Returns
+        -------
+        list[np.ndarray]
+            Values of each Function, of shape (m,).
+        """
+        return [_evaluate_array(function, x) for function in self.functions]
+
+
+class _FunctionKernel(_VectorizedKernel):
+    """Kernel whose tables are the original Rocket, Motor and Environment
+    Functions, evaluated at arrays of points. Its equations of motion give
+    the same results as the standard ones of ``Flight``, for many states at
+    once, and are used to post-process the steps of a flight."""
+
+    def __init__(self, rocket, environment, time_derivatives):
+        """Gather the Functions of the rocket and environment.
+
+        Parameters
+        ----------
+        rocket : Rocket
+            Rocket whose motor, drag curves and aerodynamic surfaces are
+            evaluated.
+        environment : Environment
+            Environment whose atmospheric profiles are evaluated.
+        time_derivatives : list
+            Second time derivative of the total mass, first and second time
+            derivatives of ``Rocket.com_to_cdm_function`` and time derivatives
+            of the six inertias, in the order of ``MOTOR_COLUMNS``.
+        """
+        # pylint: disable=super-init-not-called
+        self.rocket = rocket
+        self.env = environment
+        self.burn_out_time = rocket.motor.burn_out_time
+        total_mass_ddot, r_cm_dot, r_cm_ddot, *inertia_dots = time_derivatives
+        self.motor_table = _FunctionTable(
+            [
+                rocket.total_mass,
+                rocket.total_mass_flow_rate,
+                total_mass_ddot,
+                rocket.com_to_cdm_function,
+                r_cm_dot,
+                r_cm_ddot,
+                rocket.motor.thrust,
+                rocket.I_11,
+                rocket.I_12,
+                rocket.I_13,
+                rocket.I_22,
+                rocket.I_23,
+                rocket.I_33,
+                *inertia_dots,
+            ]
+        )
+        self.atmosphere_table = _FunctionTable(
+            [getattr(environment, name) for name in self.ATMOSPHERE_COLUMNS]
+        )
+        self.drag_table = _FunctionTable([rocket.power_on_drag, rocket.power_off_drag])
+        self.surfaces = []
+        for aero_surface, position in rocket.aerodynamic_surfaces:
+            roll_parameters = getattr(aero_surface, "roll_parameters", None)
+            functions = [aero_surface.cl]
+            if roll_parameters is not None:
+                functions += roll_parameters[:2]
+            self.surfaces.append(
+                (
+                    _surface_cpz(rocket, aero_surface, position),
+                    aero_surface.reference_area,
+                    aero_surface.reference_length,
+                    None if roll_parameters is None else roll_parameters[2],
+                    functions,
+                )
+            )
+        self._compile_constants()
+
+    @staticmethod
+    def _surface_coefficients(table, attack_angle, mach):
+        lift_coefficient, *roll_coefficients = table
+        return [
+            _evaluate_array(lift_coefficient, attack_angle, mach),
+            *(_evaluate_array(function, mach) for function in roll_coefficients),
+        ]
+
+
+def _surface_cpz(rocket, aero_surface, position):
+    """Position of the center of pressure of an aerodynamic surface relative
+    to the center of dry mass of the rocket, along the rocket axis."""
+    return (
+        position - rocket.center_of_dry_mass_position
+    ) * rocket._csys - aero_surface.cpz
+
+
+def _evaluate_array(function, *args):
+    """Evaluate a Function, or a time derivative returned by
+    ``Flight.__time_derivative``, at every point given by the arrays in
+    args. Datasets, expressions and exact derivatives are evaluated at all
+    points at once, and callables point by point."""
+    if len(args[0]):
+        if isinstance(function, Function):
+            source = function.source
+            if not callable(source) or hasattr(source, "evaluate_array"):
+                return np.asarray(function.get_value(*args), dtype=np.float64)
+            function = function.get_value_opt
+        elif hasattr(function, "evaluate_array"):
+            return function.evaluate_array(*args)
+    return np.array([function(*point) for point in zip(*args)])
@@ -0,0 +1,239 @@
+"""ODE solvers available to the Flight class. Every solver follows the
+``scipy.integrate.OdeSolver`` interface and allows its time bound to be moved
+after creation, which the Flight class relies on to stop the integration
+exactly at parachute and controller sampling times."""
+
+import numpy as np
+from scipy import integrate
+
+
+class _LSODA(integrate.LSODA):
+    """``scipy.integrate.LSODA`` with a writable ``t_bound``. The wrapped
+    ODEPACK integrator keeps its own copy of the time bound, which is updated
+    here whenever ``t_bound`` is set."""
+
+    @property
+    def t_bound(self):
+        return self._t_bound
+
+    @t_bound.setter
+    def t_bound(self, value):
+        self._t_bound = value
+        # The base class sets t_bound before creating the ODEPACK solver
+        solver = getattr(self, "_lsoda_solver", None)
+        if solver is not None:
+            solver._integrator.rwork[0] = value
+            solver._integrator.call_args[4] = solver._integrator.rwork
+
+
+class RK4(integrate.OdeSolver):
+    """Classic fourth order Runge-Kutta method with a fixed time step. Steps
+    are only shortened to land exactly on ``t_bound``, which makes the time
+    grid, and thus the run time, independent of the solution.
+
+    Parameters
+    ----------
+    fun : callable
+        Right-hand side of the system, ``fun(t, y)``.
+    t0 : float
+        Initial time.
+    y0 : array_like
+        Initial state.
+    t_bound : float
+        Boundary time. The integration does not go beyond it.
+    max_step : float, optional
+        Fixed step size. If not finite, ``RK4.default_step`` is used.
+        Default is np.inf.
+    vectorized : bool, optional
+        Whether ``fun`` is vectorized. Default is False.
+    """
+
+    default_step = 0.01
+
+    def __init__(
+        self, fun, t0, y0, t_bound, max_step=np.inf, vectorized=False, **extraneous
+    ):  # pylint: disable=unused-argument
+        super().__init__(fun, t0, y0, t_bound, vectorized)
+        if max_step <= 0:
+            raise ValueError("`max_step` must be positive.")
+        self.h_abs = max_step if np.isfinite(max_step) else self.default_step
+        self.f = self.fun(self.t, self.y)
+        self.y_old = None
+        self.f_old = None
+
+    def _step_impl(self):
+        t, y, k1 = self.t, self.y, self.f
+        h = self.h_abs
+        remaining = abs(self.t_bound - t)
+        if remaining <= h * (1 + 1e-6):
+            # Land exactly on t_bound instead of leaving a tiny last step
+            h = remaining
+        h *= self.direction
+        self.y_old = y
+        k2 = self.fun(t + h / 2, y + h / 2 * k1)
+        k3 = self.fun(t + h / 2, y + h / 2 * k2)
+        k4 = self.fun(t + h, y + h * k3)
+        self.t = t + h
+        self.y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        # Derivative at the new point is the first stage of the next step
+        self.f_old = k1
+        self.f = self.fun(self.t, self.y)
+        return True, None
+
+    def _dense_output_impl(self):
+        return HermiteDenseOutput(
+            self.t_old, self.t, self.y_old, self.f_old, self.y, self.f
+        )
+
+
+class HermiteDenseOutput(integrate.DenseOutput):
+    """Monotone cubic Hermite interpolant between two solver steps, built from
+    the states and derivatives at both ends of the step. The end derivatives
+    are limited as in Fritsch and Carlson (1980), so that components that
+    vary monotonically over the step are interpolated without overshoots,
+    which matters when the derivative switches on inside a step, as it does
+    when the thrust overcomes the weight on the launch rail."""
+
+    def __init__(self, t_old, t, y_old, f_old, y, f):
+        super().__init__(t_old, t)
+        self.h = t - t_old
+        self.y_old = y_old
+        self.y = y
+        slope = (y - y_old) / self.h
+        m0 = np.where(f_old * slope > 0, f_old, 0.0)
+        m1 = np.where(f * slope > 0, f, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tau = np.where(
+                m0**2 + m1**2 > 9 * slope**2,
+                3 * np.abs(slope) / np.hypot(m0, m1),
+                1.0,
+            )
+        self.m0 = self.h * tau * m0
+        self.m1 = self.h * tau * m1
+
+    def _call_impl(self, t):
+        s = (t - self.t_old) / self.h
+        h00 = 2 * s**3 - 3 * s**2 + 1
+        h10 = s**3 - 2 * s**2 + s
+        h01 = -2 * s**3 + 3 * s**2
+        h11 = s**3 - s**2
+        if np.ndim(t) == 0:
+            return h00 * self.y_old + h10 * self.m0 + h01 * self.y + h11 * self.m1
+        return (
+            np.outer(self.y_old, h00)
+            + np.outer(self.m0, h10)
+            + np.outer(self.y, h01)
+            + np.outer(self.m1, h11)
+        )
+
+
+INTEGRATORS = {
+    "LSODA": _LSODA,
+    "RK45": integrate.RK45,
+    "DOP853": integrate.DOP853,
+    "Radau": integrate.Radau,
+    "RK4": RK4,
+}
+
+
+def get_integrator(integrator):
+    """Returns the solver class corresponding to an integrator name.
+
+    Parameters
+    ----------
+    integrator : str, scipy.integrate.OdeSolver
+        Name of the integrator, one of "LSODA", "RK45", "DOP853", "Radau" or
+        "RK4". A subclass of ``scipy.integrate.OdeSolver`` is returned as is.
+
+    Returns
+    -------
+    type
+        Solver class.
+
+    Raises
+    ------
+    ValueError
+        If the integrator is not recognized.
+    """
+    if isinstance(integrator, type) and issubclass(integrator, integrate.OdeSolver):
+        return integrator
+    try:
+        return INTEGRATORS[integrator]
+    except (KeyError, TypeError) as e:
+        raise ValueError(
+            f"Invalid integrator '{integrator}'. Must be one of "
+            f"{list(INTEGRATORS)} or a scipy.integrate.OdeSolver subclass."
+        ) from e
+
+
+def get_integrator_name(integrator):
+    """Returns the name of an integrator, which ``get_integrator`` maps back
+    to the same solver class.
+
+    Parameters
+    ----------
+    integrator : str, scipy.integrate.OdeSolver
+        Integrator name or solver class. See ``get_integrator``.
+
+    Returns
+    -------
+    str
+        Name of the integrator.
+
+    Raises
+    ------
+    ValueError
+        If the integrator is not recognized, or is a solver class that is not
+        registered under a name.
+    """
+    solver = get_integrator(integrator)
+    for name, registered_solver in INTEGRATORS.items():
+        if solver is registered_solver:
+            return name
+    raise ValueError(
+        f"The solver class {solver.__module__}.{solver.__qualname__} has no "
+        f"integrator name. Only {list(INTEGRATORS)} are stored by name."
+    )
+
+
+def create_solver(
+    integrator, fun, t0, y0, t_bound, rtol, atol, min_step=0, max_step=np.inf
+):  # pylint: disable=too-many-arguments
+    """Creates an ODE solver whose ``t_bound`` can be changed between steps.
+    After changing ``t_bound``, the solver ``status`` must be set back to
+    "running" before stepping again.
+
+    Parameters
+    ----------
+    integrator : str, scipy.integrate.OdeSolver
+        Integrator name or solver class. See ``get_integrator``.
+    fun : callable
+        Right-hand side of the system, ``fun(t, y)``.
+    t0 : float
+        Initial time.
+    y0 : array_like
+        Initial state.
+    t_bound : float
+        Boundary time.
+    rtol : float, array
+        Relative tolerance. Ignored by fixed step solvers.
+    atol : float, array
+        Absolute tolerance. Ignored by fixed step solvers.
+    min_step : float, optional
+        Minimum step size. Only used by LSODA. Default is 0.
+    max_step : float, optional
+        Maximum step size. Fixed step solvers use it as their step size.
+        Default is np.inf.
+
+    Returns
+    -------
+    scipy.integrate.OdeSolver
+        The solver instance.
+    """
+    solver_class = get_integrator(integrator)
+    options = {"max_step": max_step}
+    if solver_class is not RK4:
+        options.update(rtol=rtol, atol=atol)
+    if issubclass(solver_class, integrate.LSODA):
+        options["min_step"] = min_step
+    return solver_class(fun, t0, y0, t_bound, **options)
@@ -0,0 +1,111 @@
+"""Lazy scheduling of the instants in which parachutes and controllers are
+sampled during a Flight simulation.
+
+Each parachute and controller is sampled at the multiples of its sampling
+period. Instead of creating a time node for every sampling instant of a
+flight phase and then sorting and merging them, the scheduler keeps only the
+next sampling instant of each trigger in a min-heap and builds each time node
+when the simulation reaches it.
+"""
+
+import heapq
+import math
+
+
+class _SamplingScheduler:
+    """Iterator over the time nodes between two instants. A time node groups
+    the parachutes and controllers sampled at the same instant, with the same
+    merging rules as ``Flight.TimeNodes``: instants equal up to 1e-7 s are
+    merged into the earliest of them, and sampling instants equal to the
+    final instant are left for the next time interval.
+
+    Iterating yields ``Flight.TimeNodes.TimeNode`` objects, each with a
+    ``time_bound`` attribute holding the time of the following node. The last
+    node, at the final instant, is not yielded.
+    """
+
+    def __init__(
+        self, node_class, t_init, t_end, parachutes=(), controllers=(), start=True
+    ):
+        """Create the scheduler.
+
+        Parameters
+        ----------
+        node_class : type
+            Class of the yielded time nodes, ``Flight.TimeNodes.TimeNode``.
+        t_init : float
+            Initial instant. Sampling instants before it are not scheduled.
+        t_end : float
+            Final instant. Sampling instants after it are not scheduled.
+        parachutes : list[Parachute], optional
+            Parachutes to be sampled at their sampling rate.
+        controllers : list[_Controller], optional
+            Controllers to be sampled at their sampling rate.
+        start : bool, optional
+            Whether an empty node is placed at the initial instant, so that
+            the first node is always at t_init. Default is True.
+        """
+        self.node_class = node_class
+        self.t_end = t_end
+        self.__stopped = False
+        self.__triggers = [(parachute, True) for parachute in parachutes] + [
+            (controller, False) for controller in controllers
+        ]
+        # Heap of (time, order, sample index); the order keeps the nodes at
+        # the same time in insertion order, as a stable sort of the time
+        # nodes would. The initial and final nodes have no sample index.
+        self.__heap = [(t_end, len(self.__triggers), None)]
+        if start:
+            self.__heap.append((t_init, -1, None))
+        self.__periods = []
+        self.__last_indices = []
+        for order, (trigger, _) in enumerate(self.__triggers):
+            period = 1 / trigger.sampling_rate
+            index = math.ceil(t_init / period)
+            self.__periods.append(period)
+            self.__last_indices.append(math.floor(t_end / period))
+            if index <= self.__last_indices[order]:
+                self.__heap.append((index * period, order, index))
+        heapq.heapify(self.__heap)
+
+    def stop(self):
+        """Stop the iteration after the current node, as when an event or a
+        parachute trigger ends the flight phase."""
+        self.__stopped = True
+
+    def __next_node(self):
+        """Pop every sampling instant of the next node and schedule the
+        following instants of the same triggers.
+
+        Returns
+        -------
+        tuple[TimeNode, bool]
+            The node and whether it is the last node.
+        """
+        heap = self.__heap
+        t = heap[0][0]
+        key = round(t, 7)
+        node = self.node_class(t, [], [])
+        is_last = False
+        while heap and round(heap[0][0], 7) == key:
+            _, order, index = heapq.heappop(heap)
+            if index is None:
+                is_last = is_last or order == len(self.__triggers)
+                continue
+            trigger, is_parachute = self.__triggers[order]
+            if is_parachute:
+                node.parachutes.append(trigger)
+            else:
+                node._controllers.append(trigger)
+            if index < self.__last_indices[order]:
+                index += 1
+                heapq.heappush(heap, (index * self.__periods[order], order, index))
+        return node, is_last
+
+    def __iter__(self):
+        node, is_last = self.__next_node()
+        while not is_last and not self.__stopped:
+            next_node, next_is_last = self.__next_node()
+            node.time_bound = next_node.t
+            yield node
+            node, is_last = next_node, next_is_last
@@ -958,6 +958,175 @@ def quaternions_to_nutation(e1, e2):
     return (180 / np.pi) * 2 * np.arcsin(-((e1**2 + e2**2) ** 0.5))
 
 
+class GrowableArray:
+    """Two dimensional float64 array that grows by appending rows. Memory is
+    preallocated and its capacity doubles whenever it is exhausted, so that
+    appending a row costs amortized O(1) and no Python object is created per
+    row. The object behaves like a list of rows: it supports ``len``,
+    iteration, indexing, ``append``, ``insert`` and ``+=``. Rows are returned
+    as NumPy views, so writing to them modifies the array.
+
+    Examples
+    --------
+    >>> from rocketpy.tools import GrowableArray
+    >>> buffer = GrowableArray(columns=3, capacity=2)
+    >>> buffer.append([0, 1, 2])
+    >>> buffer += [[3, 4, 5], [6, 7, 8]]
+    >>> len(buffer)
+    3
+    >>> buffer[-1]
+    array([6., 7., 8.])
+    >>> buffer.insert(-1, [9, 9, 9])
+    >>> buffer.array[:, 0]
+    array([0., 3., 9., 6.])
+    """
+
+    def __init__(self, columns, capacity=64):
+        """Create an empty array.
+
+        Parameters
+        ----------
+        columns : int
+            Number of columns of each row.
+        capacity : int, optional
+            Number of rows preallocated. Default is 64.
+        """
+        self._data = np.empty((max(capacity, 1), columns), dtype=np.float64)
+        self._size = 0
+
+    @classmethod
+    def shared(cls, array):
+        """Create a growable array whose rows are the rows of an existing two
+        dimensional array, without copying it. The existing array is never
+        modified: it is copied into a new buffer the first time a row is
+        written, appended or inserted.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Two dimensional float64 array to be shared.
+
+        Returns
+        -------
+        GrowableArray
+            Growable array sharing the memory of ``array``.
+        """
+        growable = cls(columns=array.shape[1], capacity=1)
+        growable._data = array.view()
+        growable._data.flags.writeable = False
+        growable._size = len(array)
+        return growable
+
+    @property
+    def array(self):
+        """Filled part of the buffer, as a NumPy view (no copy) of shape
+        (len(self), columns)."""
+        return self._data[: self._size]
+
+    @property
+    def columns(self):
+        """Number of columns of each row."""
+        return self._data.shape[1]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+    def __setitem__(self, index, value):
+        self.__reserve(self._size)
+        self.array[index] = value
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self.array, dtype=dtype)
+        return np.asarray(self.array, dtype=dtype)
+
+    def __repr__(self):
+        return f"GrowableArray({self.array!r})"
+
+    def __iadd__(self, rows):
+        self.extend(rows)
+        return self
+
+    def __reserve(self, size):
+        capacity = max(len(self._data), 1)
+        if size <= len(self._data) and self._data.flags.writeable:
+            return
+        while capacity < size:
+            capacity *= 2
+        data = np.empty((capacity, self.columns), dtype=np.float64)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def append(self, row):
+        """Append a row to the end of the array.
+
+        Parameters
+        ----------
+        row : list, np.ndarray
+            Row with ``columns`` values.
+        """
+        self.__reserve(self._size + 1)
+        self._data[self._size] = row
+        self._size += 1
+
+    def extend(self, rows):
+        """Append several rows to the end of the array.
+
+        Parameters
+        ----------
+        rows : list, np.ndarray
+            Sequence of rows, each with ``columns`` values.
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.columns)
+        self.__reserve(self._size + len(rows))
+        self._data[self._size : self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def insert(self, index, row):
+        """Insert a row before the given index, as ``list.insert`` does.
+
+        Parameters
+        ----------
+        index : int
+            Index before which the row is inserted. Negative values count
+            from the end of the array.
+        row : list, np.ndarray
+            Row with ``columns`` values.
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        index = min(index, self._size)
+        self.__reserve(self._size + 1)
+        self._data[index + 1 : self._size + 1] = self._data[index : self._size]
+        self._data[index] = row
+        self._size += 1
+
+    def truncate(self, size):
+        """Discard every row after the first ``size`` rows.
+
+        Parameters
+        ----------
+        size : int
+            Number of rows to keep.
+        """
+        self._size = min(max(size, 0), self._size)
+
+    def shrink_to_fit(self):
+        """Release the preallocated memory that is not being used."""
+        if len(self._data) > max(self._size, 1):
+            self._data = self._data[: max(self._size, 1)].copy()
+
+    def tolist(self):
+        """Returns the rows as a list of lists of floats."""
+        return self.array.tolist()
+
+
 if __name__ == "__main__":
     import doctest
 
@@ -0,0 +1,60 @@
+"""Micro-benchmarks of the evaluation of single points by 1-D Functions given
+by datasets, which is done millions of times in each Monte Carlo campaign.
+Each test pins the latency of ``Function.get_value_opt`` for one combination
+of interpolation and extrapolation methods, inside and outside of the data
+range. The budgets are a few times the latencies measured on a development
+machine, so that only regressions of the interpolation kernels fail them.
+These tests are slow and only run with the --runslow option."""
+
+import timeit
+
+import numpy as np
+import pytest
+
+from rocketpy import Function
+
+# Budget of a single evaluation, in microseconds
+LATENCY_BUDGET = 3
+
+
+def latency(func, x, number=10000, repeat=7):
+    """Best time of a single evaluation of a Function, in microseconds.
+
+    Parameters
+    ----------
+    func : Function
+        Function to be evaluated.
+    x : float
+        Point where the Function is evaluated.
+    number : int, optional
+        Number of evaluations of each timing. Default is 10000.
+    repeat : int, optional
+        Number of timings, of which the fastest is taken. Default is 7.
+
+    Returns
+    -------
+    float
+        Time of one evaluation, in microseconds.
+    """
+    get_value_opt = func.get_value_opt
+    timings = timeit.repeat(lambda: get_value_opt(x), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("interpolation", ["linear", "polynomial", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["constant", "natural", "zero"])
+@pytest.mark.parametrize("where", ["inside", "outside"])
+def test_get_value_opt_latency(interpolation, extrapolation, where):
+    """Test that evaluating a single point is within the latency budget."""
+    # Polynomials are only used for a few points
+    samples = 8 if interpolation == "polynomial" else 500
+    x = np.linspace(0, 10, samples)
+    func = Function(
+        np.column_stack((x, np.sin(x))),
+        interpolation=interpolation,
+        extrapolation=extrapolation,
+    )
+    point = 4.321 if where == "inside" else 12.5
+
+    assert latency(func, point) < LATENCY_BUDGET
@@ -4,8 +4,9 @@ from unittest.mock import patch
 import matplotlib as plt
 import numpy as np
 import pytest
+from scipy.integrate import RK45
 
-from rocketpy import Environment, Flight
+from rocketpy import Environment, Flight, FlightEvent
 
 plt.rcParams.update({"figure.max_open_warning": 0})
 
@@ -511,3 +512,398 @@ def test_freestream_speed_at_apogee(example_plain_env, calisto):
         test_flight.free_stream_speed(test_flight.apogee_time), 0.0, atol=soft_atol
     )
     assert np.isclose(test_flight.apogee_freestream_speed, 0.0, atol=soft_atol)
+
+
+def test_compiled_kernel_flight(flight_calisto_robust):
+    """Tests that a flight simulated with the compiled kernel reproduces the
+    main results of the same flight simulated with the standard kernel.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be compared against. See the conftest.py file for
+        more info regarding this pytest fixture.
+    """
+    compiled_flight = Flight(
+        environment=flight_calisto_robust.env,
+        rocket=flight_calisto_robust.rocket,
+        rail_length=5.2,
+        inclination=85,
+        heading=0,
+        terminate_on_apogee=False,
+        kernel="compiled",
+    )
+    standard_flight = flight_calisto_robust
+
+    assert np.isclose(compiled_flight.apogee, standard_flight.apogee, rtol=1e-3)
+    assert np.isclose(
+        compiled_flight.apogee_time, standard_flight.apogee_time, rtol=1e-3
+    )
+    assert np.isclose(
+        compiled_flight.out_of_rail_velocity,
+        standard_flight.out_of_rail_velocity,
+        rtol=1e-3,
+    )
+    assert np.isclose(compiled_flight.x_impact, standard_flight.x_impact, atol=5)
+    assert np.isclose(compiled_flight.y_impact, standard_flight.y_impact, atol=5)
+    assert np.isclose(
+        compiled_flight.max_mach_number, standard_flight.max_mach_number, rtol=1e-3
+    )
+
+
+@pytest.mark.parametrize(
+    "integrator",
+    [
+        "RK45",
+        "DOP853",
+        "Radau",
+        "RK4",
+        {"rail": "RK45", "powered": "LSODA", "coast": "DOP853", "parachute": "RK4"},
+    ],
+)
+def test_flight_integrators(flight_calisto_robust, integrator):
+    """Tests that flights simulated with different integrators, or with a
+    different integrator in each flight phase, agree with the default LSODA
+    integrator.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be compared against. See the conftest.py file for
+        more info regarding this pytest fixture.
+    integrator : str, dict
+        Integrator passed to the Flight class.
+    """
+    test_flight = Flight(
+        environment=flight_calisto_robust.env,
+        rocket=flight_calisto_robust.rocket,
+        rail_length=5.2,
+        inclination=85,
+        heading=0,
+        integrator=integrator,
+    )
+
+    assert np.isclose(test_flight.apogee, flight_calisto_robust.apogee, rtol=1e-3)
+    assert np.isclose(
+        test_flight.apogee_time, flight_calisto_robust.apogee_time, rtol=1e-3
+    )
+    assert np.isclose(
+        test_flight.out_of_rail_velocity,
+        flight_calisto_robust.out_of_rail_velocity,
+        rtol=1e-2,
+    )
+    assert np.isclose(test_flight.x_impact, flight_calisto_robust.x_impact, atol=5)
+
+
+def test_flight_invalid_integrator(calisto_robust, example_plain_env):
+    """Tests that invalid integrators and flight phases raise errors."""
+    with pytest.raises(ValueError):
+        Flight(
+            environment=example_plain_env,
+            rocket=calisto_robust,
+            rail_length=5.2,
+            integrator="Euler",
+        )
+    with pytest.raises(ValueError):
+        Flight(
+            environment=example_plain_env,
+            rocket=calisto_robust,
+            rail_length=5.2,
+            integrator={"descent": "RK45"},
+        )
+
+
+def test_flight_events(flight_calisto_robust):
+    """Tests that user defined events are located during the simulation and
+    that terminal events stop it.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be compared against. See the conftest.py file for
+        more info regarding this pytest fixture.
+    """
+    env = flight_calisto_robust.env
+
+    def mach_number(t, u):  # pylint: disable=unused-argument
+        speed = (u[3] ** 2 + u[4] ** 2 + u[5] ** 2) ** 0.5
+        return speed / env.speed_of_sound(u[2]) - 0.5
+
+    mach_event = FlightEvent("mach 0.5", mach_number)
+    altitude_event = FlightEvent.linear(
+        "4500 m", {2: 1}, 4500, direction=1, terminal=True
+    )
+    test_flight = Flight(
+        environment=env,
+        rocket=flight_calisto_robust.rocket,
+        rail_length=5.2,
+        inclination=85,
+        heading=0,
+        events=[mach_event, altitude_event],
+    )
+
+    names = [event.name for _, event, _ in test_flight.triggered_events]
+    assert names == ["rail exit", "mach 0.5", "mach 0.5", "4500 m"]
+    # accelerating and decelerating crossings of mach 0.5
+    for t, event, state in test_flight.triggered_events[1:3]:
+        assert np.isclose(mach_number(t, state), 0, atol=1e-6)
+        assert np.isclose(test_flight.mach_number(t), 0.5, atol=1e-3)
+    assert np.isclose(test_flight.t_final, test_flight.triggered_events[-1][0])
+    assert np.isclose(test_flight.z(test_flight.t_final), 4500)
+    assert np.isclose(
+        test_flight.t_final, flight_calisto_robust.z.find_input(4500, 15), atol=1e-3
+    )
+    assert len(test_flight.apogee_state) == 1
+
+
+def test_flight_impact_at_start(calisto, example_plain_env):
+    """Tests that a flight starting at ground level and moving down detects
+    the impact at its initial time.
+
+    Parameters
+    ----------
+    calisto : rocketpy.Rocket
+        Calisto rocket, without parachutes. See the conftest.py file for more info.
+    example_plain_env : rocketpy.Environment
+        Environment object. See the conftest.py file for more info.
+    """
+    elevation = example_plain_env.elevation
+    test_flight = Flight(
+        environment=example_plain_env,
+        rocket=calisto,
+        rail_length=5.2,
+        initial_solution=[0, 0, 0, elevation, 0, 0, -5, 1, 0, 0, 0, 0, 0, 0],
+        max_time=60,
+    )
+    assert [event.name for _, event, _ in test_flight.triggered_events] == ["impact"]
+    assert test_flight.t_final == 0
+    assert np.all(np.isfinite(test_flight.solution_array))
+    assert test_flight.impact_velocity == -5
+
+
+def test_flight_branch(flight_calisto_robust):
+    """Tests that a flight branched from a checkpoint reproduces the original
+    flight, shares its solution before the checkpoint and accepts a different
+    recovery configuration.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be compared against. See the conftest.py file for
+        more info regarding this pytest fixture.
+    """
+    test_flight = flight_calisto_robust
+    checkpoint = test_flight.checkpoint(test_flight.apogee_time - 2)
+    assert checkpoint.t <= test_flight.apogee_time - 2
+    assert len(checkpoint.parachutes) == 2
+
+    same_flight = test_flight.branch(checkpoint)
+    assert np.array_equal(
+        same_flight.solution_array[: checkpoint.index + 1],
+        test_flight.solution_array[: checkpoint.index + 1],
+    )
+    assert same_flight.out_of_rail_time == test_flight.out_of_rail_time
+    assert np.isclose(same_flight.apogee, test_flight.apogee, atol=1e-2)
+    assert np.isclose(same_flight.t_final, test_flight.t_final, atol=1)
+    assert np.isclose(same_flight.x_impact, test_flight.x_impact, atol=1)
+    assert np.isclose(same_flight.y_impact, test_flight.y_impact, atol=1)
+    assert np.isclose(same_flight.ax(1), test_flight.ax(1))
+
+    # Without the main parachute the descent is faster
+    drogue = [p for p in checkpoint.parachutes if p.name == "calisto_drogue_chute"]
+    no_main_flight = test_flight.branch(checkpoint, parachutes=drogue)
+    assert len(no_main_flight.parachute_events) == 1
+    assert no_main_flight.t_final < test_flight.t_final - 30
+
+    # A checkpoint between trigger and inflation keeps the inflation
+    t_trigger, parachute = test_flight.parachute_events[0]
+    checkpoint = test_flight.checkpoint(t_trigger + parachute.lag / 2)
+    assert checkpoint.inflations == [(t_trigger + parachute.lag, parachute.cd_s)]
+    branched_flight = test_flight.branch(checkpoint, parachutes=[])
+    assert branched_flight.parachute_events == [[t_trigger, parachute]]
+    assert np.isclose(
+        branched_flight.vz(t_trigger + 5), test_flight.vz(t_trigger + 5), rtol=1e-3
+    )
+
+
+def test_flight_branch_air_brakes(flight_calisto_air_brakes):
+    """Tests that branching a controlled flight restores the air brakes
+    deployment level at the checkpoint.
+
+    Parameters
+    ----------
+    flight_calisto_air_brakes : rocketpy.Flight
+        Flight object with air brakes. See the conftest.py file for more info
+        regarding this pytest fixture.
+    """
+    test_flight = flight_calisto_air_brakes
+    air_brakes = test_flight.rocket.air_brakes[0]
+    final_deployment_level = air_brakes.deployment_level
+    # the air brakes are still opening at this time
+    checkpoint = test_flight.checkpoint(10)
+    [(_, deployment_level)] = checkpoint.air_brakes_levels
+    assert 0 < deployment_level < final_deployment_level
+
+    branched_flight = test_flight.branch(checkpoint)
+    assert np.isclose(air_brakes.deployment_level, final_deployment_level)
+    assert np.isclose(branched_flight.apogee, test_flight.apogee, atol=1)
+    assert np.isclose(branched_flight.apogee_time, test_flight.apogee_time, atol=0.1)
+    assert np.isclose(branched_flight.ax(1), test_flight.ax(1))
+
+
+def test_air_brakes_history_length(
+    calisto_robust, example_plain_env, controller_function
+):
+    """Tests that a controller with a history length receives array views of
+    the last states and observed variables, and that the flight is the same
+    as with the whole history.
+
+    Parameters
+    ----------
+    calisto_robust : rocketpy.Rocket
+        Rocket to which the air brakes are added. See the conftest.py file for
+        more info regarding this pytest fixture.
+    example_plain_env : rocketpy.Environment
+        Environment to be simulated. See the conftest.py file for more info.
+    controller_function : function
+        Air brakes controller function. See the conftest.py file for more info.
+    """
+    history_lengths = []
+
+    def bounded_controller_function(  # pylint: disable=too-many-arguments
+        time, sampling_rate, state, state_history, observed_variables, air_brakes
+    ):
+        assert isinstance(state_history, np.ndarray)
+        history_lengths.append((len(state_history), len(observed_variables)))
+        controller_function(
+            time, sampling_rate, state, state_history, observed_variables, air_brakes
+        )
+        return time, air_brakes.deployment_level
+
+    calisto_robust.parachutes = []
+    flights = []
+    for function, history_length in [
+        (controller_function, None),
+        (bounded_controller_function, 3),
+    ]:
+        air_brakes = calisto_robust.add_air_brakes(
+            drag_coefficient_curve="data/calisto/air_brakes_cd.csv",
+            controller_function=function,
+            sampling_rate=10,
+            initial_observed_variables=[0, 0],
+            history_length=history_length,
+        )
+        flights.append(
+            Flight(
+                rocket=calisto_robust,
+                environment=example_plain_env,
+                rail_length=5.2,
+                inclination=85,
+                heading=0,
+                time_overshoot=False,
+                terminate_on_apogee=True,
+            )
+        )
+        calisto_robust.air_brakes.remove(air_brakes)
+        calisto_robust._controllers.pop()
+
+    assert max(history_lengths) == (3, 3)
+    observed_variables = flights[1].get_controller_observed_variables()
+    assert observed_variables.array.shape == (len(history_lengths) + 1, 2)
+    assert np.isclose(flights[1].apogee, flights[0].apogee)
+    assert np.isclose(flights[1].ax(5), flights[0].ax(5))
+
+    with pytest.raises(ValueError):
+        calisto_robust.add_air_brakes(
+            drag_coefficient_curve="data/calisto/air_brakes_cd.csv",
+            controller_function=controller_function,
+            sampling_rate=10,
+            history_length=0,
+        )
+
+
+@pytest.mark.parametrize("t", [-1, 1e4])
+def test_flight_checkpoint_invalid_time(flight_calisto_robust, t):
+    """Tests that checkpoints outside the flight raise a ValueError."""
+    with pytest.raises(ValueError):
+        flight_calisto_robust.checkpoint(t)
+
+
+def test_flight_save_load(flight_calisto_robust, tmp_path):
+    """Tests that a flight saved to a binary file is loaded back with the
+    same results, without being simulated again.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be saved. See the conftest.py file for more info
+        regarding this pytest fixture.
+    tmp_path : pathlib.Path
+        Temporary directory. This is a pytest fixture.
+    """
+    test_flight = flight_calisto_robust
+    test_flight.save(tmp_path / "flight")
+    loaded_flight = Flight.load(tmp_path / "flight.npz")
+
+    assert np.array_equal(loaded_flight.solution_array, test_flight.solution_array)
+    assert loaded_flight.apogee == test_flight.apogee
+    assert loaded_flight.t_final == test_flight.t_final
+    assert loaded_flight.x_impact == test_flight.x_impact
+    assert [p.name for _, p in loaded_flight.parachute_events] == [
+        p.name for _, p in test_flight.parachute_events
+    ]
+    assert [e.name for _, e, _ in loaded_flight.triggered_events] == [
+        e.name for _, e, _ in test_flight.triggered_events
+    ]
+    time = np.linspace(0, test_flight.t_final, 100)
+    for attribute in (
+        "speed",
+        "mach_number",
+        "aerodynamic_drag",
+        "dynamic_pressure",
+        "reynolds_number",
+        "stability_margin",
+        "potential_energy",
+        "latitude",
+    ):
+        assert np.allclose(
+            getattr(loaded_flight, attribute)(time),
+            getattr(test_flight, attribute)(time),
+        )
+    assert np.isclose(
+        loaded_flight.max_acceleration_power_on, test_flight.max_acceleration_power_on
+    )
+    assert loaded_flight.prints.all() is None
+
+
+def test_flight_save_integrator_class(calisto_robust, example_plain_env, tmp_path):
+    """Tests that flights simulated with solver classes are saved with the
+    integrator names, and that solver classes without a name are rejected.
+
+    Parameters
+    ----------
+    calisto_robust : rocketpy.Rocket
+        Rocket of the flights. This is a pytest fixture.
+    example_plain_env : rocketpy.Environment
+        Environment of the flights. This is a pytest fixture.
+    tmp_path : pathlib.Path
+        Temporary directory. This is a pytest fixture.
+    """
+    arguments = {
+        "rocket": calisto_robust,
+        "environment": example_plain_env,
+        "rail_length": 5.2,
+        "inclination": 85,
+        "terminate_on_apogee": True,
+    }
+    flight = Flight(**arguments, integrator={"rail": RK45, "powered": "RK4"})
+    flight.save(tmp_path / "flight")
+    loaded_flight = Flight.load(tmp_path / "flight.npz")
+    assert loaded_flight.integrator == {"rail": "RK45", "powered": "RK4"}
+
+    class CustomRK45(RK45):
+        """Solver class that is not registered under an integrator name."""
+
+    flight = Flight(**arguments, integrator=CustomRK45)
+    with pytest.raises(ValueError, match="integrator name"):
+        flight.save(tmp_path / "custom")
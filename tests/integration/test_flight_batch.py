@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+
+from rocketpy import Flight, FlightBatch
+
+
+@pytest.fixture
+def calisto_descent_triggers(calisto_robust):
+    """The calisto_robust rocket with noiseless "apogee" and altitude
+    triggered parachutes, which FlightBatch evaluates for all flights at
+    once."""
+    calisto_robust.parachutes = []
+    calisto_robust.add_parachute("drogue", 1.0, "apogee", sampling_rate=105, lag=1.5)
+    calisto_robust.add_parachute("main", 10.0, 800, sampling_rate=105, lag=1.5)
+    return calisto_robust
+
+
+def test_flight_batch_matches_flight(calisto_descent_triggers, example_spaceport_env):
+    """Tests that every flight of a batch reproduces the main results of the
+    same flight simulated with the Flight class.
+
+    Parameters
+    ----------
+    calisto_descent_triggers : rocketpy.Rocket
+        Rocket with "apogee" and altitude triggered parachutes.
+    example_spaceport_env : rocketpy.Environment
+        Environment of the flights. This is a pytest fixture.
+    """
+    headings = [0, 45, 120]
+    batch = FlightBatch(
+        calisto_descent_triggers,
+        example_spaceport_env,
+        rail_length=5.2,
+        inclination=85,
+        heading=headings,
+    )
+    assert not batch.active.any()
+    for i, heading in enumerate(headings):
+        flight = Flight(
+            rocket=calisto_descent_triggers,
+            environment=example_spaceport_env,
+            rail_length=5.2,
+            inclination=85,
+            heading=heading,
+        )
+        assert np.isclose(batch.apogee[i], flight.apogee, rtol=1e-3)
+        assert np.isclose(batch.apogee_time[i], flight.apogee_time, rtol=1e-3)
+        assert np.isclose(
+            batch.out_of_rail_velocity[i], flight.out_of_rail_velocity, rtol=1e-3
+        )
+        assert np.isclose(batch.x_impact[i], flight.x_impact, atol=5)
+        assert np.isclose(batch.y_impact[i], flight.y_impact, atol=5)
+        assert np.isclose(batch.t_final[i], flight.t_final, atol=1)
+        assert [parachute for _, parachute in batch.parachute_events[i]] == [
+            parachute for _, parachute in flight.parachute_events
+        ]
+
+
+def test_flight_batch_terminate_on_apogee(calisto_robust, example_plain_env):
+    """Tests that flights leave the active mask at apogee when
+    terminate_on_apogee is True, and that their final state is the apogee.
+
+    Parameters
+    ----------
+    calisto_robust : rocketpy.Rocket
+        Rocket of the flights. This is a pytest fixture.
+    example_plain_env : rocketpy.Environment
+        Environment of the flights. This is a pytest fixture.
+    """
+    batch = FlightBatch(
+        calisto_robust,
+        example_plain_env,
+        rail_length=[5.2, 5.2],
+        inclination=[85, 60],
+        terminate_on_apogee=True,
+    )
+    assert not batch.active.any()
+    assert np.allclose(batch.t_final, batch.apogee_time)
+    assert np.allclose(batch.state[:, 2], batch.apogee)
+    assert np.allclose(batch.state[:, 5], 0, atol=1e-6)
+    assert batch.apogee[1] < batch.apogee[0]
+    assert np.isnan(batch.x_impact).all()
+
+
+def test_flight_batch_keeps_parachutes(calisto_robust, example_plain_env):
+    """Tests that flights sharing the parachutes of a rocket, whose triggers
+    are callables of the noisy pressure, do not record their pressure
+    signals in the shared Parachute objects.
+
+    Parameters
+    ----------
+    calisto_robust : rocketpy.Rocket
+        Rocket with noisy callable parachute triggers. This is a pytest
+        fixture.
+    example_plain_env : rocketpy.Environment
+        Environment of the flights. This is a pytest fixture.
+    """
+    signals = [
+        (list(parachute.noise_signal), list(parachute.clean_pressure_signal))
+        for parachute in calisto_robust.parachutes
+    ]
+    batch = FlightBatch(
+        calisto_robust, example_plain_env, rail_length=5.2, inclination=[85, 80]
+    )
+    assert [len(events) for events in batch.parachute_events] == [2, 2]
+    assert signals == [
+        (parachute.noise_signal, parachute.clean_pressure_signal)
+        for parachute in calisto_robust.parachutes
+    ]
+
+
+def test_flight_batch_diverged(calisto_robust, example_plain_env):
+    """Tests that a flight whose state is not finite, or whose error needs
+    steps below the minimum time step, is stopped and flagged as diverged
+    instead of shrinking the shared step size forever.
+
+    Parameters
+    ----------
+    calisto_robust : rocketpy.Rocket
+        Rocket of the flights. This is a pytest fixture.
+    example_plain_env : rocketpy.Environment
+        Environment of the flights. This is a pytest fixture.
+    """
+    batch = FlightBatch(
+        calisto_robust,
+        example_plain_env,
+        rail_length=5.2,
+        inclination=[85, np.nan],
+        terminate_on_apogee=True,
+    )
+    assert not batch.active.any()
+    assert batch.diverged.tolist() == [False, True]
+    assert batch.t_final[1] == 0
+    assert np.isfinite(batch.apogee[0]) and np.isnan(batch.apogee[1])
+
+    batch = FlightBatch(
+        calisto_robust,
+        example_plain_env,
+        rail_length=5.2,
+        min_time_step=0.5,
+        max_time_step=1,
+    )
+    assert batch.diverged.all()
+    assert batch.t_final[0] < 1
+
+
+def test_flight_batch_from_stochastic(
+    stochastic_environment, stochastic_calisto, stochastic_flight
+):
+    """Tests sampling the flights of a batch from stochastic models.
+
+    Parameters
+    ----------
+    stochastic_environment : rocketpy.StochasticEnvironment
+        Stochastic environment. This is a pytest fixture.
+    stochastic_calisto : rocketpy.StochasticRocket
+        Stochastic rocket. This is a pytest fixture.
+    stochastic_flight : rocketpy.StochasticFlight
+        Stochastic flight. This is a pytest fixture.
+    """
+    batch = FlightBatch.from_stochastic(
+        stochastic_environment,
+        stochastic_calisto,
+        stochastic_flight,
+        number_of_flights=2,
+    )
+    assert batch.number_of_flights == 2
+    assert len(batch.inputs_log) == 2
+    assert batch.inputs_log[0]["elevation"] != batch.inputs_log[1]["elevation"]
+    assert np.isfinite(batch.x_impact).all()
+    assert set(batch.results) >= {"apogee", "x_impact", "y_impact", "t_final"}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rail_length": [5.2, 5.2], "inclination": [80, 85, 90]},
+        {"rail_length": -1},
+        {"rail_length": 5.2, "max_time_step": 0},
+        {"rail_length": 5.2, "min_time_step": -1},
+        {"rail_length": 5.2, "min_time_step": 2, "max_time_step": 1},
+    ],
+)
+def test_flight_batch_invalid_arguments(calisto_robust, example_plain_env, kwargs):
+    """Tests that invalid arguments raise a ValueError."""
+    with pytest.raises(ValueError):
+        FlightBatch(calisto_robust, example_plain_env, **kwargs)
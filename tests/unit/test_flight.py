@@ -367,6 +367,101 @@ def test_max_values(flight_calisto_robust):
     assert pytest.approx(285.94948, rel=rtol) == test.max_speed
 
 
+def test_vectorized_post_processing(flight_calisto_custom_wind):
+    """Tests that the vectorized post processing of all flight phases gives
+    the same results as evaluating the equations of motion step by step.
+
+    Parameters
+    ----------
+    flight_calisto_custom_wind : rocketpy.Flight
+        Flight object to be tested. See the conftest.py file for more info.
+    """
+    flight = flight_calisto_custom_wind
+    post_processed = flight._Flight__evaluate_post_process
+
+    flight._Flight__post_processed_variables = []
+    for phase_index, phase in flight.time_iterator(flight.flight_phases):
+        final_time = flight.flight_phases[phase_index + 1].t
+        for callback in phase.callbacks:
+            callback(flight)
+        for step in flight.solution:
+            if phase.t < step[0] <= final_time or step[0] == phase.t == 0:
+                phase.derivative(step[0], step[1:], post_processing=True)
+    expected = np.array(flight._Flight__post_processed_variables)
+
+    assert post_processed.shape == expected.shape
+    assert np.allclose(post_processed, expected, rtol=1e-8, atol=1e-6)
+
+
+def test_flight_keeps_functions_unchanged(flight_calisto_custom_wind):
+    """Tests that simulating a flight does not set monotone queries on the
+    Functions of its rocket and environment.
+
+    Parameters
+    ----------
+    flight_calisto_custom_wind : rocketpy.Flight
+        Flight object to be tested. See the conftest.py file for more info.
+    """
+    env = flight_calisto_custom_wind.env
+    rocket = flight_calisto_custom_wind.rocket
+    for function in (
+        env.pressure,
+        env.density,
+        env.wind_velocity_x,
+        rocket.total_mass,
+        rocket.I_11,
+        rocket.motor.thrust,
+    ):
+        assert not function.__monotone_queries__
+
+
+def test_flight_phase_names(flight_calisto_robust):
+    """Tests that the flight phases keep the name of the Flight method that
+    computes their derivatives, including the ones after the rail exit.
+
+    Parameters
+    ----------
+    flight_calisto_robust : rocketpy.Flight
+        Flight object to be tested. See the conftest.py file for more info.
+    """
+    names = [phase.name for phase in flight_calisto_robust.flight_phases]
+    assert names[0] == "udot_rail1"
+    assert names[1] == "u_dot_generalized"
+    assert "u_dot_parachute" in names
+    assert names[-1] is None
+    assert set(names[:-1]) == {"udot_rail1", "u_dot_generalized", "u_dot_parachute"}
+
+
+def test_vectorized_trajectory_properties(flight_calisto_custom_wind):
+    """Tests that the atmospheric properties along the trajectory and the
+    angle of attack, evaluated at every step at once, match the step by step
+    evaluation of the Environment and attitude Functions.
+
+    Parameters
+    ----------
+    flight_calisto_custom_wind : rocketpy.Flight
+        Flight object to be tested. See the conftest.py file for more info.
+    """
+    flight = flight_calisto_custom_wind
+    env = flight.env
+    for name in ("pressure", "density", "speed_of_sound", "wind_velocity_x"):
+        expected = [getattr(env, name).get_value_opt(z) for _, z in flight.z]
+        assert np.allclose(getattr(flight, name)[:, 1], expected, rtol=1e-12)
+
+    time = flight.time[1:]
+    stream_speed = np.array([flight.free_stream_speed.get_value_opt(t) for t in time])
+    cosine = -sum(
+        np.array([attitude.get_value_opt(t) * stream.get_value_opt(t) for t in time])
+        for attitude, stream in (
+            (flight.attitude_vector_x, flight.stream_velocity_x),
+            (flight.attitude_vector_y, flight.stream_velocity_y),
+            (flight.attitude_vector_z, flight.stream_velocity_z),
+        )
+    )
+    expected = np.rad2deg(np.arccos(np.clip(cosine / stream_speed, -1, 1)))
+    assert np.allclose(flight.angle_of_attack[1:, 1], expected, atol=1e-9)
+
+
 def test_effective_rail_length(flight_calisto_robust, flight_calisto_nose_to_tail):
     """Tests the effective rail length of the flight simulation. The expected
     values are calculated by hand, and should be valid as long as the rail
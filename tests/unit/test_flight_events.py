@@ -0,0 +1,103 @@
+"""Module to test the detection of events along the steps of an ODE solver."""
+
+import numpy as np
+import pytest
+
+from rocketpy.simulation.events import FlightEvent, _EventDetector
+from rocketpy.simulation.integrators import create_solver
+
+
+def test_event_detector_locates_crossings():
+    """Tests that events are located at the roots of their functions and that
+    only crossings in the given direction trigger them."""
+    rising = FlightEvent("rising", lambda t, y: y[0] - 3, direction=1)
+    falling = FlightEvent("falling", lambda t, y: y[0] - 3, direction=-1)
+    apogee = FlightEvent("apogee", lambda t, y: y[1], direction=-1)
+    detector = _EventDetector([rising, falling, apogee])
+    # ballistic flight: y = 10 t - 4.9 t**2
+    solver = create_solver(
+        "RK45",
+        lambda t, y: np.array([y[1], -9.8]),
+        0,
+        [0, 10],
+        t_bound=2,
+        rtol=1e-9,
+        atol=1e-9,
+    )
+    detector.reset(solver.t, solver.y)
+    located = []
+    while solver.status == "running":
+        solver.step()
+        crossed = detector.check(solver.t, solver.y)
+        if crossed:
+            located += detector.locate(
+                crossed, solver.dense_output(), solver.t_old, solver.t
+            )
+
+    roots = np.roots([-4.9, 10, -3])
+    assert [event for event, _, _ in located] == [rising, apogee, falling]
+    assert located[0][1] == pytest.approx(min(roots))
+    assert located[1][1] == pytest.approx(10 / 9.8)
+    assert located[2][1] == pytest.approx(max(roots))
+    assert located[1][2] == pytest.approx([10**2 / (2 * 9.8), 0], abs=1e-8)
+
+
+def test_event_detector_deactivate_and_reset():
+    """Tests that deactivated events are not triggered and that events
+    triggered at the reset time are not triggered again."""
+    event = FlightEvent("zero", lambda t, y: y[0], direction=1)
+    detector = _EventDetector([event])
+    detector.reset(0, [1e-15], triggered=[event])
+    assert not detector.check(1, [1])
+    detector.reset(0, [-1])
+    assert detector.check(1, [1])
+    detector.deactivate(event)
+    detector.reset(0, [-1])
+    assert not detector.check(1, [1])
+
+
+def test_event_detector_zero_at_reset():
+    """Tests that events whose functions are exactly zero at the reset time
+    are triggered when the functions leave zero in their direction."""
+    rising = FlightEvent("rising", lambda t, y: y[0], direction=1)
+    falling = FlightEvent("falling", lambda t, y: y[0], direction=-1)
+    detector = _EventDetector([rising, falling])
+    detector.reset(0, [0])
+    assert not detector.check(1, [0])
+    assert [(i, before, after) for i, before, after in detector.check(2, [-1])] == [
+        (1, 0, -1)
+    ]
+    assert not detector.check(3, [-2])
+    detector.reset(0, [0])
+    crossed = detector.check(1, [1])
+    assert [i for i, _, _ in crossed] == [0]
+    [(event, t_event, _)] = detector.locate(crossed, lambda t: [t], 0, 1)
+    assert event is rising and t_event == 0
+    # an event crossed onto an exact root is not triggered again when leaving
+    detector.reset(0, [-1])
+    assert [i for i, _, _ in detector.check(1, [0])] == [0]
+    assert not detector.check(2, [1])
+
+
+def test_linear_events():
+    """Tests that linear events are evaluated together with the general ones
+    and match the equivalent event functions."""
+    linear = FlightEvent.linear("linear", {2: 2, 5: -1}, 3, direction=1)
+    general = FlightEvent("general", lambda t, u: 2 * u[2] - u[5] - 3)
+    dense = FlightEvent.linear("dense", np.arange(13), -1)
+    detector = _EventDetector([linear, general, dense])
+    u = np.linspace(-1, 1, 13)
+    assert linear.function(0, u) == pytest.approx(general.function(0, u))
+    assert detector.evaluate(0, u) == pytest.approx(
+        [linear.function(0, u), general.function(0, u), np.arange(13) @ u + 1]
+    )
+    detector.deactivate(linear)
+    assert detector.evaluate(0, u)[0] == 0
+    with pytest.raises(ValueError):
+        FlightEvent.linear("invalid", [1, 2, 3])
+
+
+def test_invalid_event_direction():
+    """Tests that invalid event directions raise errors."""
+    with pytest.raises(ValueError):
+        FlightEvent("invalid", lambda t, y: y[0], direction=2)
@@ -0,0 +1,46 @@
+"""Module to test the ODE solvers used by the Flight class."""
+
+import numpy as np
+import pytest
+
+from rocketpy.simulation.integrators import RK4, create_solver, get_integrator
+
+
+def ballistic(t, y):  # pylint: disable=unused-argument
+    return np.array([y[1], -9.8])
+
+
+@pytest.mark.parametrize("integrator", ["LSODA", "RK45", "DOP853", "Radau", "RK4"])
+def test_solver_time_bound_can_be_moved(integrator):
+    """Tests that every solver stops exactly at its time bound and continues
+    to a new time bound after it is moved, reaching the analytical solution.
+    """
+    solver = create_solver(
+        integrator, ballistic, 0, [0, 10], t_bound=1, rtol=1e-9, atol=1e-9
+    )
+    for t_bound in [1, 1.5, 3]:
+        solver.t_bound = t_bound
+        solver.status = "running"
+        while solver.status == "running":
+            solver.step()
+        assert solver.t == t_bound
+    assert np.allclose(solver.y, [10 * 3 - 4.9 * 3**2, 10 - 9.8 * 3])
+
+
+def test_rk4_fixed_step_and_dense_output():
+    """Tests that the RK4 solver takes steps of constant size and that its
+    dense output interpolates the solution between steps."""
+    solver = RK4(lambda t, y: np.cos(t), 0, [0], t_bound=1, max_step=0.1)
+    while solver.status == "running":
+        solver.step()
+        assert solver.step_size == pytest.approx(0.1)
+        midpoint = solver.t - 0.05
+        assert solver.dense_output()(midpoint) == pytest.approx(
+            np.sin(midpoint), abs=1e-6
+        )
+    assert solver.nfev == 4 * 10 + 1
+
+
+def test_get_integrator_invalid_name():
+    with pytest.raises(ValueError):
+        get_integrator("Euler")
@@ -2,7 +2,7 @@
 TimeNode.
 """
 
-# from rocketpy.rocket import Parachute, _Controller
+from rocketpy.simulation.scheduler import _SamplingScheduler
 
 
 def test_time_nodes_init(flight_calisto):
@@ -99,3 +99,41 @@ def test_time_node_lt(flight_calisto):
     node2 = flight_calisto.TimeNodes.TimeNode(2.0, [], [])
     assert node1 < node2
     assert not node2 < node1
+
+
+def test_sampling_scheduler_matches_time_nodes(
+    flight_calisto, calisto_drogue_chute, calisto_main_chute
+):
+    parachutes = [calisto_drogue_chute, calisto_main_chute]
+    calisto_main_chute.sampling_rate = 40
+    t_init, t_end = 0.013, 1.5
+
+    time_nodes = flight_calisto.TimeNodes()
+    time_nodes.add_node(t_init, [], [])
+    time_nodes.add_parachutes(parachutes, t_init, t_end)
+    time_nodes.add_node(t_end, [], [])
+    time_nodes.sort()
+    time_nodes.merge()
+
+    scheduler = _SamplingScheduler(
+        flight_calisto.TimeNodes.TimeNode, t_init, t_end, parachutes
+    )
+    nodes = list(scheduler)
+
+    assert len(nodes) == len(time_nodes) - 1
+    for i, node in enumerate(nodes):
+        assert node.t == time_nodes[i].t
+        assert node.time_bound == time_nodes[i + 1].t
+        assert node.parachutes == time_nodes[i].parachutes
+
+
+def test_sampling_scheduler_stop(flight_calisto, calisto_drogue_chute):
+    scheduler = _SamplingScheduler(
+        flight_calisto.TimeNodes.TimeNode, 0, 1, [calisto_drogue_chute]
+    )
+    nodes = []
+    for node in scheduler:
+        nodes.append(node)
+        if len(nodes) == 3:
+            scheduler.stop()
+    assert len(nodes) == 3
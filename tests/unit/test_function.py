@@ -2,11 +2,15 @@
 individual method of the Function class. The tests are made on both the
 expected behaviour and the return instances."""
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+
 import matplotlib as plt
 import numpy as np
 import pytest
 
-from rocketpy import Function
+from rocketpy import Function, FunctionBundle
 
 plt.rcParams.update({"figure.max_open_warning": 0})
 
@@ -119,6 +123,73 @@ def test_get_value():
     assert isinstance(func.get_value(1), (int, float))
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "polynomial", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["zero", "natural", "constant"])
+def test_get_value_array(interpolation, extrapolation):
+    """Tests that evaluating a 1-D Function at an array of points gives the
+    same results as evaluating it at each point."""
+    x = np.array([0, 0.5, 1.2, 2, 3.1, 4])
+    func = Function(
+        np.column_stack([x, np.sin(x)]),
+        interpolation=interpolation,
+        extrapolation=extrapolation,
+    )
+    points = np.concatenate([np.linspace(-2, 6, 101), x])
+    expected = np.array([func.get_value_opt(point) for point in points])
+
+    values = func.get_value(points)
+    assert isinstance(values, np.ndarray)
+    assert np.allclose(values, expected, rtol=1e-10, atol=1e-12)
+    assert np.allclose(func.get_value(list(points)), expected, rtol=1e-10, atol=1e-12)
+    assert np.isclose(func.get_value([2.5]), func.get_value_opt(2.5))
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "akima", "spline"])
+@pytest.mark.parametrize("uniform", [True, False])
+def test_set_monotone_queries(interpolation, uniform):
+    """Tests that remembering the last interval does not change the values
+    of a Function, for sequential and random evaluation points."""
+    x = np.linspace(0, 5, 21) if uniform else np.array([0, 0.3, 1, 1.1, 2.5, 4, 5])
+    func = Function(np.column_stack([x, x**2]), interpolation=interpolation)
+    monotone_func = Function(np.column_stack([x, x**2]), interpolation=interpolation)
+    assert monotone_func.set_monotone_queries() is monotone_func
+
+    points = np.concatenate(
+        [np.linspace(-1, 6, 301), np.random.default_rng(0).uniform(-1, 6, 100), x]
+    )
+    for point in points:
+        assert monotone_func.get_value_opt(point) == func.get_value_opt(point)
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "akima", "spline", "polynomial"])
+def test_monotone_evaluator(interpolation):
+    """Tests that monotone evaluators give the values of the Function, keep
+    their own interval and do not modify the Function."""
+    x = np.array([0, 0.3, 1, 1.1, 2.5, 4, 5])
+    func = Function(np.column_stack([x, x**2]), interpolation=interpolation)
+    evaluate, other = func.monotone_evaluator(), func.monotone_evaluator()
+    points = np.concatenate(
+        [np.linspace(-1, 6, 301), np.random.default_rng(0).uniform(-1, 6, 100), x]
+    )
+    for point in points:
+        assert evaluate(point) == func.get_value_opt(point)
+        assert other(6 - point) == func.get_value_opt(6 - point)
+    assert not func.__monotone_queries__
+    assert Function(lambda x: x**2).monotone_evaluator()(3) == 9
+
+
+def test_monotone_queries_copies():
+    """Tests that copies of a Function set with monotone queries remember
+    their own interval."""
+    x = np.linspace(0, 5, 11)
+    func = Function(np.column_stack([x, x**2])).set_monotone_queries()
+    for copied in (copy(func), deepcopy(func)):
+        assert copied._interpolation_func is not func._interpolation_func
+        assert copied.get_value_opt.__self__ is copied
+        func.get_value_opt(0.2)
+        assert copied.get_value_opt(4.9) == func.get_value_opt(4.9)
+
+
 def test_identity_function():
     """Tests the identity_function method of the Function class.
     Both with respect to return instances and expected behaviour.
@@ -136,6 +207,32 @@ def test_derivative_function():
     assert isinstance(square.derivative_function(), Function)
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "polynomial", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["constant", "natural", "zero"])
+def test_derivative_function_exact(interpolation, extrapolation):
+    """Tests the exact derivative of array based Functions against the
+    numerical derivatives, away from the data points."""
+    x = np.array([0, 0.5, 1.3, 2, 3.1, 4])
+    func = Function(
+        np.column_stack((x, np.sin(x) + x)),
+        interpolation=interpolation,
+        extrapolation=extrapolation,
+    )
+    derivative = func.derivative_function(exact=True)
+    second_derivative = derivative.derivative_function()
+    assert func.derivative_function(exact=True).source is derivative.source
+
+    points = np.linspace(-0.95, 4.95, 60)
+    values = derivative.get_value(points)
+    second_values = second_derivative.get_value(points)
+    for point, value, second_value in zip(points, values, second_values):
+        assert derivative.get_value_opt(point) == pytest.approx(value, abs=1e-12)
+        assert value == pytest.approx(func.differentiate(point), abs=1e-6)
+        assert second_value == pytest.approx(
+            func.differentiate(point, dx=1e-4, order=2), abs=1e-5
+        )
+
+
 def test_integral():
     """Tests the integral method of the Function class.
     Both with respect to return instances and expected behaviour.
@@ -163,6 +260,261 @@ def test_integral_function():
     assert isinstance(zero_func, Function)
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "polynomial", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["constant", "natural", "zero"])
+def test_integral_function_array(interpolation, extrapolation):
+    """Test the integral_function method of array based Functions against
+    the numerical integral, inside and outside the data domain."""
+    x = np.array([0, 0.5, 1.3, 2, 3.1, 4])
+    func = Function(
+        np.column_stack((x, np.sin(x) + x)),
+        interpolation=interpolation,
+        extrapolation=extrapolation,
+    )
+    integral = func.integral_function(-1, 5, datapoints=21)
+
+    assert len(integral.x_array) == 21
+    breaks = np.array([-1, *x, 5])
+    for point, value in zip(integral.x_array, integral.y_array):
+        # integrate each polynomial piece apart, as quad is inaccurate at kinks
+        edges = np.append(breaks[breaks < point], point)
+        expected = sum(
+            func.integral(a, b, numerical=True) for a, b in zip(edges, edges[1:])
+        )
+        assert value == pytest.approx(expected, abs=1e-8)
+
+
+def test_integral_function_grids():
+    """Test the evaluation points of the integral_function method."""
+    func = Function([(0, 1), (1, 3), (2, 3), (4, 0)], interpolation="linear")
+
+    on_knots = func.integral_function(datapoints=None)
+    assert np.array_equal(on_knots.x_array, [0, 1, 2, 4])
+    assert np.allclose(on_knots.y_array, [0, 2, 5, 8])
+    inner = func.integral_function(0.5, 3, datapoints=None)
+    assert np.array_equal(inner.x_array, [0.5, 1, 2, 3])
+    assert np.allclose(inner.y_array, [0, 1.25, 4.25, 6.5])
+    custom = func.integral_function(1, datapoints=[3, 0, 5])
+    assert np.array_equal(custom.x_array, [0, 3, 5])
+    assert np.allclose(custom.y_array, [-2, 5.25, 6])
+
+
+@pytest.mark.parametrize("tol", [1e-2, 1e-5])
+def test_inverse_function_tabulated(tol):
+    """Test the tabulated inverse of Functions given by a function."""
+    pressure = Function(lambda h: 101325 * np.exp(-h / 8400))
+    height = pressure.inverse_function(tol=tol, lower=0, upper=20000, samples=10)
+
+    assert isinstance(height.source, np.ndarray)
+    points = np.linspace(pressure(20000), 101325, 1000)
+    error = height.get_value(points) + 8400 * np.log(points / 101325)
+    assert np.max(np.abs(error)) < tol
+    # samples are only added where the curvature of the inverse is large
+    assert np.diff(height.x_array)[0] < np.diff(height.x_array)[-1]
+
+
+def test_inverse_function_tabulated_not_monotonic():
+    """Test that tabulating the inverse of a non monotonic Function fails."""
+    with pytest.raises(ValueError):
+        Function(lambda x: x**2).inverse_function(lower=-1, upper=2)
+    with pytest.raises(ValueError):
+        Function(3).inverse_function(lower=-1, upper=2)
+
+
+def test_cache():
+    """Test that the cached Function memoizes its evaluations and evicts the
+    least recently used ones."""
+    calls = []
+
+    def source(x):
+        calls.append(x)
+        return 2 * x
+
+    func = Function(source).cache(maxsize=2)
+    assert [func(1), func(1), func(2), func(3), func(1)] == [2, 2, 4, 6, 2]
+    assert calls == [1, 2, 3, 1]
+    info = func.source.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 2)
+    func.source.cache_clear()
+    assert func.source.cache_info().currsize == 0
+
+
+def test_cache_quantize():
+    """Test that the cached Function evaluates the source at the inputs
+    rounded to the quantization steps."""
+    func = Function(lambda x, y: x + y).cache(quantize=[0.5, None])
+    assert func(1.1, 2) == func(0.9, 2) == 3
+    assert func(1.3, 2.1) == pytest.approx(3.6)
+    info = func.source.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_cache_copies():
+    """Test that copies of a cached Function start with an empty cache."""
+    func = Function(lambda x: x**2).cache(quantize=1e-3)
+    func(2)
+    clone = deepcopy(func)
+    assert clone.source.cache_info().currsize == 0
+    assert clone(2.0001) == 4
+    assert clone.source.cache_info().misses == 1
+
+    func = Function([(0, 0), (1, 1), (2, 4)], interpolation="linear").cache()
+    func(1.5)
+    clone = pickle.loads(pickle.dumps(func))
+    assert clone.source.cache_info().currsize == 0
+    assert clone(1.5) == 2.5
+
+
+@pytest.mark.parametrize(
+    "maxsize, quantize",
+    [(-1, None), (1.5, None), (8, 0), (8, -1e-3), (8, [1e-3, 1e-3])],
+)
+def test_cache_invalid(maxsize, quantize):
+    """Test that invalid cache sizes and quantization steps are rejected."""
+    with pytest.raises(ValueError):
+        Function(lambda x: x).cache(maxsize=maxsize, quantize=quantize)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        Function([(0, 1), (1, 2), (2, 5), (3, 4)], interpolation="linear"),
+        Function([(0, 1), (1, 2), (2, 5), (3, 4)], interpolation="polynomial"),
+        Function([(0, 1), (1, 2), (2, 5), (3, 4)], interpolation="akima"),
+        Function([(0, 1), (1, 2), (2, 5), (3, 4)], extrapolation="natural"),
+        Function.from_arrays([0, 1, 2, 3], [1, 2, 5, 4]),
+        Function([(0, 0, 1), (1, 0, 2), (0, 1, 3), (1, 1, 5)]),
+        Function(
+            [(0, 0, 1), (1, 0, 2), (0, 1, 3), (1, 1, 5)],
+            interpolation="regular_grid",
+        ),
+        Function(2.5),
+        Function([(0, 1), (1, 2), (2, 5), (3, 4)]) * 2 + Function(np.sin),
+    ],
+)
+def test_pickle(func):
+    """Test that Functions are rebuilt from their pickled source and
+    settings, and evaluate as the original Function."""
+    points = [(-0.5,), (0.5,), (1.7,), (3.5,)]
+    if func.__dom_dim__ == 2:
+        points = [(0.2, 0.7), (0.5, 0.5), (1.5, -1)]
+    expected = [func(*point) for point in points]
+
+    state = func.__getstate__()
+    assert "get_value_opt" not in state
+    assert "x_array" not in state and "_coeffs" not in state
+
+    clone = pickle.loads(pickle.dumps(func))
+    assert [clone(*point) for point in points] == pytest.approx(expected)
+    assert clone.__inputs__ == func.__inputs__
+    assert clone.__interpolation__ == func.__interpolation__
+    assert clone.__extrapolation__ == func.__extrapolation__
+
+
+def test_pickle_serialization_domain():
+    """Test that lambdas are only pickled after a serialization domain is
+    declared, in which case they are discretized on it."""
+    func = Function(lambda x: x**3, "Time (s)", "Volume")
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(func)
+
+    assert func.set_serialization_domain(0, 2, 11, tol=1e-8) is func
+    assert callable(func.source)
+    clone = pickle.loads(pickle.dumps(func))
+    assert isinstance(clone.source, np.ndarray)
+    assert clone.__inputs__ == ["Time (s)"]
+    assert clone(1.234) == pytest.approx(1.234**3, abs=1e-6)
+
+    func_2d = Function(lambda x, y: x * y).set_serialization_domain(
+        [0, 0], [1, 1], [3, 3]
+    )
+    assert pickle.loads(pickle.dumps(func_2d))(0.5, 1) == pytest.approx(0.5)
+
+    with pytest.raises(ValueError):
+        Function(lambda x, y, z: x).set_serialization_domain(0, 1)
+
+
+def _evaluate_at_one(func):
+    return func(1.0)
+
+
+def test_share_memory():
+    """Test that Functions moved to shared memory are pickled without their
+    data points, and are evaluated in other processes."""
+    x = np.linspace(0, 10, 10001)
+    func = Function(np.column_stack((x, np.cos(x))))
+    expected = func(1.0)
+    size = len(pickle.dumps(func))
+
+    block = func.share_memory()
+    try:
+        assert np.shares_memory(func.x_array, func.source)
+        assert func(1.0) == expected
+        assert len(pickle.dumps(func)) < size / 100
+
+        clone = pickle.loads(pickle.dumps(func))
+        assert clone(1.0) == expected
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(_evaluate_at_one, func).result() == expected
+
+        copied = deepcopy(func)
+        assert "_shared_memory" not in copied.__dict__
+        assert len(pickle.dumps(copied)) == size
+        del clone
+    finally:
+        block.close()
+        block.unlink()
+
+    with pytest.raises(ValueError):
+        Function(lambda x: x).share_memory()
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["constant", "natural", "zero"])
+def test_function_bundle(interpolation, extrapolation):
+    """Test that a FunctionBundle evaluates all the bundled Functions as they
+    would be evaluated one by one, inside and outside of their domain."""
+    x = np.linspace(0, 3, 31)
+    functions = [
+        Function(np.column_stack((x, np.sin(x))), interpolation=interpolation),
+        Function(
+            np.column_stack((x, x**2)),
+            interpolation="linear",
+            extrapolation=extrapolation,
+        ),
+        Function(
+            np.column_stack((x, np.exp(x))),
+            interpolation=interpolation,
+            extrapolation=extrapolation,
+        ),
+    ]
+    functions.append(functions[2].derivative_function(exact=True))
+    bundle = FunctionBundle(functions)
+    assert len(bundle) == 4
+
+    points = np.linspace(-1, 4, 101)
+    expected = [[func.get_value_opt(point) for point in points] for func in functions]
+    values = [bundle.get_values(point) for point in points]
+    assert np.allclose(np.transpose(values), expected, rtol=1e-10, atol=1e-12)
+    assert np.allclose(bundle.get_values(points), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_function_bundle_invalid():
+    """Test that only Functions given by datasets over the same inputs can be
+    bundled together."""
+    func = Function([(0, 0), (1, 1), (2, 4)])
+    with pytest.raises(ValueError):
+        FunctionBundle([func, Function([(0, 0), (1, 1), (3, 9)])])
+    with pytest.raises(ValueError):
+        FunctionBundle([func, Function(lambda x: x)])
+    with pytest.raises(ValueError):
+        FunctionBundle(
+            [func, Function([(0, 0), (1, 1), (2, 4)], interpolation="polynomial")]
+        )
+    with pytest.raises(ValueError):
+        FunctionBundle([])
+
+
 @pytest.mark.parametrize(
     "x, y, z",
     [
@@ -224,6 +576,37 @@ def test_set_discrete_non_mutator(samples):
     assert callable(func.source)
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "akima", "spline"])
+def test_set_discrete_adaptive(interpolation):
+    """Tests that the adaptive set_discrete concentrates the samples around a
+    sharp feature and meets the tolerance at the midpoints between them."""
+    func = Function(lambda x: np.tanh(50 * x))
+    discretized_func = func.set_discrete(
+        -1, 1, 11, interpolation, mutate_self=False, tol=1e-4
+    )
+    x = discretized_func.x_array
+    assert np.all(np.diff(x) > 0)
+    assert x[0] == -1 and x[-1] == 1
+    assert np.sum(np.abs(x) < 0.1) > np.sum(np.abs(x) > 0.5)
+    x_mid = (x[:-1] + x[1:]) / 2
+    assert np.allclose(
+        discretized_func.get_value(x_mid), np.tanh(50 * x_mid), atol=1e-4
+    )
+
+
+def test_set_discrete_adaptive_max_samples():
+    """Tests that the adaptive set_discrete stops at the sample budget, also
+    for discontinuous Functions."""
+    func = Function(lambda x: float(x > 0.3))
+    discretized_func = func.set_discrete(0, 1, 5, "linear", tol=1e-8, max_samples=40)
+    assert len(discretized_func.x_array) == 40
+    func = Function(lambda x: float(x > 0.3))
+    discretized_func = func.set_discrete(0, 1, 5, "linear", tol=1e-8)
+    assert len(discretized_func.x_array) < 200
+    with pytest.raises(ValueError):
+        Function(lambda x, y: x + y).set_discrete(0, 1, 5, tol=1e-3)
+
+
 def test_set_discrete_based_on_model_mutator(linear_func):
     """Tests the set_discrete_based_on_model method of the Function class.
     The mutator argument is set to True.
@@ -585,6 +968,67 @@ def test_shepard_interpolation(x, y, z_expected):
     assert np.isclose(z, z_expected, atol=1e-8).all()
 
 
+@pytest.mark.parametrize(
+    "x,y,z_expected",
+    [
+        (0.5, 0.5, 0.25),
+        (1, 2, 2),
+        (0.25, 1.5, 0.375),
+        (2, 1, 2),
+        ([0.5, 2], [0.5, 1], [0.25, 2]),
+    ],
+)
+def test_regular_grid_interpolation(x, y, z_expected):
+    """Tests the multilinear interpolation of data on a rectilinear grid,
+    which is exact for the bilinear surface z = x * y."""
+    xs, ys = np.meshgrid([0, 1, 1.5], [0, 0.5, 2])
+    source = np.column_stack([xs.ravel(), ys.ravel(), (xs * ys).ravel()])
+    func = Function(source, interpolation="regular_grid")
+    assert func.is_regular_grid()
+    assert func.get_interpolation_method() == "regular_grid"
+    assert func.get_extrapolation_method() == "natural"
+    assert np.isclose(func(x, y), z_expected).all()
+    assert np.isclose(func.get_value_opt(x, y), z_expected).all()
+
+
+@pytest.mark.parametrize(
+    "extrapolation,z_expected", [("natural", 6), ("constant", 3), ("zero", 0)]
+)
+def test_regular_grid_extrapolation(extrapolation, z_expected):
+    """Tests the extrapolation methods of the regular_grid interpolation."""
+    xs, ys = np.meshgrid([0, 1, 1.5], [0, 0.5, 2])
+    source = np.column_stack([xs.ravel(), ys.ravel(), (xs * ys).ravel()])
+    func = Function(source, interpolation="regular_grid", extrapolation=extrapolation)
+    assert np.isclose(func.get_value_opt(3, 2), z_expected)
+    assert np.isclose(func.get_value([3, 3], [2, 2]), z_expected).all()
+
+
+def test_regular_grid_scattered_data():
+    """Tests that scattered data falls back to the shepard interpolation."""
+    source = [(1, 0, 0), (0, 1, 0), (0, 0, 1)]
+    assert not Function(source).is_regular_grid()
+    with pytest.warns(UserWarning):
+        func = Function(source, interpolation="regular_grid")
+    assert func.get_interpolation_method() == "shepard"
+
+
+def test_set_shepard_neighbors():
+    """Tests the shepard interpolation of the nearest data points only."""
+    rng = np.random.default_rng(0)
+    source = rng.uniform(size=(200, 3))
+    source[:, 2] = source[:, 0] + source[:, 1]
+    func = Function(source)
+    nearest_func = Function(source).set_shepard_neighbors(len(source))
+    x, y = rng.uniform(size=(2, 20))
+    assert np.allclose(nearest_func(x, y), func(x, y))
+
+    nearest_func.set_shepard_neighbors(8)
+    assert np.isclose(nearest_func(*source[0, :2]), source[0, 2])
+    assert np.allclose(nearest_func(x, y), func(x, y), atol=0.1)
+    with pytest.raises(ValueError):
+        func.set_shepard_neighbors(0)
+
+
 @pytest.mark.parametrize("other", [1, 0.1, np.int_(1), np.float64(0.1), np.array([1])])
 def test_sum_arithmetic_priority(other):
     """Test the arithmetic priority of the add operation of the Function class,
@@ -665,6 +1109,157 @@ def test_pow_arithmetic_priority(other):
     assert isinstance(other**func_array, Function)
 
 
+def test_arithmetic_expression():
+    """Test that arithmetic between callable based Functions builds a single
+    flattened expression, with the same values as operating on the values
+    of the operands, and that it is evaluated at arrays in one pass."""
+    f = Function(lambda x: x**2)
+    g = Function(lambda x: np.sin(x))
+    h = Function([(0, 0), (1, 1), (2, 4), (3, 9)], interpolation="linear")
+
+    result = (f + g + 2 - h) * 3 / f
+    expression = result.source
+    assert callable(expression)
+    assert result.__dom_dim__ == 1
+    # the sum is a single node, the product holds it as an operand
+    assert expression.operation == "truediv"
+    assert len(expression.operands[0][1].operands[0][1].operands) == 4
+
+    x = np.linspace(0.1, 3, 20)
+    expected = [((f(xi) + g(xi) + 2 - h(xi)) * 3) / f(xi) for xi in x]
+    assert [result(xi) for xi in x] == expected
+    assert np.allclose(result(x), expected, rtol=1e-14, atol=0)
+    assert result([0.5, 1.5]) == pytest.approx([result(0.5), result(1.5)], rel=1e-14)
+    assert result(x.reshape(4, 5)).shape == (4, 5)
+
+    # callables, powers, negation and modulo
+    other = (-f) ** 2 + 2**g + f % 3 + (lambda x: x)
+    for xi in x:
+        assert other(xi) == f(xi) ** 2 + 2 ** g(xi) + f(xi) % 3 + xi
+    assert np.allclose(other(x), [other(xi) for xi in x], rtol=1e-14)
+
+
+def test_arithmetic_expression_nd():
+    """Test the arithmetic between N-D callable based Functions."""
+    f = Function(lambda x, y: x + y)
+    result = 2 * f - f / 4
+    assert result.__dom_dim__ == 2
+    assert result(1, 2) == 2 * 3 - 3 / 4
+    assert result([1, 2], [3, 4]) == [8 - 1, 12 - 1.5]
+
+
+def test_arithmetic_expression_copy():
+    """Test that the expressions can be copied, as done when pickling."""
+    f = Function(lambda x: x**2)
+    result = deepcopy((f + 1) * f)
+    assert result(3) == 90
+    assert np.array_equal(result(np.array([1.0, 2.0])), [2, 20])
+
+
+def test_set_discrete_based_on_operands():
+    """Test the discretization of arithmetic between list based Functions
+    onto the union of their data points."""
+    f = Function([(0, 0), (1, 1), (2, 4), (3, 9)], interpolation="linear")
+    g = Function([(0, 1), (1.5, 2), (3, 0)], interpolation="linear")
+    result = f * g + 1
+
+    discrete = result.set_discrete_based_on_operands(mutate_self=False)
+    assert callable(result.source)
+    assert np.array_equal(discrete.x_array, [0, 1, 1.5, 2, 3])
+    assert np.allclose(discrete.y_array, [result(x) for x in discrete.x_array])
+    assert discrete.get_interpolation_method() == "linear"
+
+    result.set_discrete_based_on_operands()
+    assert isinstance(result.source, np.ndarray)
+
+    with pytest.raises(ValueError):
+        (f + Function(lambda x: x)).set_discrete_based_on_operands()
+    with pytest.raises(ValueError):
+        f.set_discrete_based_on_operands()
+
+
+def test_set_grid_merging():
+    """Test that arithmetic between Functions defined on different points
+    gives list based Functions defined on the union of the points."""
+    f = Function([(0, 0), (1, 1), (2, 4), (3, 9)], interpolation="linear")
+    g = Function([(0.5, 1), (2.5, 2)], interpolation="spline")
+    assert callable((f * g).source)
+
+    f.set_grid_merging()
+    for result in [f + g, f - g, f * g, f / g, f**g, g * f, g - f]:
+        assert isinstance(result.source, np.ndarray)
+        assert np.array_equal(result.x_array, [0, 0.5, 1, 2, 2.5, 3])
+    difference = f - g
+    assert np.allclose(
+        difference.y_array, f(difference.x_array) - g(difference.x_array)
+    )
+    assert (f * g).get_interpolation_method() == "linear"
+    assert (g * f).get_interpolation_method() == "spline"
+
+    # Callable operands are evaluated at the points of the other operand
+    h = f * Function(lambda x: 2 * x)
+    assert np.array_equal(h.y_array, 2 * f.x_array**3)
+
+    # The setting is kept along chains of operations
+    chain = (2 * f + 1) * g
+    assert isinstance(chain.source, np.ndarray)
+    assert np.allclose(chain.y_array, [(2 * f(x) + 1) * g(x) for x in chain.x_array])
+
+
+def test_set_grid_merging_max_points_and_tolerance():
+    """Test the limits on the number of points of the merged grid."""
+    f = Function(np.column_stack((np.linspace(0, 1, 11), np.ones(11))))
+    g = Function(np.column_stack((np.linspace(0.001, 1.001, 11), np.ones(11))))
+
+    assert len((f.set_grid_merging() + g).x_array) == 22
+    merged = f.set_grid_merging(tolerance=0.01) + g
+    # the last point is kept instead of the previous one
+    assert np.allclose(merged.x_array, [*np.linspace(0, 0.9, 10), 1.001])
+    capped = f.set_grid_merging(max_points=5) + g
+    assert len(capped.x_array) == 5
+    assert capped.x_array[0] == 0 and capped.x_array[-1] == 1.001
+    assert callable((f.set_grid_merging(False) + g).source)
+
+    with pytest.raises(ValueError):
+        f.set_grid_merging(max_points=1)
+    with pytest.raises(ValueError):
+        f.set_grid_merging(tolerance=-1)
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "polynomial", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["constant", "natural", "zero"])
+def test_from_arrays(interpolation, extrapolation):
+    """Test that Function.from_arrays matches the Function constructor."""
+    x = np.linspace(0, 3, 7)
+    y = np.sin(x)
+    func = Function(np.column_stack((x, y)), "x", "y", interpolation, extrapolation)
+    fast = Function.from_arrays(x, y, "x", "y", interpolation, extrapolation)
+
+    assert "_coeffs" not in vars(fast)
+    points = np.linspace(-1, 4, 23)
+    assert np.allclose(fast.get_value(points), func.get_value(points))
+    assert fast.get_value_opt(1.1) == func.get_value_opt(1.1)
+    assert "_coeffs" in vars(fast)
+    assert fast.integral(0, 2) == pytest.approx(func.integral(0, 2))
+    assert fast.title == func.title
+    assert np.array_equal(fast.source, func.source)
+
+
+def test_from_arrays_unsorted():
+    """Test Function.from_arrays with unsorted data and eager coefficients."""
+    x = np.array([3.0, 0.0, 2.0, 1.0])
+    y = x**2
+    func = Function.from_arrays(x, y, assume_sorted=False, lazy_coeffs=False)
+
+    assert "_coeffs" in vars(func)
+    assert np.array_equal(func.x_array, [0, 1, 2, 3])
+    assert np.array_equal(func.y_array, [0, 1, 4, 9])
+    assert np.array_equal(
+        deepcopy(Function.from_arrays(x, y, assume_sorted=False)).get_value(x),
+        func.get_value(x),
+    )
+
+
 @pytest.mark.parametrize("alpha", [0.1, 0.5, 0.9])
 def test_low_pass_filter(alpha):
     """Test the low_pass_filter method of the Function class.
@@ -703,3 +1298,50 @@ def test_low_pass_filter(alpha):
             f"The filtered value at index {i} is not the expected value. "
             f"Expected: {expected}, Actual: {filtered_func.source[i][1]}"
         )
+    assert np.array_equal(filtered_func.x_array, func.x_array)
+
+
+def test_low_pass_filter_chunks():
+    """Test that filtering a dataset in chunks, passing the last filtered value
+    of each chunk to the next, gives the same result as filtering it whole."""
+    x = np.linspace(0, 10, 1001)
+    y = np.sin(x) + np.cos(7 * x)
+    expected = Function(np.column_stack((x, y))).low_pass_filter(0.2).y_array
+
+    filtered, last = [], None
+    for chunk in np.array_split(np.arange(len(x)), 4):
+        chunk_func = Function.from_arrays(x[chunk], y[chunk])
+        chunk_filtered = chunk_func.low_pass_filter(0.2, initial_value=last)
+        filtered.append(chunk_filtered.y_array)
+        last = chunk_filtered.y_final
+
+    assert np.allclose(np.concatenate(filtered), expected, rtol=0, atol=1e-12)
+
+
+def test_low_pass_filter_zero_phase():
+    """Test that the zero phase filter keeps the phase of a slow signal, which
+    the exponential smoothing delays, and filters 2-D outputs."""
+    x = np.linspace(0, 2 * np.pi, 2001)
+    func = Function(np.column_stack((x, np.sin(x))))
+
+    delayed = func.low_pass_filter(0.05)
+    filtered = func.low_pass_filter(0.05, zero_phase=True)
+    peak = np.argmax(func.y_array)
+    assert np.argmax(delayed.y_array) > peak + 10
+    assert abs(np.argmax(filtered.y_array) - peak) <= 1
+
+    func_2d = Function([(0, 0, 1), (1, 0, 2), (0, 1, 3), (1, 1, 4)])
+    filtered_2d = func_2d.low_pass_filter(0.5, zero_phase=True)
+    assert np.array_equal(filtered_2d.source[:, :2], func_2d.source[:, :2])
+    assert np.allclose(filtered_2d.source[:, 2], [1.546875, 2.09375, 2.6875, 3.125])
+
+
+def test_low_pass_filter_invalid():
+    """Test that the low pass filter rejects invalid arguments and sources."""
+    func = Function([(0, 0), (1, 1), (2, 4)])
+    with pytest.raises(ValueError):
+        func.low_pass_filter(1.5)
+    with pytest.raises(ValueError):
+        func.low_pass_filter(0.5, zero_phase=True, initial_value=0)
+    with pytest.raises(TypeError):
+        Function(lambda x: x).low_pass_filter(0.5)
@@ -226,6 +226,27 @@ def test_mass_curve_asserts_extreme_values(cesaroni_m1670):
     )
 
 
+def test_bundle_asserts_mass_properties(cesaroni_m1670):
+    bundle = cesaroni_m1670.bundle()
+    for t in [0, 1.234, 3.9, 5]:
+        assert np.allclose(
+            bundle.get_values(t),
+            [
+                cesaroni_m1670.total_mass(t),
+                cesaroni_m1670.propellant_mass(t),
+                cesaroni_m1670.center_of_mass(t),
+                cesaroni_m1670.I_11(t),
+                cesaroni_m1670.I_22(t),
+                cesaroni_m1670.I_33(t),
+            ],
+        )
+    thrust_bundle = cesaroni_m1670.bundle("thrust", "mass_flow_rate")
+    assert np.allclose(
+        thrust_bundle.get_values(1.234),
+        [cesaroni_m1670.thrust(1.234), cesaroni_m1670.mass_flow_rate(1.234)],
+    )
+
+
 def test_burn_area_asserts_extreme_values(cesaroni_m1670):
     initial_burn_area = (
         2
@@ -1,6 +1,7 @@
 import numpy as np
 
 from rocketpy.tools import (
+    GrowableArray,
     calculate_cubic_hermite_coefficients,
     find_roots_cubic_function,
 )
@@ -44,3 +45,46 @@ def test_cardanos_root_finding():
     assert np.isclose(roots[0].imag, 0)
     assert np.isclose(roots[1].imag, 0)
     assert np.isclose(roots[2].imag, 0)
+
+
+def test_growable_array():
+    """Tests that the GrowableArray grows past its capacity and behaves as a
+    list of rows."""
+    buffer = GrowableArray(columns=2, capacity=1)
+    rows = [[i, 2 * i] for i in range(10)]
+    for row in rows[:5]:
+        buffer.append(row)
+    buffer += rows[5:]
+
+    assert len(buffer) == 10
+    assert np.array_equal(buffer.array, rows)
+    assert np.array_equal(np.array(buffer), rows)
+    assert buffer.tolist() == rows
+
+    # rows are views, so in place changes are kept
+    buffer[-1][1] -= 18
+    assert buffer[-1].tolist() == [9, 0]
+    buffer[-1] = [9, 18]
+
+    buffer.insert(-1, [-1, -1])
+    assert buffer[-2].tolist() == [-1, -1]
+    assert buffer[-1].tolist() == [9, 18]
+    assert len(buffer) == 11
+
+    buffer.truncate(3)
+    buffer.shrink_to_fit()
+    assert buffer.tolist() == rows[:3]
+
+
+def test_growable_array_shared():
+    """Tests that a shared GrowableArray copies the shared array before its
+    first change, leaving the original array untouched."""
+    original = np.arange(6, dtype=np.float64).reshape(3, 2)
+    buffer = GrowableArray.shared(original)
+    assert np.shares_memory(buffer.array, original)
+
+    buffer[-1] = [-1, -1]
+    buffer.append([6, 7])
+    assert buffer.tolist() == [[0, 1], [2, 3], [-1, -1], [6, 7]]
+    assert original.tolist() == [[0, 1], [2, 3], [4, 5]]
+    assert not np.shares_memory(buffer.array, original)